@@ -1,11 +1,14 @@
 import os
 import json
+import pickle
 import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import time
-import mutagen
 import io
 import numpy as np
 import wave
@@ -15,6 +18,13 @@ class CacheManager:
     
     DEBUG = False
     
+    # Number of ZIPs whose metadata is kept in memory
+    MEMORY_CACHE_SIZE = 8
+    
+    # Threads loading prefetched metadata. Loads hold the cache lock, so
+    # more threads would only wait for each other.
+    PREFETCH_WORKERS = 1
+    
     def __init__(self, cache_dir: str = None):
         """Initialize the cache manager.
         
@@ -35,6 +45,14 @@ class CacheManager:
         
         # Load cache index
         self.cache_index = self._load_cache_index()
+        
+        # Metadata of recently used ZIPs, keyed by ZIP path with the file
+        # stats it was validated against
+        self._memory_cache: "OrderedDict[str, Tuple[Dict[str, int], Dict]]" = OrderedDict()
+        # Guards the caches when metadata is prefetched from a worker thread
+        self._lock = threading.RLock()
+        # Threads are started by the first prefetch
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=self.PREFETCH_WORKERS)
     
     def _get_cache_file_path(self, zip_path: str) -> str:
         """Get the cache file path for a ZIP file.
@@ -45,9 +63,23 @@ class CacheManager:
         Returns:
             Path to the cache file
         """
-        # Get just the filename and add .cache extension
+        # Keep the filename readable, the hash of the full path tells apart
+        # ZIPs with the same name in different folders
         zip_filename = os.path.basename(zip_path)
-        return os.path.join(self.cache_dir, f"{zip_filename}.cache")
+        path_hash = hashlib.sha1(os.path.abspath(zip_path).encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{zip_filename}.{path_hash}.cache")
+    
+    def _get_partial_file_path(self, zip_path: str) -> str:
+        """Get the path of the file holding metadata of an unfinished load."""
+        return os.path.splitext(self._get_cache_file_path(zip_path))[0] + ".partial"
+    
+    def _cache_file_for(self, zip_path: str) -> str:
+        """Get the cache file currently used for a ZIP file.
+        
+        Caches written by older versions keep the location stored in the
+        index until the ZIP is cached again.
+        """
+        return self.cache_index.get(zip_path) or self._get_cache_file_path(zip_path)
     
     def _load_cache_index(self) -> Dict[str, str]:
         """Load the cache index file."""
@@ -71,24 +103,42 @@ class CacheManager:
     
     def _load_cache(self, zip_path: str) -> Dict:
         """Load cache for a specific ZIP file."""
-        cache_file = self._get_cache_file_path(zip_path)
+        cache_file = self._cache_file_for(zip_path)
         if not os.path.exists(cache_file):
             return {}
             
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except pickle.UnpicklingError:
+            # Cache written as JSON by an older version, convert it
+            return self._load_legacy_cache(zip_path)
+        except Exception as e:
+            logging.error(f"Error loading cache for {zip_path}: {e}")
+            return {}
+    
+    def _load_legacy_cache(self, zip_path: str) -> Dict:
+        """Load a JSON cache file and rewrite it in the current format."""
+        cache_file = self._cache_file_for(zip_path)
         try:
             with open(cache_file, 'r') as f:
-                return json.load(f)
+                cache_data = json.load(f)
         except Exception as e:
             logging.error(f"Error loading cache for {zip_path}: {e}")
             return {}
+        if self.DEBUG: print(f"[DEBUG] Converting JSON cache to pickle: {cache_file}")
+        self._save_cache(zip_path, cache_data)
+        return cache_data
     
     def _save_cache(self, zip_path: str, cache_data: Dict):
         """Save cache for a specific ZIP file."""
-        cache_file = self._get_cache_file_path(zip_path)
+        cache_file = self._cache_file_for(zip_path)
         try:
             if self.DEBUG: print(f"[DEBUG] Saving cache to: {cache_file}")
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            # Written aside and renamed, a failed write keeps the previous cache
+            with open(cache_file + ".tmp", 'wb') as f:
+                pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cache_file + ".tmp", cache_file)
             if self.DEBUG: print(f"[DEBUG] Cache saved successfully")
         except Exception as e:
             logging.error(f"Error saving cache for {zip_path}: {e}")
@@ -114,7 +164,9 @@ class CacheManager:
         """
         metadata = {}
         try:
-            # Use mutagen to get basic audio info
+            # Use mutagen to get basic audio info. Imported when first
+            # needed, it loads every format plugin.
+            import mutagen
             audio = mutagen.File(io.BytesIO(file_bytes))
             if audio is not None:
                 metadata.update({
@@ -135,30 +187,58 @@ class CacheManager:
         stats = os.stat(file_path)
         return {
             'size': stats.st_size,
-            'mtime': int(stats.st_mtime)
+            'mtime': int(stats.st_mtime),
+            'mtime_ns': stats.st_mtime_ns  # Catches changes within the same second
         }
     
+    @staticmethod
+    def _stats_match(current_stats: Dict[str, int], cached_stats: Dict[str, int]) -> bool:
+        """Check whether a ZIP is unchanged since its cache was written."""
+        if current_stats['size'] != cached_stats['size']:
+            return False
+        if 'mtime_ns' in cached_stats:
+            return current_stats['mtime_ns'] == cached_stats['mtime_ns']
+        # Written by a version that only stored whole seconds
+        return current_stats['mtime'] == cached_stats['mtime']
+    
     def get_cached_metadata(self, zip_path: str) -> Optional[Dict]:
-        """Get cached metadata for a ZIP file if it exists and is valid."""
-        if zip_path not in self.cache_index:
-            return None
+        """Get cached metadata for a ZIP file if it exists and is valid.
+        
+        Metadata of recently used ZIPs is served from memory as long as the
+        ZIP's size and modification time are unchanged.
+        """
+        with self._lock:
+            if zip_path not in self.cache_index:
+                return None
+            
+            # One stat both checks the file still exists and validates the
+            # cache, lookups from the same ZIP are frequent
+            try:
+                current_stats = self._calculate_file_stats(zip_path)
+            except OSError:
+                self.remove_from_cache(zip_path)
+                return None
             
+            remembered = self._memory_cache.get(zip_path)
+            if remembered is not None and remembered[0] == current_stats:
+                self._memory_cache.move_to_end(zip_path)
+                return remembered[1]
+            
+            metadata = self._load_valid_metadata(zip_path, current_stats)
+            if metadata is not None:
+                self._remember(zip_path, current_stats, metadata)
+            return metadata
+    
+    def _load_valid_metadata(self, zip_path: str, current_stats: Dict[str, int]) -> Optional[Dict]:
+        """Load metadata from the cache file if it matches the ZIP's stats."""
         cache_data = self._load_cache(zip_path)
         if not cache_data:
             return None
             
-        # Check if file still exists
-        if not os.path.exists(zip_path):
-            self.remove_from_cache(zip_path)
-            return None
-            
         # Handle both old (checksum) and new (file_stats) cache formats
-        current_stats = self._calculate_file_stats(zip_path)
-        
         # Check if we have the new format
         if 'file_stats' in cache_data:
-            if (current_stats['size'] != cache_data['file_stats']['size'] or 
-                current_stats['mtime'] != cache_data['file_stats']['mtime']):
+            if not self._stats_match(current_stats, cache_data['file_stats']):
                 self.remove_from_cache(zip_path)
                 return None
         # Handle old format with checksum
@@ -177,6 +257,27 @@ class CacheManager:
             
         return cache_data['metadata']
     
+    def _remember(self, zip_path: str, file_stats: Dict[str, int], metadata: Dict):
+        """Keep metadata in memory, evicting the least recently used ZIP."""
+        self._memory_cache[zip_path] = (file_stats, metadata)
+        self._memory_cache.move_to_end(zip_path)
+        if len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+    
+    def prefetch_metadata(self, zip_path: str):
+        """Load cached metadata for a ZIP into memory on the prefetch pool.
+        
+        Used to overlap reading the next ZIP's cache with work on the
+        current one. Later get_cached_metadata() calls wait for a prefetch
+        in progress instead of reading the file again.
+        
+        Args:
+            zip_path: Path to the ZIP file
+        """
+        if zip_path not in self.cache_index:
+            return
+        self._prefetch_executor.submit(self.get_cached_metadata, zip_path)
+    
     def cache_metadata(self, zip_path: str, metadata: Dict, file_bytes: Optional[Dict[str, bytes]] = None):
         """Cache metadata for a ZIP file."""
         if self.DEBUG: print(f"[DEBUG] Caching metadata for: {zip_path}")
@@ -196,12 +297,76 @@ class CacheManager:
             'timestamp': time.time()
         }
         
-        # Save cache data
-        self._save_cache(zip_path, cache_data)
+        with self._lock:
+            # Save cache data, moving caches of older versions to the
+            # current file name
+            old_cache_file = self.cache_index.get(zip_path)
+            self.cache_index[zip_path] = self._get_cache_file_path(zip_path)
+            self._save_cache(zip_path, cache_data)
+            self._remember(zip_path, file_stats, metadata)
+            if (old_cache_file and old_cache_file != self.cache_index[zip_path]
+                    and old_cache_file not in self.cache_index.values()):
+                try:
+                    os.remove(old_cache_file)
+                except OSError:
+                    pass
+            
+            # Update cache index
+            self._save_cache_index()
+            self._remove_partial_metadata(zip_path)
+    
+    def save_partial_metadata(self, zip_path: str, file_metadata: Dict[str, Dict]):
+        """Save the file metadata read so far by a load that has not finished.
         
-        # Update cache index
-        self.cache_index[zip_path] = self._get_cache_file_path(zip_path)
-        self._save_cache_index()
+        Lets a load interrupted by a crash continue where it stopped. The
+        file is removed once the ZIP's metadata is cached.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            file_metadata: Metadata of the files read so far, by file path
+        """
+        partial_file = self._get_partial_file_path(zip_path)
+        try:
+            partial_data = {
+                'file_stats': self._calculate_file_stats(zip_path),
+                'file_metadata': file_metadata
+            }
+            # Written aside and renamed, a crash while writing keeps the
+            # previous save
+            with open(partial_file + ".tmp", 'wb') as f:
+                pickle.dump(partial_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_file + ".tmp", partial_file)
+        except Exception as e:
+            logging.error(f"Error saving partial metadata for {zip_path}: {e}")
+    
+    def get_partial_metadata(self, zip_path: str) -> Dict[str, Dict]:
+        """Get the file metadata saved by an unfinished load of a ZIP.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            
+        Returns:
+            Metadata by file path, empty if there is none or the ZIP changed since
+        """
+        partial_file = self._get_partial_file_path(zip_path)
+        if not os.path.exists(partial_file):
+            return {}
+        try:
+            with open(partial_file, 'rb') as f:
+                partial_data = pickle.load(f)
+            if self._stats_match(self._calculate_file_stats(zip_path), partial_data['file_stats']):
+                return partial_data['file_metadata']
+        except Exception as e:
+            logging.error(f"Error loading partial metadata for {zip_path}: {e}")
+        self._remove_partial_metadata(zip_path)
+        return {}
+    
+    def _remove_partial_metadata(self, zip_path: str):
+        """Remove the metadata saved by an unfinished load, if any."""
+        try:
+            os.remove(self._get_partial_file_path(zip_path))
+        except OSError:
+            pass
     
     def clear_cache(self):
         """Clear all cached data."""
@@ -212,13 +377,23 @@ class CacheManager:
                     os.remove(cache_file)
             except Exception as e:
                 logging.error(f"Error removing cache file {cache_file}: {e}")
+        for file_name in os.listdir(self.cache_dir):
+            # Also files left half written by a crash
+            if file_name.endswith((".partial", ".tmp")):
+                try:
+                    os.remove(os.path.join(self.cache_dir, file_name))
+                except OSError as e:
+                    logging.error(f"Error removing partial metadata {file_name}: {e}")
         
         # Clear index
+        self._memory_cache.clear()
         self.cache_index.clear()
         self._save_cache_index()
         
     def remove_from_cache(self, zip_path: str):
         """Remove a specific ZIP file from cache."""
+        self._memory_cache.pop(zip_path, None)
+        self._remove_partial_metadata(zip_path)
         if zip_path in self.cache_index:
             cache_file = self.cache_index[zip_path]
             try:
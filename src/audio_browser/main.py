@@ -11,9 +11,8 @@ from PySide6.QtWidgets import (
     QMenuBar, QMenu, QFileDialog, QMessageBox, QLineEdit, QLabel,
     QDialog
 )
-from PySide6.QtCore import Qt, QUrl, QObject, QEvent
+from PySide6.QtCore import Qt, QUrl, QObject, QEvent, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QAction, QDragEnterEvent, QDropEvent, QKeySequence, QShortcut, QPalette
-import mutagen
 import io
 
 from audio_browser.ui.audio_file_tree_widget import AudioFileTreeWidget
@@ -26,7 +25,45 @@ from audio_browser.zip.zip_manager import ZipManager
 from audio_browser.config.config_manager import ConfigManager
 from audio_browser import __version__
 
+class LoadZipWorkerSignals(QObject):
+    """Signals emitted by LoadZipWorker."""
+    
+    finished = Signal(str, object, object)  # Emits ZIP path, timing info (or None) and error (or None)
+
+class LoadZipWorker(QRunnable):
+    """Loads a ZIP with ZipManager.load_zip on a pool thread.
+    
+    Progress reported by the ZipManager while loading reaches the GUI
+    thread through MainWindow.zip_progress, which is queued across threads.
+    """
+    
+    def __init__(self, zip_manager: ZipManager, zip_path: str):
+        """Initialize the worker.
+        
+        Args:
+            zip_manager: ZipManager used to load the ZIP
+            zip_path: Path to the ZIP file
+        """
+        super().__init__()
+        self.zip_manager = zip_manager
+        self.zip_path = zip_path
+        self.signals = LoadZipWorkerSignals()
+    
+    def run(self):
+        """Load the ZIP and report the result back to the GUI thread."""
+        timing_info, error = None, None
+        try:
+            timing_info = self.zip_manager.load_zip(self.zip_path)
+        except Exception as e:
+            error = e
+        try:
+            self.signals.finished.emit(self.zip_path, timing_info, error)
+        except RuntimeError:
+            pass  # The window was already destroyed
+
 class MainWindow(QMainWindow):
+    zip_progress = Signal(str, int)  # Progress of the ZIP being loaded, emitted from any thread
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Audio Browser")
@@ -34,6 +71,12 @@ class MainWindow(QMainWindow):
         self._playback_state = "stopped"
         self._last_played_file = None
         self.welcome_dialog = None  # Initialize welcome_dialog attribute
+        self._pending_load_status = None  # Status message and start time of the load being added to the tree
+        self._zip_load_queue = []  # Batches of ZIPs waiting to be loaded
+        self._current_zip_load = None  # Batch of ZIPs being loaded
+        # Loads run on their own pool, so closing waits for a running load
+        # and not for other background work
+        self._load_pool = QThreadPool(self)
         
         # Set focus policy to receive keyboard events
         self.setFocusPolicy(Qt.StrongFocus)
@@ -65,8 +108,10 @@ class MainWindow(QMainWindow):
         # Set up status bar
         self.setStatusBar(self.status_bar)
         
-        # Set up progress callback for zip manager
-        self.zip_manager.set_progress_callback(self._handle_zip_progress)
+        # Set up progress callback for zip manager. ZIPs are loaded on a
+        # pool thread, the signal queues their progress to the GUI thread.
+        self.zip_progress.connect(self._handle_zip_progress)
+        self.zip_manager.set_progress_callback(self.zip_progress.emit)
         
         # Add spacebar shortcut
         self.space_shortcut = QShortcut(QKeySequence(Qt.Key_Space), self)
@@ -215,6 +260,7 @@ class MainWindow(QMainWindow):
         self.file_list.extract_requested.connect(self._handle_extract_requested)
         self.file_list.status_update.connect(self.status_bar.update_file_info)
         self.file_list.progress_update.connect(self.status_bar.update_progress)
+        self.file_list.files_loaded.connect(self._handle_files_loaded)
         
         # Control panel signals
         self.control_panel.play_clicked.connect(self._handle_play_button_click)
@@ -279,52 +325,138 @@ class MainWindow(QMainWindow):
         clear_action.triggered.connect(self._clear_recent_files)
         self.recent_menu.addAction(clear_action)
     
-    def _load_zip_file(self, zip_path, show_status=True, resort_after_load=False):
-        """Load a ZIP file and update the UI accordingly.
+    def _load_zip_file(self, zip_path, show_status=True, resort_after_load=False, on_finished=None):
+        """Load a ZIP file in the background and update the UI once it is loaded.
         
         Args:
             zip_path (str): Path to the ZIP file to load
             show_status (bool): Whether to show status updates in the UI
-            
-        Returns:
-            bool: True if the ZIP was loaded successfully, False otherwise
+            resort_after_load (bool): Whether to resort the tree after adding the files
+            on_finished (callable, optional): Called with the number of ZIPs loaded (0 or 1)
+        """
+        self._load_zip_files([zip_path], show_status, resort_after_load, on_finished=on_finished)
+    
+    def _load_zip_files(self, zip_paths, show_status=True, resort_after_load=False,
+                        close_open_zips=False, on_finished=None):
+        """Queue ZIP files to be loaded one after another on a pool thread.
+        
+        Loading reads the ZIP and its metadata off the GUI thread. Batches
+        queued while another one is loading start once it is done.
+        
+        Args:
+            zip_paths (list): Paths of the ZIP files to load
+            show_status (bool): Whether to show load times and errors of each ZIP
+            resort_after_load (bool): Whether to resort the tree after adding the files
+            close_open_zips (bool): Whether to close the open ZIPs before the batch starts
+            on_finished (callable, optional): Called with the number of ZIPs loaded
         """
+        self._zip_load_queue.append({
+            'zip_paths': list(zip_paths),
+            'show_status': show_status,
+            'resort_after_load': resort_after_load,
+            'close_open_zips': close_open_zips,
+            'on_finished': on_finished,
+            'index': 0,
+            'loaded_count': 0,
+        })
+        if self._current_zip_load is None:
+            self._start_next_zip_load()
+    
+    def _start_next_zip_load(self):
+        """Start loading the next queued ZIP on a pool thread."""
+        if self._current_zip_load is None:
+            if not self._zip_load_queue:
+                return
+            self._current_zip_load = self._zip_load_queue.pop(0)
+            if self._current_zip_load['close_open_zips']:
+                # No load is running. Duration reads may still be using a
+                # handle, so they are stopped before the handles are closed
+                self.file_list.stop_duration_reads()
+                self.zip_manager.cleanup()
+        
+        batch = self._current_zip_load
+        zip_paths = batch['zip_paths']
+        index = batch['index']
+        zip_path = zip_paths[index]
+        
+        if len(zip_paths) > 1:
+            status_text = f"Loading {os.path.basename(zip_path)} ({len(zip_paths) - index} more to go)..."
+        else:
+            status_text = f"Loading {os.path.basename(zip_path)}..."
+        self.status_bar.update_file_info(status_text)
+        self._update_window_title(status_text)
+        
+        # Read the next ZIP's cache while this one is loaded
+        if index + 1 < len(zip_paths):
+            self.zip_manager.cache_manager.prefetch_metadata(zip_paths[index + 1])
+        
+        # The signals object lives with the window, so a late result for a
+        # window that is gone is dropped by Qt
+        worker = LoadZipWorker(self.zip_manager, zip_path)
+        worker.signals.setParent(self)
+        worker.signals.finished.connect(self._handle_zip_loaded)
+        self._load_pool.start(worker)
+    
+    def _handle_zip_loaded(self, zip_path, timing_info, error):
+        """Add the files of a ZIP loaded on a pool thread and start the next load.
+        
+        Args:
+            zip_path (str): Path to the ZIP file
+            timing_info (dict): Timing information from load_zip, or None on error
+            error (Exception): Error raised while loading, or None
+        """
+        batch = self._current_zip_load
+        if batch is None:
+            return  # The window is closing
+        show_status = batch['show_status']
         try:
-            if show_status:
-                self.status_bar.update_file_info(f"Loading {os.path.basename(zip_path)}...")
-                self._update_window_title(f"Loading {os.path.basename(zip_path)}...")
-            
-            # Load the ZIP file
-            timing_info = self.zip_manager.load_zip(zip_path)
+            if error is not None:
+                raise error
             
             # Update status bar with timing information
             cache_status = " (cached)" if timing_info['used_cache'] else ""
             if show_status:
                 self.status_bar.update_file_info(f"Loaded: {os.path.basename(zip_path)}{cache_status} in {timing_info['total_time']:.2f}s")
             
-            set_audio_start = time.time()
-            # Add audio files to the list
+            # Add audio files to the list, the tree fills in over the next
+            # event loop iterations and reports back through files_loaded
+            if show_status:
+                self._pending_load_status = (
+                    f"Fully Loaded: {os.path.basename(zip_path)}{cache_status}",
+                    time.time() - timing_info['total_time']
+                )
             self.file_list.set_audio_files(
                 self.zip_manager.list_audio_files(zip_path),
                 self.zip_manager,
                 zip_path,
-                resort_after_load
+                batch['resort_after_load']
             )
             
-            set_audio_time = time.time() - set_audio_start
-            if show_status:
-                self.status_bar.update_file_info(f"Fully Loaded: {os.path.basename(zip_path)}{cache_status} in {(timing_info['total_time']+set_audio_time):.2f}s")
-            
             # Add to recent files
             self.config_manager.add_recent_file(zip_path)
-            
-            return True
+            batch['loaded_count'] += 1
             
         except Exception as e:
             if show_status:
                 QMessageBox.critical(self, "Error", str(e))
                 self.status_bar.show_error(str(e))
-            return False
+        
+        batch['index'] += 1
+        if batch['index'] >= len(batch['zip_paths']):
+            self._current_zip_load = None
+            if batch['on_finished'] is not None:
+                batch['on_finished'](batch['loaded_count'])
+            else:
+                self._update_window_title()
+        self._start_next_zip_load()
+
+    def _handle_files_loaded(self):
+        """Show the total load time once the file tree has been filled."""
+        if self._pending_load_status is None:
+            return
+        message, start_time = self._pending_load_status
+        self._pending_load_status = None
+        self.status_bar.update_file_info(f"{message} in {time.time() - start_time:.2f}s")
 
     def _handle_recent_file(self, file_path):
         """Handle opening a recent file.
@@ -409,8 +541,11 @@ class MainWindow(QMainWindow):
             file_path = _file_path
         
         if file_path:
-            self._load_zip_file(file_path, resort_after_load=True)
-            self._update_recent_files_menu()
+            def handle_loaded(loaded_count):
+                self._update_recent_files_menu()
+                self._update_window_title()
+            
+            self._load_zip_file(file_path, resort_after_load=True, on_finished=handle_loaded)
     
     def _handle_extract_selected(self):
         """Handle extracting selected files."""
@@ -454,7 +589,8 @@ class MainWindow(QMainWindow):
     
     def _handle_extract_all(self):
         """Handle extracting all files."""
-        if not self.file_list.file_items:
+        all_files = self.file_list.get_all_files()
+        if not all_files:
             QMessageBox.warning(self, "Warning", "No files to extract")
             return
         
@@ -468,7 +604,7 @@ class MainWindow(QMainWindow):
             try:
                 # Group files by ZIP
                 files_by_zip = {}
-                for file_path in self.file_list.file_items.keys():
+                for file_path in all_files:
                     zip_path = self.file_list.get_zip_path(file_path)
                     if not zip_path:
                         raise RuntimeError(f"Could not determine ZIP file for {file_path}")
@@ -519,6 +655,7 @@ class MainWindow(QMainWindow):
             
             file_data = self.zip_manager.read_file(zip_path, file_path)
             try:
+                import mutagen  # Imported when first needed, it loads every format plugin
                 audio = mutagen.File(io.BytesIO(file_data))
                 if audio is not None and audio.info.length:
                     duration_ms = int(audio.info.length)
@@ -661,6 +798,15 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event."""
+        # Drop queued loads and let a running one finish before its ZIP
+        # handles are closed
+        self._zip_load_queue.clear()
+        if self._current_zip_load is not None:
+            self._load_pool.waitForDone()
+            self._current_zip_load = None
+        # Durations still queued for scrolled past rows are not needed
+        self.file_list.stop_duration_reads()
+        
         # Clean up resources
         self.zip_manager.cleanup()
         event.accept()
@@ -674,14 +820,7 @@ class MainWindow(QMainWindow):
         logging.debug("Play button handler called")
         
         # Get currently selected file
-        selected_items = self.file_list.selectedItems()
-        selected_file = None
-        if selected_items:
-            # Find the file path for the selected item
-            for path, file_item in self.file_list.file_items.items():
-                if file_item == selected_items[0]:
-                    selected_file = path
-                    break
+        selected_file = self.file_list.get_selected_file()
         
         # If paused and a different file is selected, play the new file
         if self._playback_state == "paused" and selected_file and selected_file != self._last_played_file:
@@ -718,28 +857,6 @@ class MainWindow(QMainWindow):
         """Handle search text changes."""
         self.file_list.apply_search_filter(text)
 
-    def _toggle_folder(self, folder_path):
-        """Toggle folder expansion state."""
-        self.folder_states[folder_path] = not self.folder_states.get(folder_path, True)
-        
-        # Update toggle arrow
-        header_row = self.folder_rows[folder_path]
-        header_widget = self.cellWidget(header_row, 0)
-        toggle_label = header_widget.findChild(QLabel, "toggle_arrow")
-        toggle_label.setText("▼" if self.folder_states[folder_path] else "▶")
-        
-        # Show/hide rows based on both folder state and current search
-        current_search = getattr(self, '_current_search', '')
-        for row, data in self.file_data.items():
-            if data['folder'] == folder_path:
-                # Check if the file matches the current search
-                matches_search = not current_search or current_search in data['path'].lower()
-                # Show the row only if it matches search AND folder is expanded
-                self.setRowHidden(row, not (matches_search and self.folder_states[folder_path]))
-        
-        # Update all row colors after toggling
-        self._update_all_row_colors()
-
     def _handle_save_library(self):
         """Handle saving the current audio library."""
         if not self.zip_manager.get_open_zips():
@@ -807,9 +924,6 @@ class MainWindow(QMainWindow):
             if not isinstance(library_data, dict) or 'zip_files' not in library_data:
                 raise ValueError("Invalid library file format")
             
-            # Close any currently open ZIPs
-            self.zip_manager.cleanup()
-            
             # Get list of valid ZIP files
             valid_zip_files = [
                 str(zip_path) for zip_path in library_data['zip_files']
@@ -820,32 +934,21 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Warning", "No valid ZIP files found in library")
                 return
             
-            # Load each ZIP file
-            loaded_count = 0
-            total_files = len(valid_zip_files)
-            
-            for i, zip_path in enumerate(valid_zip_files):
-                # Update status with remaining files
-                remaining = total_files - i
-                status_text = f"Loading {os.path.basename(zip_path)} ({remaining} more to go)..."
-                self.status_bar.update_file_info(status_text)
-                self._update_window_title(status_text)
-                
-                if self._load_zip_file(zip_path, show_status=False):
-                    loaded_count += 1
-            
-            # Add to recent libraries
-            self.config_manager.add_recent_library(file_path)
-            self.file_list.sort_groups_and_files()
-            # Update UI
-            self._update_recent_files_menu()
-            self.status_bar.update_file_info(
-                f"Loaded {loaded_count} ZIP files from library: {os.path.basename(file_path)}"
-            )
-            self._update_window_title()  # Reset to default title
+            def handle_loaded(loaded_count):
+                # Add to recent libraries
+                self.config_manager.add_recent_library(file_path)
+                self.file_list.sort_groups_and_files()
+                # Update UI
+                self._update_recent_files_menu()
+                self.status_bar.update_file_info(
+                    f"Loaded {loaded_count} ZIP files from library: {os.path.basename(file_path)}"
+                )
+                self._update_window_title()  # Reset to default title
             
-            # Sort the rows after loading is complete
-            self.file_list.sortItems(0, Qt.AscendingOrder)
+            # Load each ZIP file in the background, closing any currently
+            # open ZIPs first
+            self._load_zip_files(valid_zip_files, show_status=False,
+                                 close_open_zips=True, on_finished=handle_loaded)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -883,35 +986,21 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Warning", "No ZIP files found in selected folder")
                 return
             
-            # Close any currently open ZIPs
-            self.zip_manager.cleanup()
-            
-            # Load each ZIP file
-            loaded_count = 0
-            total_files = len(zip_files)
-            
-            for i, zip_path in enumerate(zip_files):
-                # Update status with remaining files
-                remaining = total_files - i
-                status_text = f"Loading {os.path.basename(zip_path)} ({remaining} more to go)..."
-                self.status_bar.update_file_info(status_text)
-                self._update_window_title(status_text)
-                
-                if self._load_zip_file(zip_path, show_status=False):
-                    loaded_count += 1
-            
-            # Add to recent folders
-            self.config_manager.add_recent_folder(folder_path)
-            self.file_list.sort_groups_and_files()
-            # Update UI
-            self._update_recent_files_menu()
-            self.status_bar.update_file_info(
-                f"Loaded {loaded_count} ZIP files from {os.path.basename(folder_path)}"
-            )
-            self._update_window_title()  # Reset to default title
+            def handle_loaded(loaded_count):
+                # Add to recent folders
+                self.config_manager.add_recent_folder(folder_path)
+                self.file_list.sort_groups_and_files()
+                # Update UI
+                self._update_recent_files_menu()
+                self.status_bar.update_file_info(
+                    f"Loaded {loaded_count} ZIP files from {os.path.basename(folder_path)}"
+                )
+                self._update_window_title()  # Reset to default title
             
-            # Sort the rows after loading is complete
-            self.file_list.sortItems(0, Qt.AscendingOrder)
+            # Load each ZIP file in the background, closing any currently
+            # open ZIPs first
+            self._load_zip_files(zip_files, show_status=False,
+                                 close_open_zips=True, on_finished=handle_loaded)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -929,6 +1018,27 @@ class MainWindow(QMainWindow):
         else:
             self.setWindowTitle("Audio Browser")
 
+    def show_welcome_dialog(self):
+        """Show the welcome dialog with the current recent items.
+        
+        The dialog is created once and reused when shown again.
+        """
+        recent_files = self.config_manager.get_recent_files()
+        recent_libraries = self.config_manager.get_recent_libraries()
+        recent_folders = self.config_manager.get_recent_folders()
+        if self.welcome_dialog is None:
+            self.welcome_dialog = WelcomeDialog(recent_files, recent_libraries, recent_folders, self)
+            self.welcome_dialog.recent_file_selected.connect(self._handle_recent_file)
+            self.welcome_dialog.recent_library_selected.connect(self._handle_recent_library)
+            self.welcome_dialog.recent_folder_selected.connect(self._handle_recent_folder)
+            self.welcome_dialog.open_zip_clicked.connect(self._handle_open_zip_from_menu)
+            self.welcome_dialog.open_library_clicked.connect(self._handle_open_library_from_menu)
+            self.welcome_dialog.open_folder_clicked.connect(self._handle_open_folder_from_menu)
+        else:
+            self.welcome_dialog.set_recents(recent_files, recent_libraries, recent_folders)
+        
+        self.welcome_dialog.exec()
+
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Audio Browser - Browse and play audio files from ZIP archives')
@@ -956,18 +1066,7 @@ def main():
     window.show()
     
     # Show welcome dialog
-    recent_files = window.config_manager.get_recent_files()
-    recent_libraries = window.config_manager.get_recent_libraries()
-    recent_folders = window.config_manager.get_recent_folders()
-    window.welcome_dialog = WelcomeDialog(recent_files, recent_libraries, recent_folders, window)
-    window.welcome_dialog.recent_file_selected.connect(window._handle_recent_file)
-    window.welcome_dialog.recent_library_selected.connect(window._handle_recent_library)
-    window.welcome_dialog.recent_folder_selected.connect(window._handle_recent_folder)
-    window.welcome_dialog.open_zip_clicked.connect(window._handle_open_zip_from_menu)
-    window.welcome_dialog.open_library_clicked.connect(window._handle_open_library_from_menu)
-    window.welcome_dialog.open_folder_clicked.connect(window._handle_open_folder_from_menu)
-    
-    window.welcome_dialog.exec()
+    window.show_welcome_dialog()
     
     return app.exec()
 
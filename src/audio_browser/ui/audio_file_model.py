@@ -1,125 +1,585 @@
 import os
-from typing import List, Dict, Any
-from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex
-from PySide6.QtGui import QBrush, QColor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex, Signal
+from PySide6.QtGui import QIcon, QPalette
+from PySide6.QtWidgets import QApplication
+
+# Internal id used for top-level (folder) indexes. File indexes store
+# their parent folder row + 1 so parent() can be resolved without lookups.
+FOLDER_ID = 0
+
+# Role returning the folder path for folder rows and the file path for file rows
+PATH_ROLE = Qt.UserRole + 1
+
+def format_duration(duration_ms: int) -> str:
+    """Format a duration in milliseconds as mm:ss.mmm."""
+    minutes = int((duration_ms % 3600000) // 60000)
+    seconds = int((duration_ms % 60000) // 1000)
+    milliseconds = int(duration_ms % 1000)
+    return f"{minutes:02}:{seconds:02}.{milliseconds:03}"
+
+def format_size(size_bytes: int) -> str:
+    """Format a size in bytes as a human readable string."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes/1024:.1f} KB"
+    return f"{size_bytes/(1024*1024):.1f} MB"
 
 class AudioFileModel(QAbstractItemModel):
-    """Data model for organizing audio files in a hierarchical structure."""
-    
+    """Data model for organizing audio files in a hierarchical structure.
+
+    Folders are top-level rows and files are their children. File rows are
+    only exposed to the view once their folder is expanded (see fetchMore),
+    so large archives never materialize rows nobody looks at.
+    """
+
+    HEADERS = [" Name ", " Duration ", " Size "]
+
+    # Emitted with a file's data when its duration is shown but unknown, so
+    # durations are only read for files that come into view
+    duration_needed = Signal(object)
+
     def __init__(self):
         super().__init__()
         self.files: List[Dict[str, Any]] = []  # List of all files
+        self._files_by_path: Dict[str, Dict[str, Any]] = {}  # File path -> file data
         self.folder_states: Dict[str, bool] = {}  # Track if folders are expanded
         self.folder_files: Dict[str, List[Dict[str, Any]]] = {}  # Files grouped by folder
+        self._folder_names: Dict[str, str] = {}  # Folder -> display name without counts
+        self._paths_lower: Dict[str, List[str]] = {}  # Folder -> lowercased paths in row order, for searches
         self.checked_files: set = set()  # Set of checked file paths
-        
+        self._checked_counts: Dict[str, int] = {}  # Folder -> number of checked files
+        self._path_counts: Dict[str, int] = {}  # Path -> number of files with it, across ZIPs
+        self._folders: List[str] = []  # Folders currently exposed as top-level rows
+        self._fetched: Dict[str, int] = {}  # Folder -> number of file rows exposed
+        self._folder_rows: Dict[str, int] = {}  # Folder -> top-level row
+        self._file_rows: Dict[str, int] = {}  # File path -> row within its folder
+        self._match_counts: Optional[Dict[str, int]] = None  # Folder -> matching files while searching
+        self._match_flags: Optional[Dict[str, List[bool]]] = None  # Folder -> per-file matches of the last search
+        self._match_search = ""  # Search text the match flags belong to
+        self._quiet_depth = 0  # Nesting level of quiet_updates()
+        self._pending_changes: Dict[int, List[int]] = {}  # Folder row -> [first, last] changed file rows
+        self._icons = {
+            'folder': QIcon(":/icons/folder.png"),
+            '.wav': QIcon(":/icons/wav.png"),
+            '.mp3': QIcon(":/icons/mp3.png"),
+            '.ogg': QIcon(":/icons/ogg.png"),
+            'audio': QIcon(":/icons/audio.png"),
+        }
+
+    def _folder_display_name(self, folder: str) -> str:
+        """Get the display name of a folder without its count suffix."""
+        if not folder:
+            return "Root"
+        path_parts = [p for p in folder.split(os.sep) if p]
+        if len(path_parts) > 1:
+            path_parts = path_parts[1:]
+        return " / ".join(path_parts)
+
+    def _folder_text(self, folder: str) -> str:
+        """Get the folder label including the count suffix parsed by the delegate."""
+        base_name = self._folder_names[folder]
+        total_count = len(self.folder_files.get(folder, []))
+        if self._match_counts is not None:
+            return f"{base_name} *%*( {self._match_counts.get(folder, 0)} / {total_count} files match )"
+        selected_count = self._checked_counts.get(folder, 0)
+        return (f"{base_name} *%*({total_count} files" +
+                (f", {selected_count} selected" if selected_count > 0 else "") + ")")
+
+    def _folder_check_state(self, folder: str):
+        """Get the aggregated check state of a folder from its files."""
+        files = self.folder_files.get(folder, [])
+        checked_count = self._checked_counts.get(folder, 0)
+        if files and checked_count == len(files):
+            return Qt.Checked
+        if checked_count == 0:
+            return Qt.Unchecked
+        return Qt.PartiallyChecked
+
     def data(self, index, role=Qt.DisplayRole):
         """Return data for the given role and index."""
         if not index.isValid():
             return None
-            
-        if role == Qt.BackgroundRole:
-            # Get the item's row
-            row = index.row()
-            # Return alternating colors for even/odd rows
-            if row % 2 == 0:
-                return QBrush(QColor("#f0f0f0"))  # Light gray for even rows
-            return QBrush(QColor("#ffffff"))  # White for odd rows
-            
+
+        column = index.column()
+        if index.internalId() == FOLDER_ID:
+            folder = self._folders[index.row()]
+            if role == Qt.DisplayRole:
+                return self._folder_text(folder) if column == 0 else None
+            if role == Qt.CheckStateRole and column == 0:
+                return self._folder_check_state(folder)
+            if role == Qt.DecorationRole and column == 0:
+                return self._icons['folder']
+            if role == Qt.BackgroundRole:
+                return QApplication.palette().color(QPalette.AlternateBase).darker(120)
+            if role == Qt.UserRole:
+                return "folder"
+            if role == PATH_ROLE:
+                return folder
+            return None
+
+        file_data = self.file_at(index)
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return file_data['name']
+            metadata = file_data['metadata']
+            if column == 1:
+                duration_ms = metadata.get('duration_ms', 0) if metadata else 0
+                if duration_ms > 0:
+                    return format_duration(duration_ms)
+                if 'duration_ms' not in metadata and not file_data['duration_requested'] and file_data['zip_manager']:
+                    file_data['duration_requested'] = True  # Asked once, "?" if it cannot be read
+                    self.duration_needed.emit(file_data)
+                return "?"
+            if column == 2:
+                size_bytes = metadata.get('size', 0) if metadata else 0
+                return format_size(size_bytes) if size_bytes > 0 else "?"
+        elif role == Qt.CheckStateRole and column == 0:
+            return Qt.Checked if file_data['path'] in self.checked_files else Qt.Unchecked
+        elif role == Qt.DecorationRole and column == 0:
+            ext = os.path.splitext(file_data['name'])[1].lower()
+            return self._icons.get(ext, self._icons['audio'])
+        elif role == Qt.UserRole or role == PATH_ROLE:
+            return file_data['path']
         return None
-        
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Update the check state of a file or of every file in a folder."""
+        if not index.isValid() or role != Qt.CheckStateRole or index.column() != 0:
+            return False
+
+        checked = Qt.CheckState(value) == Qt.Checked
+        if index.internalId() == FOLDER_ID:
+            folder = self._folders[index.row()]
+            for file_data in self.folder_files.get(folder, []):
+                self.set_file_checked(file_data['path'], checked)
+            fetched = self._fetched.get(folder, 0)
+            if fetched:
+                self.dataChanged.emit(self.index(0, 0, index), self.index(fetched - 1, 0, index),
+                                      [Qt.CheckStateRole])
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.CheckStateRole])
+            return True
+
+        self.set_file_checked(self.file_at(index)['path'], checked)
+        if self._quiet_depth:
+            # Widen the pending range of this folder, notified on exit
+            folder_row = index.internalId() - 1
+            pending = self._pending_changes.get(folder_row)
+            if pending is None:
+                self._pending_changes[folder_row] = [index.row(), index.row()]
+            else:
+                pending[0] = min(pending[0], index.row())
+                pending[1] = max(pending[1], index.row())
+            return True
+
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        folder_index = index.parent()
+        self.dataChanged.emit(folder_index, folder_index, [Qt.DisplayRole, Qt.CheckStateRole])
+        return True
+
+    @contextmanager
+    def quiet_updates(self):
+        """Defer change notifications of file check states.
+
+        Inside the block, setData on file rows only records which rows
+        changed. When the outermost block exits, a single dataChanged is
+        emitted per affected folder for its changed file rows, followed by
+        one for the folder row itself, instead of two signals per file.
+        """
+        self._quiet_depth += 1
+        try:
+            yield
+        finally:
+            self._quiet_depth -= 1
+            if not self._quiet_depth:
+                self._flush_pending_changes()
+
+    def _flush_pending_changes(self):
+        """Emit the change notifications collected by quiet_updates()."""
+        pending, self._pending_changes = self._pending_changes, {}
+        for folder_row, (first, last) in pending.items():
+            folder_index = self.index(folder_row, 0)
+            self.dataChanged.emit(self.index(first, 0, folder_index), self.index(last, 0, folder_index),
+                                  [Qt.CheckStateRole])
+            self.dataChanged.emit(folder_index, folder_index, [Qt.DisplayRole, Qt.CheckStateRole])
+
+    def flags(self, index):
+        """Return the item flags for the given index."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+            if index.internalId() == FOLDER_ID:
+                flags |= Qt.ItemIsAutoTristate
+        if index.internalId() != FOLDER_ID:
+            flags |= Qt.ItemNeverHasChildren
+        return flags
+
     def add_file(self, file_path: str, file_bytes=None, zip_path=None, file_metadata=None, zip_manager=None):
-        """Add a file to the model."""
+        """Add a file to the model.
+
+        New rows only become visible after sort_files() or when their folder
+        is fetched, so this never has to notify attached views.
+        """
+        self._append_file(file_path, file_bytes, zip_path, file_metadata, zip_manager)
+
+    def add_files_bulk(self, records: List[tuple], zip_path=None, zip_manager=None):
+        """Add a batch of files from one ZIP to the model.
+
+        Folders that are not shown yet are appended as top-level rows with a
+        single insert notification for the whole batch, so views can show
+        them before the final sort_files(). Their files are fetched lazily
+        like any other folder.
+
+        Args:
+            records: List of (file_path, file_metadata) tuples
+            zip_path: Path to the ZIP containing the files
+            zip_manager: ZipManager used to read the files
+        """
+        new_folders = []
+        for file_path, file_metadata in records:
+            file_data = self._append_file(file_path, None, zip_path, file_metadata, zip_manager)
+            folder = file_data['folder']
+            folder_row = self._folder_rows.get(folder)
+            if folder_row is None:
+                self._folder_rows[folder] = folder_row = len(self._folders) + len(new_folders)
+                new_folders.append(folder)
+            self._file_rows.setdefault(file_path, len(self.folder_files[folder]) - 1)
+
+        if new_folders:
+            first = len(self._folders)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_folders) - 1)
+            self._folders.extend(new_folders)
+            self.endInsertRows()
+
+    def _append_file(self, file_path: str, file_bytes, zip_path, file_metadata, zip_manager) -> Dict[str, Any]:
+        """Append a file record to the file lists without notifying views."""
+        # ZIP entry names always use '/', split once and keep both parts
+        folder, _, name = file_path.rpartition('/')
         file_data = {
             'path': file_path,
-            'folder': os.path.dirname(file_path),
+            'folder': folder,
+            'name': name,
             'zip_path': zip_path,
             'metadata': file_metadata or {},
             'file_bytes': file_bytes,
-            'zip_manager': zip_manager
+            'zip_manager': zip_manager,
+            'duration_requested': False
         }
         self.files.append(file_data)
-        
+        # Paths can repeat across ZIPs in a library, the first one added wins
+        self._files_by_path.setdefault(file_path, file_data)
+        self._path_counts[file_path] = self._path_counts.get(file_path, 0) + 1
+
         # Add to folder grouping
-        folder = file_data['folder']
         if folder not in self.folder_files:
             self.folder_files[folder] = []
+            # Built once, the label is requested on every repaint
+            self._folder_names[folder] = self._folder_display_name(folder)
+            self._paths_lower[folder] = []
         self.folder_files[folder].append(file_data)
-        
+        self._paths_lower[folder].append(file_path.lower())
+        if file_path in self.checked_files:
+            self._checked_counts[folder] = self._checked_counts.get(folder, 0) + 1
+
         # Initialize folder state if new
         if folder not in self.folder_states:
             self.folder_states[folder] = False
-    
+        return file_data
+
     def sort_files(self):
-        """Sort files within each folder."""
+        """Sort files within each folder and rebuild the top-level rows."""
+        self.beginResetModel()
         # Sort files within each folder
         for folder in self.folder_files:
-            self.folder_files[folder].sort(key=lambda x: os.path.basename(x['path']).lower())
-        
+            self.folder_files[folder].sort(key=lambda x: x['name'].lower())
+
         # Sort the folder list itself
         self.folder_files = dict(sorted(self.folder_files.items(), key=lambda x: x[0].lower()))
-    
+        self._folders = list(self.folder_files.keys())
+        self._paths_lower = {folder: [file_data['path'].lower() for file_data in files]
+                             for folder, files in self.folder_files.items()}
+        self._fetched.clear()
+        self._match_flags = None  # Rows moved, flags are recomputed by the next search
+
+        # Index rows by path so indexes can be resolved without scanning.
+        # A path repeated across ZIPs resolves to the row of the record
+        # _files_by_path holds, the first one added.
+        self._folder_rows = {folder: row for row, folder in enumerate(self._folders)}
+        files_by_path = self._files_by_path
+        self._file_rows = {file_data['path']: row
+                           for files in self.folder_files.values()
+                           for row, file_data in enumerate(files)
+                           if files_by_path[file_data['path']] is file_data}
+        self.endResetModel()
+
+    def set_file_duration(self, file_data: Dict[str, Any], duration_ms: Optional[int]):
+        """Store a duration read after the file was added and update its row.
+
+        Args:
+            file_data: File data passed by duration_needed
+            duration_ms: Duration in milliseconds, or None if it couldn't be read
+        """
+        if duration_ms is None:
+            return
+        # The metadata dict may be shared with the ZipManager's cache, which
+        # only changes it under its lock, so it is replaced, not changed here
+        file_data['metadata'] = dict(file_data['metadata'], duration_ms=duration_ms)
+        # The model may have been cleared or the path taken by another
+        # ZIP's file since the duration was requested
+        if self._files_by_path.get(file_data['path']) is file_data:
+            index = self.index_for_path(file_data['path'], 1)
+            if index.isValid():
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def get_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Get the file data for a file path, or None if not loaded."""
+        return self._files_by_path.get(file_path)
+
+    def count_matches(self, search_lower: str) -> Dict[str, int]:
+        """Match a search against every file with one pass over all paths.
+
+        A search of several whitespace separated words matches the paths
+        that contain all of them, in any order. Each word is tested with a
+        plain substring check over the whole list of paths, and later words
+        only for the paths that matched the earlier ones.
+
+        The per-file results are kept until the next search, see
+        match_flags(), so callers never have to test a path twice. When the
+        search extends the previous one, only files that matched before are
+        tested again, since nothing else can match the longer text.
+
+        Args:
+            search_lower: Lowercased text to look for in file paths
+
+        Returns:
+            Dictionary of folder -> number of files whose path contains the text
+        """
+        tokens = search_lower.split() or [search_lower]
+        previous_flags = self._match_flags if search_lower.startswith(self._match_search) else None
+        match_flags = {}
+        # Scans the plain string lists, not the file records
+        for folder, paths_lower in self._paths_lower.items():
+            flags = previous_flags.get(folder) if previous_flags is not None else None
+            if flags is not None and len(flags) == len(paths_lower):
+                remaining = tokens
+            else:
+                flags = [tokens[0] in path_lower for path_lower in paths_lower]
+                remaining = tokens[1:]
+            for token in remaining:
+                flags = [flag and token in path_lower for flag, path_lower in zip(flags, paths_lower)]
+            match_flags[folder] = flags
+        self._match_flags = match_flags
+        self._match_search = search_lower
+        return {folder: sum(flags) for folder, flags in match_flags.items()}
+
+    def match_flags(self, folder: str) -> Optional[List[bool]]:
+        """Get whether each file of a folder matched the last count_matches().
+
+        Returns:
+            List of flags in folder row order, or None when not searching
+        """
+        if self._match_flags is None:
+            return None
+        return self._match_flags.get(folder)
+
+    def folder_paths_lower(self, folder: str) -> List[str]:
+        """Get the lowercased paths of a folder's files in row order."""
+        return self._paths_lower.get(folder, [])
+
     def get_folder_files(self, folder: str) -> List[Dict[str, Any]]:
         """Get files in a specific folder."""
         return self.folder_files.get(folder, [])
-    
+
     def get_folders(self) -> List[str]:
         """Get list of all folders."""
         return sorted(self.folder_files.keys(), key=str.lower)
-    
+
     def toggle_folder(self, folder: str) -> bool:
         """Toggle folder expansion state."""
         if folder in self.folder_states:
             self.folder_states[folder] = not self.folder_states[folder]
             return self.folder_states[folder]
         return False
-    
+
     def is_folder_expanded(self, folder: str) -> bool:
         """Check if a folder is expanded."""
         return self.folder_states.get(folder, False)
-    
+
     def get_checked_files(self) -> List[str]:
         """Get list of checked file paths."""
         return list(self.checked_files)
-    
+
     def set_file_checked(self, file_path: str, checked: bool):
-        """Set a file's checked state."""
+        """Set a file's checked state.
+
+        The checked count of the file's folder is kept up to date here, so
+        folder labels and check states never have to scan their files.
+        """
+        if checked == (file_path in self.checked_files):
+            return
         if checked:
             self.checked_files.add(file_path)
+            delta = self._path_counts.get(file_path, 0)
         else:
             self.checked_files.discard(file_path)
-    
+            delta = -self._path_counts.get(file_path, 0)
+        if delta:
+            folder = self._files_by_path[file_path]['folder']
+            self._checked_counts[folder] = self._checked_counts.get(folder, 0) + delta
+
+    def set_match_counts(self, match_counts: Optional[Dict[str, int]]):
+        """Set per-folder search match counts, or None when not searching.
+
+        Only folder rows whose label changes are reported to the views.
+        """
+        previous_counts, self._match_counts = self._match_counts, match_counts
+        if match_counts is None:
+            self._match_flags = None
+        if not self._folders:
+            return
+
+        if previous_counts is None or match_counts is None:
+            changed_rows = range(len(self._folders))
+        else:
+            changed_rows = [row for row, folder in enumerate(self._folders)
+                            if previous_counts.get(folder, 0) != match_counts.get(folder, 0)]
+        if changed_rows:
+            self.dataChanged.emit(self.index(changed_rows[0], 0), self.index(changed_rows[-1], 0),
+                                  [Qt.DisplayRole])
+
     def clear(self):
         """Clear all data."""
+        self.beginResetModel()
         self.files.clear()
+        self._files_by_path.clear()
         self.folder_states.clear()
         self.folder_files.clear()
+        self._folder_names.clear()
+        self._paths_lower.clear()
         self.checked_files.clear()
-    
+        self._checked_counts.clear()
+        self._path_counts.clear()
+        self._folders.clear()
+        self._fetched.clear()
+        self._folder_rows.clear()
+        self._file_rows.clear()
+        self._match_counts = None
+        self._match_flags = None
+        self.endResetModel()
+
+    def folder_at(self, index) -> Optional[str]:
+        """Get the folder path for a folder index."""
+        if not index.isValid() or index.internalId() != FOLDER_ID:
+            return None
+        return self._folders[index.row()]
+
+    def file_at(self, index) -> Optional[Dict[str, Any]]:
+        """Get the file data for a file index."""
+        if not index.isValid() or index.internalId() == FOLDER_ID:
+            return None
+        folder = self._folders[index.internalId() - 1]
+        return self.folder_files[folder][index.row()]
+
+    def folder_index(self, folder: str) -> QModelIndex:
+        """Get the index of a folder row, or an invalid index if not shown."""
+        row = self._folder_rows.get(folder)
+        if row is None:
+            return QModelIndex()
+        return self.index(row, 0)
+
+    def index_for_path(self, file_path: str, column: int = 0) -> QModelIndex:
+        """Get the index of a file row, or an invalid index if not fetched yet."""
+        row = self._file_rows.get(file_path)
+        if row is None:
+            return QModelIndex()
+        return self.index(row, column, self.folder_index(self._files_by_path[file_path]['folder']))
+
+    def fetched_count(self, folder: str) -> int:
+        """Get the number of file rows currently exposed for a folder."""
+        return self._fetched.get(folder, 0)
+
+    def fetch_all(self):
+        """Expose the file rows of every folder.
+
+        Only folders with rows left to expose get a row insertion, one per
+        folder. Unlike a model reset, views keep their selection, current
+        index and expanded folders. Folders that were never fetched are
+        collapsed, so their insertions cost views no relayout.
+
+        Returns:
+            True if any rows were inserted, False if everything was fetched already
+        """
+        inserted = False
+        for row, folder in enumerate(self._folders):
+            fetched = self._fetched.get(folder, 0)
+            total = len(self.folder_files[folder])
+            if fetched >= total:
+                continue
+            self.beginInsertRows(self.index(row, 0), fetched, total - 1)
+            self._fetched[folder] = total
+            self.endInsertRows()
+            inserted = True
+        return inserted
+
+    def hasChildren(self, parent=QModelIndex()):
+        """Folders always report children so they can be expanded lazily."""
+        if not parent.isValid():
+            return bool(self._folders)
+        return parent.internalId() == FOLDER_ID and bool(self.folder_files.get(self._folders[parent.row()]))
+
+    def canFetchMore(self, parent):
+        """Return True for folders whose files have not been exposed yet."""
+        folder = self.folder_at(parent)
+        if folder is None:
+            return False
+        return self._fetched.get(folder, 0) < len(self.folder_files.get(folder, []))
+
+    def fetchMore(self, parent):
+        """Expose the remaining file rows of a folder."""
+        folder = self.folder_at(parent)
+        if folder is None:
+            return
+        fetched = self._fetched.get(folder, 0)
+        total = len(self.folder_files.get(folder, []))
+        if fetched >= total:
+            return
+        self.beginInsertRows(parent, fetched, total - 1)
+        self._fetched[folder] = total
+        self.endInsertRows()
+
     def rowCount(self, parent=QModelIndex()):
         """Return the number of rows under the given parent."""
         if not parent.isValid():
-            return len(self.folder_files)
-        return 0  # For now, we don't support nested items
-        
+            return len(self._folders)
+        if parent.internalId() == FOLDER_ID:
+            return self._fetched.get(self._folders[parent.row()], 0)
+        return 0
+
     def columnCount(self, parent=QModelIndex()):
         """Return the number of columns for the given parent."""
         return 3  # Name, Duration, Size
-        
+
     def index(self, row, column, parent=QModelIndex()):
         """Return the index of the item in the model."""
         if not self.hasIndex(row, column, parent):
             return QModelIndex()
-        return self.createIndex(row, column)
-        
+        if not parent.isValid():
+            return self.createIndex(row, column, FOLDER_ID)
+        return self.createIndex(row, column, parent.row() + 1)
+
     def parent(self, index):
         """Return the parent of the model index."""
-        return QModelIndex()  # We don't have a parent-child relationship yet
-        
+        if not index.isValid() or index.internalId() == FOLDER_ID:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, FOLDER_ID)
+
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """Return the header data for the given section."""
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            headers = ["Name", "Duration", "Size"]
-            if 0 <= section < len(headers):
-                return headers[section]
-        return None 
\ No newline at end of file
+            if 0 <= section < len(self.HEADERS):
+                return self.HEADERS[section]
+        return None
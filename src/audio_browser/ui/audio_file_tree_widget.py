@@ -1,138 +1,281 @@
 from PySide6.QtWidgets import (
-    QTreeWidget, QTreeWidgetItem, QMenu, QWidget, QHBoxLayout,
+    QTreeView, QMenu, QWidget, QHBoxLayout,
     QPushButton, QLabel, QApplication, QCheckBox, QStyledItemDelegate,
-    QStyle, QAbstractItemView, QHeaderView, QDialog, QVBoxLayout, QFrame
+    QStyle, QStyleOptionViewItem, QStyleOptionFocusRect, QAbstractItemView, QHeaderView, QDialog, QVBoxLayout, QFrame
 )
-from PySide6.QtCore import Qt, Signal, QSize, QTimer, QRect
-from PySide6.QtGui import QIcon, QColor, QPalette, QPainter, QFont
+from PySide6.QtCore import (
+    Qt, Signal, QSize, QTimer, QRect, QEvent, QModelIndex, QItemSelection, QItemSelectionModel,
+    QObject, QRunnable, QThreadPool
+)
+from PySide6.QtGui import QIcon, QColor, QPalette, QPainter, QFont, QPixmap
+import logging
 import os
 import time
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from itertools import repeat
 from typing import List, Optional, Dict, Any
 from audio_browser.zip.zip_manager import ZipManager
-from audio_browser.ui.audio_file_model import AudioFileModel
+from audio_browser.ui.audio_file_model import AudioFileModel, PATH_ROLE
 
 class TreeItemDelegate(QStyledItemDelegate):
     """Custom delegate for handling alternating row colors and folder styling."""
     
+    # Maximum number of pre-rendered folder rows kept around
+    FOLDER_PIXMAP_CACHE_SIZE = 256
+
+    def __init__(self, parent=None):
+        """Initialize the delegate with an empty folder row cache."""
+        super().__init__(parent)
+        self._folder_pixmap_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._file_layout_cache: Dict[tuple, tuple] = {}
+
+    def clear_pixmap_cache(self):
+        """Drop all pre-rendered folder rows and file layouts (e.g. after a palette change)."""
+        self._folder_pixmap_cache.clear()
+        self._file_layout_cache.clear()
+
+    def _paint_folder_background(self, painter: QPainter, option, rect: QRect):
+        """Fill the background of a folder row."""
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(rect, option.palette.color(QPalette.Highlight))
+        else:
+            painter.fillRect(rect, option.palette.color(QPalette.AlternateBase).darker(120))
+
+    def _paint_cached_folder_name(self, painter: QPainter, option, index, full_rect: QRect):
+        """Blit the folder name cell from the cache, rendering it on a miss.
+
+        The key covers everything the rendering depends on: the display text
+        (which includes the file counts), the cell size, selection state,
+        palette and device pixel ratio. Column resizes and palette changes
+        therefore simply produce new keys.
+        """
+        dpr = painter.device().devicePixelRatioF()
+        key = (index.data(), full_rect.width(), full_rect.height(),
+               bool(option.state & QStyle.State_Selected),
+               option.palette.cacheKey(), dpr)
+
+        pixmap = self._folder_pixmap_cache.get(key)
+        if pixmap is not None:
+            self._folder_pixmap_cache.move_to_end(key)
+        else:
+            pixmap = QPixmap(full_rect.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            pix_painter = QPainter(pixmap)
+            pix_painter.setRenderHints(painter.renderHints())
+            pix_painter.translate(-full_rect.topLeft())
+            self._paint_folder_name(pix_painter, option, index, full_rect)
+            pix_painter.end()
+
+            self._folder_pixmap_cache[key] = pixmap
+            if len(self._folder_pixmap_cache) > self.FOLDER_PIXMAP_CACHE_SIZE:
+                self._folder_pixmap_cache.popitem(last=False)
+
+        painter.drawPixmap(full_rect.topLeft(), pixmap)
+
+    def _paint_folder_name(self, painter: QPainter, option, index, full_rect: QRect):
+        """Draw the folder name cell: background, icon, path parts and count."""
+        self._paint_folder_background(painter, option, full_rect)
+
+        # Get the text and split it into name and count
+        text = index.data()
+        name = text
+        count = ""
+        # Look for the last occurrence of " *%*(" to handle folder names containing parentheses
+        last_paren_idx = text.rfind(" *%*(")
+        if last_paren_idx > -1:
+            potential_count = text[last_paren_idx + 5:]  # +5 to skip " *%*("
+            name = text[:last_paren_idx]
+            count = "(" + potential_count
+        
+        # Set up font
+        font = option.font
+        font.setPointSize(13)
+        painter.setFont(font)
+        
+        # Draw the icon if present
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        if icon:
+            icon_rect = QRect(option.rect.left() + 4, option.rect.top() + 4,
+                            option.rect.height() - 8, option.rect.height() - 8)
+            icon.paint(painter, icon_rect)
+        
+        # Calculate text rectangles
+        text_rect = option.rect.adjusted(option.rect.height(), 4, -4, -4)
+        name_rect = text_rect
+        count_rect = text_rect
+        
+        # Draw the name (left-aligned)
+        name_rect.setLeft(name_rect.left() - 10)
+        # If the name contains one ore more / it means it has subfolders,
+        # in this case we should draw each part of the name in a slightly darker color the leftmost it is.
+        # each part should still be drawing in the correct position as it would if we didn't separate it.
+        
+        if "/" in name:
+            # Split the name into parts
+            parts = name.split("/")
+            fm = painter.fontMetrics()
+            current_x = name_rect.left()
+            # Vertically centered baseline, computed once for all parts
+            baseline_y = name_rect.top() + fm.ascent() + (name_rect.height() - fm.height()) // 2
+            separator_width = fm.horizontalAdvance("/")
+            
+            # Draw each part with progressively darker color
+            for i, part in enumerate(parts):
+                # Calculate color darkness based on position
+                # Earlier parts (leftmost) are darker, last part is regular color
+                if i == len(parts) - 1:
+                    # Last part uses regular color
+                    color = option.palette.color(QPalette.Text)
+                else:
+                    # Earlier parts get progressively darker
+                    darkness = 120 + ((len(parts) - i - 1) * 10)  # More darkness for earlier parts
+                    color = option.palette.color(QPalette.Text).darker(darkness)
+                painter.setPen(color)
+                
+                # Draw this part and move x position for next part
+                painter.drawText(current_x, baseline_y, part)
+                current_x += fm.horizontalAdvance(part)
+                
+                # Draw separator if not the last part
+                if i < len(parts) - 1:
+                    painter.drawText(current_x, baseline_y, "/")
+                    current_x += separator_width
+        else:
+            # Draw single name without splitting
+            painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+        
+        # Draw the count (right-aligned)
+        if count:
+            painter.setPen(option.palette.color(QPalette.Text).darker(135))
+            painter.drawText(count_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, count)
+            painter.setPen(option.palette.color(QPalette.Text))
+
+    def _file_cell_layout(self, option, index):
+        """Return the check, icon and text geometry of a file cell.
+
+        The geometry is asked from the style once per column and row height
+        and stored as offsets relative to the cell, so painting a file row
+        never has to go through the style engine.
+
+        Returns:
+            Tuple of (check, icon, text) where check and icon are
+            (dx, dy, width, height) anchored to the cell's top left corner or
+            None, and text is (left, top, right, bottom) margins.
+        """
+        key = (index.column(), option.rect.height())
+        layout = self._file_layout_cache.get(key)
+        if layout is not None:
+            return layout
+
+        style_option = option.__class__(option)
+        self.initStyleOption(style_option, index)
+        style_option.text = f" {style_option.text}"
+        style = QApplication.style()
+        rect = style_option.rect
+        widget = style_option.widget
+
+        def anchored(element, feature):
+            if not style_option.features & feature:
+                return None
+            sub_rect = style.subElementRect(element, style_option, widget)
+            return (sub_rect.left() - rect.left(), sub_rect.top() - rect.top(),
+                    sub_rect.width(), sub_rect.height())
+
+        check = anchored(QStyle.SE_ItemViewItemCheckIndicator,
+                         QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator)
+        icon = anchored(QStyle.SE_ItemViewItemDecoration,
+                        QStyleOptionViewItem.ViewItemFeature.HasDecoration)
+        # The style insets item text by the focus frame margin
+        text_margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, widget) + 1
+        text_rect = style.subElementRect(QStyle.SE_ItemViewItemText, style_option, widget)
+        text = (text_rect.left() - rect.left() + text_margin, text_rect.top() - rect.top(),
+                rect.right() - text_rect.right() + text_margin, rect.bottom() - text_rect.bottom())
+
+        layout = (check, icon, text)
+        self._file_layout_cache[key] = layout
+        return layout
+
+    def _paint_file_cell(self, painter: QPainter, option, index):
+        """Draw a file cell directly with the painter.
+
+        Replaces drawing through CE_ItemViewItem: the check indicator is the
+        only element still drawn by the style, the icon and text are painted
+        directly and the text is clipped to its cell instead of elided.
+        """
+        check, icon_geometry, text_margins = self._file_cell_layout(option, index)
+        rect = option.rect
+        selected = option.state & QStyle.State_Selected
+
+        if check is not None:
+            checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+            check_option = option.__class__(option)
+            check_option.rect = QRect(rect.left() + check[0], rect.top() + check[1], check[2], check[3])
+            check_option.state = (option.state & ~QStyle.State_HasFocus) | (
+                QStyle.State_On if checked else QStyle.State_Off)
+            QApplication.style().drawPrimitive(QStyle.PE_IndicatorItemViewItemCheck,
+                                               check_option, painter, option.widget)
+
+        if icon_geometry is not None:
+            icon = index.data(Qt.ItemDataRole.DecorationRole)
+            if icon:
+                icon.paint(painter, QRect(rect.left() + icon_geometry[0], rect.top() + icon_geometry[1],
+                                          icon_geometry[2], icon_geometry[3]),
+                           Qt.AlignmentFlag.AlignCenter,
+                           QIcon.Mode.Selected if selected else QIcon.Mode.Normal)
+
+        text = index.data()
+        if text:
+            if index.column() == 0:
+                text = f" {text}"
+            text_rect = rect.adjusted(text_margins[0], text_margins[1], -text_margins[2], -text_margins[3])
+            painter.setFont(option.font)
+            painter.setPen(option.palette.color(QPalette.HighlightedText if selected else QPalette.Text))
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+
+        if option.state & QStyle.State_HasFocus:
+            focus_option = QStyleOptionFocusRect()
+            focus_option.rect = rect
+            focus_option.state = option.state
+            focus_option.backgroundColor = option.palette.color(
+                QPalette.Highlight if selected else QPalette.Base)
+            QApplication.style().drawPrimitive(QStyle.PE_FrameFocusRect, focus_option, painter, option.widget)
+
     def paint(self, painter: QPainter, option, index):
         """Paint the item with alternating colors and proper styling."""
-        # Get the item
-        item = self.parent().itemFromIndex(index)
-        if not item:
+        if not index.isValid():
             super().paint(painter, option, index)
             return
             
-        # Set up the option
+        # Work on a copy of the option, the style option is only initialized
+        # from the model when a file row layout has to be computed
         option = option.__class__(option)
-        self.initStyleOption(option, index)
         
         # Get the visual row index
         tree = self.parent()
-        visual_index = tree.indexFromItem(item).row()
+        visual_index = index.row()
+        is_folder = not index.parent().isValid()
         
         # Get the full rect including branch area
         full_rect = option.rect
         if index.column() == 0:  # Only for the first column
-            # Get the indentation level
-            level = 0
-            parent = item.parent()
-            while parent:
-                level += 1
-                parent = parent.parent()
+            # Folders are top-level, files sit one level below them
+            level = 0 if is_folder else 1
             
             # Calculate the full width including branch area
             branch_width = tree.indentation() * level
             full_rect.setLeft(full_rect.left() - branch_width)
         
         # Handle folder items
-        if item in tree.folder_items.values():
-            # Draw background
-            if option.state & QStyle.State_Selected:
-                painter.fillRect(full_rect, option.palette.color(QPalette.Highlight))
-            else:
-                painter.fillRect(full_rect, option.palette.color(QPalette.AlternateBase).darker(120))
-            
+        if is_folder:
             # check if it's the name column
             if index.column() == 0:
-                # Get the text and split it into name and count
-                text = index.data()
-                name = text
-                count = ""
-                # Look for the last occurrence of " *%*(" to handle folder names containing parentheses
-                last_paren_idx = text.rfind(" *%*(")
-                if last_paren_idx > -1:
-                    potential_count = text[last_paren_idx + 5:]  # +5 to skip " *%*("
-                    name = text[:last_paren_idx]
-                    count = "(" + potential_count
-                
-                # Set up font
-                font = option.font
-                font.setPointSize(13)
-                painter.setFont(font)
-                
-                # Draw the icon if present
-                icon = index.data(Qt.ItemDataRole.DecorationRole)
-                if icon:
-                    icon_rect = QRect(option.rect.left() + 4, option.rect.top() + 4,
-                                    option.rect.height() - 8, option.rect.height() - 8)
-                    icon.paint(painter, icon_rect)
-                
-                # Calculate text rectangles
-                text_rect = option.rect.adjusted(option.rect.height(), 4, -4, -4)
-                name_rect = text_rect
-                count_rect = text_rect
-                
-                # Draw the name (left-aligned)
-                name_rect.setLeft(name_rect.left() - 10)
-                # If the name contains one ore more / it means it has subfolders,
-                # in this case we should draw each part of the name in a slightly darker color the leftmost it is.
-                # each part should still be drawing in the correct position as it would if we didn't separate it.
-                
-                if "/" in name:
-                    # Split the name into parts
-                    parts = name.split("/")
-                    current_x = name_rect.left()
-                    
-                    # Draw each part with progressively darker color
-                    for i, part in enumerate(parts):
-                        # Calculate color darkness based on position
-                        # Earlier parts (leftmost) are darker, last part is regular color
-                        if i == len(parts) - 1:
-                            # Last part uses regular color
-                            color = option.palette.color(QPalette.Text)
-                        else:
-                            # Earlier parts get progressively darker
-                            darkness = 120 + ((len(parts) - i - 1) * 10)  # More darkness for earlier parts
-                            color = option.palette.color(QPalette.Text).darker(darkness)
-                        painter.setPen(color)
-                        
-                        # Draw this part
-                        part_rect = QRect(current_x, name_rect.top(), 
-                                        painter.fontMetrics().horizontalAdvance(part), 
-                                        name_rect.height())
-                        painter.drawText(part_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, part)
-                        
-                        # Move x position for next part
-                        current_x += part_rect.width()
-                        
-                        # Draw separator if not the last part
-                        if i < len(parts) - 1:
-                            separator_rect = QRect(current_x, name_rect.top(),
-                                                painter.fontMetrics().horizontalAdvance("/"),
-                                                name_rect.height())
-                            painter.drawText(separator_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "/")
-                            current_x += separator_rect.width()
-                else:
-                    # Draw single name without splitting
-                    painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
-                
-                # Draw the count (right-aligned)
-                if count:
-                    painter.setPen(option.palette.color(QPalette.Text).darker(135))
-                    painter.drawText(count_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, count)
-                    painter.setPen(option.palette.color(QPalette.Text))
+                self._paint_cached_folder_name(painter, option, index, full_rect)
                 return
+
+            # Draw background
+            self._paint_folder_background(painter, option, full_rect)
         else:
             # Handle alternating colors for file items
             
@@ -147,13 +290,121 @@ class TreeItemDelegate(QStyledItemDelegate):
             if index.column() == 0:
                 # Add padding to the left side
                 option.rect.setLeft(option.rect.left() + 10)  # Add 20 pixels of padding
-                option.text = f" {option.text}" 
 
             # Draw the item
-            QApplication.style().drawControl(QStyle.CE_ItemViewItem, option, painter)
+            self._paint_file_cell(painter, option, index)
+
+class MetadataWorkerSignals(QObject):
+    """Signals emitted by MetadataWorker."""
+    
+    finished = Signal(object, object)  # Emits metadata dict (or None) and error (or None)
+
+class MetadataWorker(QRunnable):
+    """Reads the full audio metadata of a file in a ZIP on a pool thread."""
+    
+    def __init__(self, zip_manager: ZipManager, zip_path: str, file_path: str):
+        """Initialize the worker.
+        
+        Args:
+            zip_manager: ZipManager used to read the metadata
+            zip_path: Path to the ZIP file
+            file_path: Path of the audio file inside the ZIP
+        """
+        super().__init__()
+        self.zip_manager = zip_manager
+        self.zip_path = zip_path
+        self.file_path = file_path
+        self.signals = MetadataWorkerSignals()
+    
+    def run(self):
+        """Read the metadata and report it back to the GUI thread."""
+        metadata, error = None, None
+        try:
+            metadata = self.zip_manager.get_full_audio_metadata(self.zip_path, self.file_path)
+        except Exception as e:
+            error = e
+        try:
+            self.signals.finished.emit(metadata, error)
+        except RuntimeError:
+            pass  # The receiving dialog was already destroyed
 
-class AudioFileTreeWidget(QTreeWidget):
-    """Custom tree widget for displaying audio files with hierarchical folder structure."""
+class DurationWorkerSignals(QObject):
+    """Signals emitted by DurationWorker."""
+    
+    finished = Signal(object, object)  # Emits file data dict and duration in ms (or None)
+
+class DurationWorker(QRunnable):
+    """Reads the duration of a file in a ZIP on a pool thread."""
+    
+    def __init__(self, file_data: dict):
+        """Initialize the worker.
+        
+        Args:
+            file_data: Model data of the file, with its ZIP and ZipManager
+        """
+        super().__init__()
+        self.file_data = file_data
+        self.signals = DurationWorkerSignals()
+    
+    def run(self):
+        """Read the duration, caching it, and report it back to the GUI thread."""
+        file_data = self.file_data
+        try:
+            duration = file_data['zip_manager'].get_file_duration(file_data['zip_path'], file_data['path'])
+        except Exception as e:
+            logging.warning(f"Failed to get duration for {file_data['path']}: {e}")
+            duration = None
+        try:
+            self.signals.finished.emit(file_data, duration)
+        except RuntimeError:
+            pass  # The tree was already destroyed
+
+class FileRecordsWorkerSignals(QObject):
+    """Signals emitted by FileRecordsWorker."""
+    
+    finished = Signal(int, object)  # Emits load generation and list of (file_path, metadata) records
+
+class FileRecordsWorker(QRunnable):
+    """Prepares the model records of a ZIP's files on a pool thread.
+    
+    Reads the cached metadata and drops macOS junk entries, so the GUI
+    thread only has to insert the finished records.
+    """
+    
+    def __init__(self, generation: int, file_list: List[str], zip_manager: ZipManager, zip_path: str):
+        """Initialize the worker.
+        
+        Args:
+            generation: Load generation the records belong to
+            file_list: List of file paths in the ZIP
+            zip_manager: ZipManager whose cache holds the metadata
+            zip_path: Path to the ZIP file
+        """
+        super().__init__()
+        self.generation = generation
+        self.file_list = file_list
+        self.zip_manager = zip_manager
+        self.zip_path = zip_path
+        self.signals = FileRecordsWorkerSignals()
+    
+    def run(self):
+        """Build the records and hand them to the GUI thread."""
+        cached_metadata = self.zip_manager.cache_manager.get_cached_metadata(self.zip_path)
+        file_metadata = (cached_metadata or {}).get('file_metadata', {})
+        
+        # Caches written by older versions may still list macOS junk files.
+        # File bytes are not read, the metadata comes from the cache
+        is_system_file = ZipManager.is_system_file
+        records = [(file_path, file_metadata.get(file_path))
+                   for file_path in self.file_list if not is_system_file(file_path)]
+        
+        try:
+            self.signals.finished.emit(self.generation, records)
+        except RuntimeError:
+            pass  # The tree was already destroyed
+
+class AudioFileTreeWidget(QTreeView):
+    """Custom tree view for displaying audio files with hierarchical folder structure."""
     
     # Signals
     file_selected = Signal(str)  # Emits selected file path
@@ -161,17 +412,34 @@ class AudioFileTreeWidget(QTreeWidget):
     extract_requested = Signal(str)  # Emits file path to extract
     status_update = Signal(str)  # Emits status message
     progress_update = Signal(int)  # Emits progress value (0-100)
+    files_loaded = Signal()  # Emitted when all queued files have been added
     
     # Debug flag
     DEBUG = False
     
+    # Delay before a search is applied, to coalesce fast typing
+    SEARCH_DELAY_MS = 150
+    
+    # Number of files added to the tree per event loop iteration
+    LOAD_BATCH_SIZE = 50
+    
+    # Number of progress and status updates emitted while adding one ZIP
+    LOAD_PROGRESS_UPDATES = 20
+    
+    # How long the full progress bar stays visible after a load
+    PROGRESS_HIDE_DELAY_MS = 1000
+    
     def __init__(self, parent=None):
-        """Initialize the audio file tree widget."""
+        """Initialize the audio file tree view."""
         super().__init__(parent)
         
-        # Set up tree widget properties
-        self.setHeaderLabels([" Name ", " Duration ", " Size "])
-        self.setSelectionMode(QTreeWidget.ExtendedSelection)
+        # Initialize data model
+        self.model = AudioFileModel()
+        self.setModel(self.model)
+        
+        # Set up tree view properties
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setUniformRowHeights(True)  # All rows share the stylesheet height, skips per-row size hints
         
         # Set minimum column widths
         self.setColumnWidth(0, 600)  # Name column
@@ -190,334 +458,204 @@ class AudioFileTreeWidget(QTreeWidget):
         self.item_delegate = TreeItemDelegate(self)
         self.setItemDelegate(self.item_delegate)
         
-        # Initialize data model
-        self.model = AudioFileModel()
-        
         # Set row height
         self.setStyleSheet("""
-            QTreeWidget {
+            QTreeView {
                 background-color: palette(base);
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 height: 32px;
                 padding: 6px;
             }
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background-color: palette(highlight);
                 color: palette(highlighted-text);
             }
-            QTreeWidget::item:checked {
+            QTreeView::item:checked {
                 background-color: palette(highlight).lighter(110);
                 color: palette(highlighted-text).darker(110);
             }
         """)
         
         # Track UI state
-        self.folder_items = {}  # Track folder items by path
-        self.file_items = {}  # Track file items by path
-        self._last_selected_item = None  # Track last selected item for shift selection
+        self._last_selected_index = QModelIndex()  # Track last selected file for shift selection
         self._current_search = ""  # Track current search text
+        self._pending_search = ""  # Search text waiting for the debounce timer
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_search_filter_now)
+        
+        # Track file loading, one batch is added per timer tick
+        self._load_queue: List[Dict[str, Any]] = []  # Loads waiting to start
+        self._current_load: Optional[Dict[str, Any]] = None  # State of the running load
+        self._sort_when_loaded = False  # Sort once the running loads are done
+        self._load_generation = 0  # Bumped to discard records of abandoned loads
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._process_next_batch)
+        # Hides the progress bar a moment after a load completes
+        self._progress_hide_timer = QTimer(self)
+        self._progress_hide_timer.setSingleShot(True)
+        self._progress_hide_timer.setInterval(self.PROGRESS_HIDE_DELAY_MS)
+        self._progress_hide_timer.timeout.connect(self._hide_progress)
+        self._full_metadata_cache: Dict[tuple, Optional[dict]] = {}  # (zip_path, file_path) -> full metadata
+        # Duration reads get their own pool, so the ones still queued can be
+        # dropped on close without touching other work
+        self._duration_pool = QThreadPool(self)
         
         # Connect signals
-        self.itemDoubleClicked.connect(self._handle_double_click)
-        self.itemSelectionChanged.connect(self._handle_selection_change)
-        self.itemChanged.connect(self._handle_item_changed)
-        self.itemClicked.connect(self._handle_item_click)
+        self.doubleClicked.connect(self._handle_double_click)
+        self.selectionModel().selectionChanged.connect(self._handle_selection_change)
+        self.clicked.connect(self._handle_item_click)
+        self.model.rowsInserted.connect(self._handle_rows_inserted)
+        self.model.duration_needed.connect(self._request_duration)
         
         # Set up context menu
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
+
+    def changeEvent(self, event):
+        """Drop cached folder renderings when the palette or style changes."""
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange):
+            self.item_delegate.clear_pixmap_cache()
+        super().changeEvent(event)
     
-    def _handle_item_click(self, item: QTreeWidgetItem, column: int):
+    def _file_path(self, index: QModelIndex) -> Optional[str]:
+        """Get the file path for a file index, or None for folders."""
+        if not index.isValid() or not index.parent().isValid():
+            return None
+        return index.data(PATH_ROLE)
+    
+    def _handle_item_click(self, index: QModelIndex):
         """Handle item clicks, including folder expansion."""
         # If it's a folder item, toggle its expansion
-        if item in self.folder_items.values():
-            if item.isExpanded():
-                item.setExpanded(False)
-            else:
-                # Load folder contents if not already loaded
-                if item.childCount() == 1 and item.child(0).text(0) == "Loading...":
-                    self._load_folder_contents(item)
-                item.setExpanded(True)
+        if index.isValid() and not index.parent().isValid():
+            folder_index = self.model.index(index.row(), 0)
+            # Expanding fetches the folder contents lazily
+            self.setExpanded(folder_index, not self.isExpanded(folder_index))
             return
             
         # For file items, just let the default behavior handle it
         pass
     
-    def _add_folder(self, folder_path: str) -> QTreeWidgetItem:
-        """Add a folder to the tree.
+    def _request_duration(self, file_data: dict):
+        """Read the duration of a file shown without one off the GUI thread.
         
         Args:
-            folder_path: Path of the folder to add
-            
-        Returns:
-            The created folder item
+            file_data: Model data of the file
         """
-        # Create folder item
-        folder_item = QTreeWidgetItem(self)
-        folder_item.setFlags(folder_item.flags() | Qt.ItemFlag.ItemIsAutoTristate | Qt.ItemFlag.ItemIsUserCheckable)
-        folder_item.setCheckState(0, Qt.CheckState.Unchecked)
-        
-        # Set folder name
-        if folder_path:
-            path_parts = folder_path.split(os.sep)
-            path_parts = [p for p in path_parts if p]
-            if len(path_parts) > 1:
-                path_parts = path_parts[1:]
-            folder_name = " / ".join(path_parts)
-        else:
-            folder_name = "Root"
-        
-        folder_item.setText(0, folder_name)
-        
-        # Set folder icon
-        folder_item.setIcon(0, QIcon(":/icons/folder.png"))
-        
-        # Set folder background color
-        palette = self.palette()
-        folder_color = palette.color(QPalette.AlternateBase).darker(120)
-        folder_item.setBackground(0, folder_color)
-        folder_item.setBackground(1, folder_color)
-        folder_item.setBackground(2, folder_color)
-        
-        # Set folder item type for styling
-        folder_item.setData(0, Qt.ItemDataRole.UserRole, "folder")
-        
-        # Store folder reference
-        self.folder_items[folder_path] = folder_item
-        
-        return folder_item
+        worker = DurationWorker(file_data)
+        worker.signals.setParent(self)
+        worker.signals.finished.connect(self._handle_duration_ready)
+        self._duration_pool.start(worker)
     
-    def _add_file(self, folder_path: str, file_data: Dict[str, Any]) -> QTreeWidgetItem:
-        """Add a file under its folder in the tree.
-        
-        Args:
-            folder_path: Path of the parent folder
-            file_data: Dictionary containing file information
-            
-        Returns:
-            The created file item
-        """
-        # Get or create parent folder
-        folder_item = self.folder_items.get(folder_path)
-        if not folder_item:
-            folder_item = self._add_folder(folder_path)
-        
-        # Create file item
-        file_item = QTreeWidgetItem(folder_item)
-        file_item.setFlags(file_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        file_item.setCheckState(0, Qt.CheckState.Unchecked)
-        
-        # Set file name and icon
-        file_name = os.path.basename(file_data['path'])
-        file_item.setText(0, file_name)
-        
-        # Set icon based on file extension
-        ext = os.path.splitext(file_data['path'])[1].lower()
-        if ext == '.wav':
-            file_item.setIcon(0, QIcon(":/icons/wav.png"))
-        elif ext == '.mp3':
-            file_item.setIcon(0, QIcon(":/icons/mp3.png"))
-        elif ext == '.ogg':
-            file_item.setIcon(0, QIcon(":/icons/ogg.png"))
-        else:
-            file_item.setIcon(0, QIcon(":/icons/audio.png"))
-        
-        # Set duration and size
-        duration_str = "?"
-        size_str = "?"
-        if file_data['metadata']:
-            duration_ms = file_data['metadata'].get('duration_ms', 0)
-            if duration_ms > 0:
-                minutes = int((duration_ms % 3600000) // 60000)
-                seconds = int((duration_ms % 60000) // 1000)
-                milliseconds = int(duration_ms % 1000)
-                duration_str = f"{minutes:02}:{seconds:02}.{milliseconds:03}"
-            
-            size_bytes = file_data['metadata'].get('size', 0)
-            if size_bytes > 0:
-                if size_bytes < 1024:
-                    size_str = f"{size_bytes} B"
-                elif size_bytes < 1024 * 1024:
-                    size_str = f"{size_bytes/1024:.1f} KB"
-                else:
-                    size_str = f"{size_bytes/(1024*1024):.1f} MB"
-        
-        file_item.setText(1, duration_str)
-        file_item.setText(2, size_str)
-        
-        # Store file reference
-        self.file_items[file_data['path']] = file_item
-        
-        return file_item
+    def stop_duration_reads(self):
+        """Drop queued duration reads and wait for the running ones."""
+        self._duration_pool.clear()
+        self._duration_pool.waitForDone()
     
-    def _handle_item_changed(self, item: QTreeWidgetItem, column: int):
-        """Handle changes to item check state.
+    def _handle_duration_ready(self, file_data: dict, duration_ms: Optional[int]):
+        """Show a duration read by a DurationWorker.
         
         Args:
-            item: The item that changed
-            column: The column that changed
+            file_data: Model data of the file
+            duration_ms: Duration in milliseconds, or None if it couldn't be read
         """
-        if column != 0:  # Only handle checkbox column
-            return
-            
-        # Get the path for this item
-        item_path = None
-        for path, file_item in self.file_items.items():
-            if file_item == item:
-                item_path = path
-                break
-        
-        if item_path:
-            # Update model checked state
-            self.model.set_file_checked(item_path, item.checkState(0) == Qt.Checked)
-            
-            # Update parent folder state
-            folder_path = os.path.dirname(item_path)
-            if folder_path in self.folder_items:
-                self._update_folder_state(folder_path)
+        self.sender().deleteLater()
+        self.model.set_file_duration(file_data, duration_ms)
     
-    def _update_folder_state(self, folder_path: str):
-        """Update a folder's check state based on its children.
+    def _handle_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        """Apply the current search to file rows fetched after the search ran.
         
         Args:
-            folder_path: Path of the folder to update
+            parent: The folder the rows were inserted under
+            first: First inserted row
+            last: Last inserted row
         """
-        folder_item = self.folder_items.get(folder_path)
-        if not folder_item:
+        if not self._current_search or not parent.isValid():
             return
-            
-        # Count checked and unchecked children
-        checked_count = 0
-        unchecked_count = 0
-        total_count = 0
-        
-        for i in range(folder_item.childCount()):
-            child = folder_item.child(i)
-            if child.checkState(0) == Qt.Checked:
-                checked_count += 1
-            elif child.checkState(0) == Qt.Unchecked:
-                unchecked_count += 1
-            total_count += 1
-        
-        # Set folder state based on children
-        if checked_count == total_count:
-            folder_item.setCheckState(0, Qt.Checked)
-        elif unchecked_count == total_count:
-            folder_item.setCheckState(0, Qt.Unchecked)
-        else:
-            folder_item.setCheckState(0, Qt.PartiallyChecked)
-        
-        # Update folder count display
-        self._update_folder_count(folder_path)
+        folder_path = self.model.folder_at(parent)
+        for row in range(first, last + 1):
+            self.setRowHidden(row, parent, not self._file_matches_search(folder_path, row))
     
-    def _update_folder_count(self, folder_path: str):
-        """Update a folder's count display.
+    def _file_matches_search(self, folder_path: str, row: int) -> bool:
+        """Check whether a file row matches the current search.
         
-        Args:
-            folder_path: Path of the folder to update
-        """
-        folder_item = self.folder_items.get(folder_path)
-        if not folder_item:
-            return
-            
-        # Count total and selected files
-        total_count = folder_item.childCount()
-        selected_count = sum(1 for i in range(total_count) 
-                           if folder_item.child(i).checkState(0) == Qt.Checked)
+        Uses the per-file results of the last match count when available,
+        so paths are only tested once per search.
         
-        # Get the original name by finding the last occurrence of " *%*(" that's followed by a count pattern
-        text = folder_item.text(0)
-        last_paren_idx = text.rfind(" *%*(")
-        if last_paren_idx > -1:
-            potential_count = text[last_paren_idx + 5:]  # +5 to skip " *%*("
-            original_name = text[:last_paren_idx]
-        else:
-            original_name = text
-        print(f"Original name: {original_name}")
+        Args:
+            folder_path: Folder containing the file
+            row: Row of the file within the folder
             
-        # Update folder name with count, preserving the original name
-        folder_item.setText(0, f"{original_name} *%*({total_count} files" + 
-                          (f", {selected_count} selected" if selected_count > 0 else "") + ")")
+        Returns:
+            True if the file path contains every word of the search text
+        """
+        flags = self.model.match_flags(folder_path)
+        if flags is not None and row < len(flags):
+            return flags[row]
+        path_lower = self.model.folder_paths_lower(folder_path)[row]
+        return all(token in path_lower for token in self._current_search.split())
     
-    def _handle_double_click(self, item: QTreeWidgetItem, column: int):
+    def _handle_double_click(self, index: QModelIndex):
         """Handle double click on an item.
         
         Args:
-            item: The clicked item
-            column: The clicked column
+            index: The clicked index
         """
-        # Find the file path for this item
-        file_path = None
-        for path, file_item in self.file_items.items():
-            if file_item == item:
-                file_path = path
-                break
-                
+        file_path = self._file_path(index)
         if file_path:
             self.play_requested.emit(file_path)
     
-    def _handle_selection_change(self):
+    def _handle_selection_change(self, selected=None, deselected=None):
         """Handle selection changes, including shift and ctrl selection."""
-        selected = self.selectedItems()
-        if not selected:
+        if not self.selectionModel().hasSelection():
             return
             
         # Get the current selected item
-        current_item = selected[0]
+        current_index = self.currentIndex().siblingAtColumn(0)
         
         # Handle shift selection
         modifiers = QApplication.keyboardModifiers()
         is_shift_pressed = bool(modifiers & Qt.ShiftModifier)
         
-        if is_shift_pressed and self._last_selected_item is not None:
-            # Get the top-level items
-            root = self.invisibleRootItem()
-            items = []
-            for i in range(root.childCount()):
-                items.extend(self._get_all_items(root.child(i)))
+        if is_shift_pressed and self._last_selected_index.isValid():
+            # Order both endpoints by their position in the tree
+            start, end = sorted((self._tree_order(self._last_selected_index),
+                                 self._tree_order(current_index)))
             
-            # Find indices of last and current items
-            last_idx = items.index(self._last_selected_item)
-            current_idx = items.index(current_item)
-            
-            # Select all items between last and current
-            start_idx = min(last_idx, current_idx)
-            end_idx = max(last_idx, current_idx)
+            # Select the file rows between them, one range per folder
+            selection = QItemSelection()
+            for folder_row in range(start[0], end[0] + 1):
+                folder_index = self.model.index(folder_row, 0)
+                first_row = start[1] if folder_row == start[0] else 0
+                last_row = end[1] if folder_row == end[0] else self.model.rowCount(folder_index) - 1
+                first_row = max(first_row, 0)  # A folder endpoint starts before its first file
+                if first_row <= last_row:
+                    selection.select(self.model.index(first_row, 0, folder_index),
+                                     self.model.index(last_row, 2, folder_index))
+            self.selectionModel().select(selection, QItemSelectionModel.Select)
+        
+        # Update last selected item and emit file selected signal
+        file_path = self._file_path(current_index)
+        if file_path:
+            self._last_selected_index = current_index
+            self.file_selected.emit(file_path)
+    
+    def _tree_order(self, index: QModelIndex) -> tuple:
+        """Get a sort key for an index reflecting its position in the tree.
             
-            for item in items[start_idx:end_idx + 1]:
-                if item in self.file_items.values():  # Only select file items
-                    item.setSelected(True)
-        
-        # Update last selected item
-        if current_item in self.file_items.values():  # Only update for file items
-            self._last_selected_item = current_item
-        
-        # Emit file selected signal
-        if current_item in self.file_items.values():
-            # Find the file path for this item
-            file_path = None
-            for path, file_item in self.file_items.items():
-                if file_item == current_item:
-                    file_path = path
-                    break
-                    
-            if file_path:
-                self.file_selected.emit(file_path)
-    
-    def _get_all_items(self, item: QTreeWidgetItem) -> List[QTreeWidgetItem]:
-        """Get all items under a given item recursively.
-        
         Args:
-            item: The root item to get children from
+            index: Column 0 index of a folder or file row
             
         Returns:
-            List of all items under the root item
+            Tuple of (folder row, file row), where folders use -1 as file row
         """
-        items = [item]
-        for i in range(item.childCount()):
-            items.extend(self._get_all_items(item.child(i)))
-        return items
+        if index.parent().isValid():
+            return (index.parent().row(), index.row())
+        return (index.row(), -1)
     
     def _show_context_menu(self, position):
         """Show context menu for the clicked item.
@@ -525,17 +663,7 @@ class AudioFileTreeWidget(QTreeWidget):
         Args:
             position: The position where the context menu was requested
         """
-        item = self.itemAt(position)
-        if not item or item not in self.file_items.values():
-            return
-            
-        # Find the file path for this item
-        file_path = None
-        for path, file_item in self.file_items.items():
-            if file_item == item:
-                file_path = path
-                break
-                
+        file_path = self._file_path(self.indexAt(position))
         if not file_path:
             return
             
@@ -551,31 +679,16 @@ class AudioFileTreeWidget(QTreeWidget):
         elif action == extract_action:
             self.extract_requested.emit(file_path)
         elif action == properties_action:
-            self._show_properties(item)
+            self._show_properties(file_path)
     
-    def _show_properties(self, item: QTreeWidgetItem):
-        """Show properties dialog for an item.
+    def _show_properties(self, file_path: str):
+        """Show properties dialog for a file.
         
         Args:
-            item: The item to show properties for
+            file_path: Path of the file to show properties for
         """
-        # Find the file path for this item
-        file_path = None
-        for path, file_item in self.file_items.items():
-            if file_item == item:
-                file_path = path
-                break
-                
-        if not file_path:
-            return
-            
         # Get file data from model
-        file_data = None
-        for data in self.model.files:
-            if data['path'] == file_path:
-                file_data = data
-                break
-                
+        file_data = self.model.get_file(file_path)
         if not file_data:
             return
             
@@ -591,7 +704,7 @@ class AudioFileTreeWidget(QTreeWidget):
         info_layout = QVBoxLayout()
         
         # Helper function to create label-value pairs
-        def add_label_value(label_text, value_text, word_wrap=False):
+        def add_label_value(label_text, value_text, word_wrap=False, target_layout=None):
             label_layout = QHBoxLayout()
             label = QLabel(label_text)
             label.setStyleSheet("font-weight: bold;")
@@ -606,7 +719,7 @@ class AudioFileTreeWidget(QTreeWidget):
 
             label_layout.addWidget(label)
             label_layout.addWidget(value)
-            info_layout.addLayout(label_layout)
+            (target_layout or info_layout).addLayout(label_layout)
         
         # File name
         add_label_value("Name:", os.path.basename(file_path))
@@ -649,87 +762,115 @@ class AudioFileTreeWidget(QTreeWidget):
         format_label.setStyleSheet("font-weight: bold; font-size: 12px;")
         info_layout.addWidget(format_label)
         
-        # Get full metadata from ZipManager
-        zip_path = file_data.get('zip_path')
-        zip_manager = file_data.get('zip_manager')
+        # Full metadata is read from the ZIP in the background, the dialog
+        # shows a placeholder until it arrives
+        details_layout = QVBoxLayout()
+        info_layout.addLayout(details_layout)
         
-        if zip_path and zip_manager:
-            try:
-                metadata = zip_manager.get_full_audio_metadata(zip_path, file_path)
-                if metadata:
-                    # Sample rate
-                    sample_rate = metadata.get('sample_rate', 0)
-                    sample_rate_str = f"{sample_rate:,} Hz" if sample_rate > 0 else "Unknown"
-                    add_label_value("Sample Rate:", sample_rate_str)
-                    
-                    # Channels
-                    channels = metadata.get('channels', 0)
-                    channels_str = f"{channels} ({'Mono' if channels == 1 else 'Stereo' if channels == 2 else 'Multi-channel'})"
-                    add_label_value("Channels:", channels_str)
-                    
-                    # Bit depth
-                    bit_depth = metadata.get('bit_depth', 0)
-                    bit_depth_str = f"{bit_depth} bits" if bit_depth > 0 else "Unknown"
-                    add_label_value("Bit Depth:", bit_depth_str)
-                    
-                    # Bitrate
-                    bitrate = metadata.get('bitrate', 0)
-                    if bitrate > 0:
-                        if bitrate < 1000:
-                            bitrate_str = f"{bitrate} b/s"
-                        elif bitrate < 1000000:
-                            bitrate_str = f"{bitrate/1000:.1f} kb/s"
-                        else:
-                            bitrate_str = f"{bitrate/1000000:.1f} Mb/s"
-                    else:
-                        bitrate_str = "Unknown"
-                    add_label_value("Bitrate:", bitrate_str)
-                    
-                    # Add separator
-                    separator = QFrame()
-                    separator.setFrameShape(QFrame.HLine)
-                    separator.setFrameShadow(QFrame.Sunken)
-                    info_layout.addWidget(separator)
-                    
-                    # Metadata section
-                    metadata_label = QLabel("Metadata")
-                    metadata_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-                    info_layout.addWidget(metadata_label)
-                    
-                    # Add all other metadata fields
-                    for key, value in metadata.items():
-                        # Skip fields we've already shown
-                        if key in ['sample_rate', 'channels', 'bit_depth', 'bitrate', 'duration_ms']:
-                            continue
-                        add_label_value(
-                            key.replace('_', ' ').title() + ":",
-                            str(value),
-                            word_wrap=True
-                        )
-            except Exception as e:
-                print(f"Error getting metadata: {e}")
-                # Show basic info from model metadata
-                metadata = file_data['metadata']
-                if metadata:
-                    for key, value in metadata.items():
-                        if value and key not in ['size', 'duration_ms']:
-                            add_label_value(
-                                key.replace('_', ' ').title() + ":",
-                                str(value),
-                                word_wrap=True
-                            )
-        else:
+        def add_detail(label_text, value_text, word_wrap=False):
+            add_label_value(label_text, value_text, word_wrap, details_layout)
+        
+        def add_basic_metadata():
             # Show basic info from model metadata
             metadata = file_data['metadata']
             if metadata:
                 for key, value in metadata.items():
                     if value and key not in ['size', 'duration_ms']:
-                        add_label_value(
+                        add_detail(
                             key.replace('_', ' ').title() + ":",
                             str(value),
                             word_wrap=True
                         )
         
+        loading_label = QLabel("Loading…")
+        
+        def populate_details(metadata, error):
+            # Remove the loading placeholder
+            if loading_label.parent() is not None:
+                details_layout.removeWidget(loading_label)
+                loading_label.deleteLater()
+            
+            if error is not None:
+                print(f"Error getting metadata: {error}")
+                add_basic_metadata()
+                return
+            
+            if metadata:
+                # Sample rate
+                sample_rate = metadata.get('sample_rate', 0)
+                sample_rate_str = f"{sample_rate:,} Hz" if sample_rate > 0 else "Unknown"
+                add_detail("Sample Rate:", sample_rate_str)
+                
+                # Channels
+                channels = metadata.get('channels', 0)
+                channels_str = f"{channels} ({'Mono' if channels == 1 else 'Stereo' if channels == 2 else 'Multi-channel'})"
+                add_detail("Channels:", channels_str)
+                
+                # Bit depth
+                bit_depth = metadata.get('bit_depth', 0)
+                bit_depth_str = f"{bit_depth} bits" if bit_depth > 0 else "Unknown"
+                add_detail("Bit Depth:", bit_depth_str)
+                
+                # Bitrate
+                bitrate = metadata.get('bitrate', 0)
+                if bitrate > 0:
+                    if bitrate < 1000:
+                        bitrate_str = f"{bitrate} b/s"
+                    elif bitrate < 1000000:
+                        bitrate_str = f"{bitrate/1000:.1f} kb/s"
+                    else:
+                        bitrate_str = f"{bitrate/1000000:.1f} Mb/s"
+                else:
+                    bitrate_str = "Unknown"
+                add_detail("Bitrate:", bitrate_str)
+                
+                # Add separator
+                separator = QFrame()
+                separator.setFrameShape(QFrame.HLine)
+                separator.setFrameShadow(QFrame.Sunken)
+                details_layout.addWidget(separator)
+                
+                # Metadata section
+                metadata_label = QLabel("Metadata")
+                metadata_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+                details_layout.addWidget(metadata_label)
+                
+                # Add all other metadata fields
+                for key, value in metadata.items():
+                    # Skip fields we've already shown
+                    if key in ['sample_rate', 'channels', 'bit_depth', 'bitrate', 'duration_ms']:
+                        continue
+                    add_detail(
+                        key.replace('_', ' ').title() + ":",
+                        str(value),
+                        word_wrap=True
+                    )
+        
+        # Get full metadata from ZipManager
+        zip_path = file_data.get('zip_path')
+        zip_manager = file_data.get('zip_manager')
+        
+        if zip_path and zip_manager:
+            cache_key = (zip_path, file_path)
+            if cache_key in self._full_metadata_cache:
+                populate_details(self._full_metadata_cache[cache_key], None)
+            else:
+                details_layout.addWidget(loading_label)
+                
+                def handle_metadata_loaded(metadata, error):
+                    if error is None:
+                        self._full_metadata_cache[cache_key] = metadata
+                    populate_details(metadata, error)
+                
+                # The signals object lives with the dialog, so a late result
+                # for a dialog that is gone is dropped by Qt
+                worker = MetadataWorker(zip_manager, zip_path, file_path)
+                worker.signals.setParent(dialog)
+                worker.signals.finished.connect(handle_metadata_loaded)
+                QThreadPool.globalInstance().start(worker)
+        else:
+            add_basic_metadata()
+        
         # Add info layout to main layout
         layout.addLayout(info_layout)
         
@@ -748,117 +889,148 @@ class AudioFileTreeWidget(QTreeWidget):
                        zip_path: str, resort_after_load: bool = False):
         """Add files from a ZIP to the tree.
         
+        Files are added one batch per event loop iteration, so the window
+        stays responsive without re-entering the event loop. Loads requested
+        while another one is running are queued; files_loaded is emitted once
+        all of them are done.
+        
         Args:
             file_list: List of file paths to add
             zip_manager: ZipManager instance for handling ZIP operations
             zip_path: Path to the ZIP file
             resort_after_load: Whether to resort after loading
         """
-        # Disable UI updates during processing
-        self.setUpdatesEnabled(False)
-        timing_set_audio_start = time.time()
+        self._load_queue.append({
+            'file_list': file_list,
+            'zip_manager': zip_manager,
+            'zip_path': zip_path,
+            'resort_after_load': resort_after_load,
+        })
+        if not self._load_timer.isActive():
+            self._load_timer.start()
+    
+    def is_loading(self) -> bool:
+        """Check whether files are still being added to the tree."""
+        return self._current_load is not None or bool(self._load_queue)
+    
+    def _start_next_load(self):
+        """Start preparing the records of the next queued load off the GUI thread."""
+        load = self._load_queue.pop(0)
+        zip_path = load['zip_path']
+        
+        if self.DEBUG:
+            cache_file = load['zip_manager'].cache_manager._get_cache_file_path(zip_path)
+            print(f"\n[DEBUG] Cache file location: {cache_file}")
+        
+        load['records'] = None  # Filled in by _handle_records_ready
+        load['index'] = 0
+        load['start_time'] = time.time()
+        self._current_load = load
+        self._progress_hide_timer.stop()  # Keep showing progress for this load
+        
+        worker = FileRecordsWorker(self._load_generation, load['file_list'], load['zip_manager'], zip_path)
+        worker.signals.setParent(self)
+        worker.signals.finished.connect(self._handle_records_ready)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _handle_records_ready(self, generation: int, records: list):
+        """Receive the prepared records of the current load and start adding them.
         
-        try:
-            # Process files in batches
-            BATCH_SIZE = 50
-            total_files = len(file_list)
-            processed_files = 0
-            
-            # Pre-fetch all metadata at once
-            cached_metadata = zip_manager.cache_manager.get_cached_metadata(zip_path)
-            cache_file = zip_manager.cache_manager._get_cache_file_path(zip_path)
-            
-            if self.DEBUG:
-                print(f"\n[DEBUG] Cache file location: {cache_file}")
-                if cached_metadata:
-                    print(f"[DEBUG] Using cached metadata for {zip_path}")
-                    print(f"[DEBUG] Cache contains {len(cached_metadata.get('audio_files', []))} files")
-                else:
-                    print(f"[DEBUG] No cache found for {zip_path}, will create new cache")
-            
-            # Process files in batches
-            start_process_files_in_batches = time.time()
-            for i in range(0, total_files, BATCH_SIZE):
-                batch = file_list[i:i + BATCH_SIZE]
-                for file_path in batch:
-                    base = os.path.basename(file_path)
-                    if base.startswith("._") or "__MACOSX" in file_path.split(os.sep):
-                        continue
-                    
-                    file_metadata = None
-                    if cached_metadata and 'file_metadata' in cached_metadata:
-                        file_metadata = cached_metadata['file_metadata'].get(file_path)
-                    
-                    # Add to model
-                    self.model.add_file(
-                        file_path,
-                        file_bytes=None,  # Don't read file bytes if we have metadata
-                        zip_path=zip_path,
-                        file_metadata=file_metadata,
-                        zip_manager=zip_manager
-                    )
-                    
-                    processed_files += 1
-                
-                # Update progress less frequently
-                progress = int((processed_files / total_files) * 100)
-                self.progress_update.emit(progress)
-                self.status_update.emit(f"Processed {processed_files}/{total_files} files...")
-                
-                # Process Qt events every batch to keep UI responsive
-                QApplication.processEvents()
-            
-            process_files_in_batches_time = time.time() - start_process_files_in_batches
-            if self.DEBUG:
-                print(f"[DEBUG] Processed {processed_files} files in {process_files_in_batches_time:.2f} seconds")
-            
-            self.status_update.emit(f"Processed {processed_files} files")
-            self.progress_update.emit(100)
-            QTimer.singleShot(1000, lambda: self.progress_update.emit(0))
-            
-        finally:
-            # Re-enable UI updates
-            self.setUpdatesEnabled(True)
-            timing_set_audio_time = time.time() - timing_set_audio_start
-            before_sort_and_rebuild_start = time.time()
-            
-            # Sort and rebuild the tree after loading
-            if resort_after_load:
-                self.sort_groups_and_files()
-                sort_and_rebuild_time = time.time() - before_sort_and_rebuild_start
-                if self.DEBUG:
-                    print(f"[DEBUG] Set audio files in {timing_set_audio_time:.2f} seconds. Sort and rebuild in {sort_and_rebuild_time:.2f} seconds")
-            else:
-                if self.DEBUG:
-                    print(f"[DEBUG] Set audio files in {timing_set_audio_time:.2f} seconds. No sort and rebuild")
+        Args:
+            generation: Load generation the records were prepared for
+            records: List of (file_path, metadata) tuples
+        """
+        self.sender().deleteLater()
+        if generation != self._load_generation or self._current_load is None:
+            return  # The load was abandoned meanwhile
+        if self.DEBUG:
+            print(f"[DEBUG] Prepared {len(records)} records in {time.time() - self._current_load['start_time']:.2f} seconds")
+        self._current_load['records'] = records
+        self._current_load['update_stride'] = max(1, len(records) // self.LOAD_PROGRESS_UPDATES)
+        self._current_load['next_update'] = self._current_load['update_stride']
+        self._load_timer.start()
+    
+    def _process_next_batch(self):
+        """Add the next batch of the current load and schedule the one after."""
+        if self._current_load is None:
+            if self._load_queue:
+                self._start_next_load()
+            return
+        
+        load = self._current_load
+        records = load['records']
+        if records is None:
+            return  # Still being prepared, the worker restarts the timer
+        
+        total_files = len(records)
+        batch = records[load['index']:load['index'] + self.LOAD_BATCH_SIZE]
+        load['index'] += len(batch)
+        
+        # Add the whole batch to the model in one go
+        self.model.add_files_bulk(batch, zip_path=load['zip_path'], zip_manager=load['zip_manager'])
+        
+        if load['index'] >= total_files:
+            self._finish_load(load)
+        elif load['index'] >= load['next_update']:
+            # Only report progress every update_stride files, each update
+            # repaints the status bar
+            stride = load['update_stride']
+            load['next_update'] = (load['index'] // stride + 1) * stride
+            self.progress_update.emit(load['index'] * 100 // total_files)
+            self.status_update.emit(f"Processed {load['index']}/{total_files} files...")
+        
+        # Let the event loop run before the next batch
+        if self.is_loading():
+            self._load_timer.start()
+        else:
+            self._finish_loading()
+    
+    def _finish_load(self, load: Dict[str, Any]):
+        """Report a completed load and sort the tree if it asked for it."""
+        self._current_load = None
+        processed_files = len(load['records'])
+        load_time = time.time() - load['start_time']
+        if self.DEBUG:
+            print(f"[DEBUG] Processed {processed_files} files in {load_time:.2f} seconds")
+        
+        self.status_update.emit(f"Processed {processed_files} files")
+        self.progress_update.emit(100)
+        self._progress_hide_timer.start()
+        
+        # Sort and rebuild the tree after loading
+        if load['resort_after_load']:
+            self._sort_when_loaded = True
+    
+    def _hide_progress(self):
+        """Hide the progress bar once a load has been shown as complete."""
+        self.progress_update.emit(0)
+    
+    def _finish_loading(self):
+        """Run the deferred sort and announce that all loads are done."""
+        if self._sort_when_loaded:
+            self._sort_when_loaded = False
+            self.sort_groups_and_files()
+        self.files_loaded.emit()
     
     def sort_groups_and_files(self):
-        """Sort all folders and files globally and rebuild the tree."""
+        """Sort all folders and files globally and rebuild the tree.
+        
+        While files are still being loaded the sort is deferred until the
+        last batch has been added.
+        """
+        if self.is_loading():
+            self._sort_when_loaded = True
+            return
+        
         # Disable UI updates during sorting
         time_start = time.time()
         self.setUpdatesEnabled(False)
         
         try:
-            # Sort the data model
+            # Sort the data model; folders are exposed without their contents,
+            # which the model fetches when a folder is first expanded
             self.model.sort_files()
-            
-            # Clear the tree
-            self.clear()
-            self.folder_items.clear()
-            self.file_items.clear()
-            
-            # Only add folders initially, without their contents
-            for folder in self.model.get_folders():
-                folder_item = self._add_folder(folder)
-                # Add a placeholder child to make the folder expandable
-                placeholder = QTreeWidgetItem(folder_item)
-                placeholder.setText(0, "Loading...")
-                placeholder.setFlags(Qt.NoItemFlags)  # Make it non-selectable
-                
-                # Update folder name with total file count
-                total_count = len(self.model.get_folder_files(folder))
-                base_name = folder_item.text(0).split(" *%*(")[0]
-                folder_item.setText(0, f"{base_name} *%*({total_count} files)")
+            self._last_selected_index = QModelIndex()
             
         finally:
             # Re-enable UI updates
@@ -866,79 +1038,121 @@ class AudioFileTreeWidget(QTreeWidget):
             time_end = time.time()
             print(f"Sort and rebuild in {time_end - time_start:.2f} seconds")
 
-    def _load_folder_contents(self, folder_item: QTreeWidgetItem):
-        """Load the contents of a folder when it's expanded.
-        
-        Args:
-            folder_item: The folder item to load contents for
-        """
-        # Find the folder path
-        folder_path = None
-        for path, item in self.folder_items.items():
-            if item == folder_item:
-                folder_path = path
-                break
-                
-        if not folder_path:
-            return
-            
-        # Remove the loading placeholder
-        folder_item.removeChild(folder_item.child(0))
-        
-        # Add all files under this folder
-        for file_data in self.model.get_folder_files(folder_path):
-            file_item = self._add_file(folder_path, file_data)
-            # Hide non-matching files if there's a search
-            if self._current_search:
-                matches_search = self._current_search in file_data['path'].lower()
-                file_item.setHidden(not matches_search)
-        
-        # Update folder state
-        self._update_folder_state(folder_path)
-
     def apply_search_filter(self, search_text: str):
-        """Apply search filter to the tree.
+        """Apply search filter to the tree once typing pauses.
+        
+        Keystrokes arriving within SEARCH_DELAY_MS of each other are
+        coalesced into a single filter pass.
         
         Args:
             search_text: Text to filter by
         """
-        self._current_search = search_text.lower()
-        
-        # First, update folder visibility based on whether they have matching children
-        for folder_path, folder_item in self.folder_items.items():
-            matching_count = 0
-            total_count = 0
-            
-            # Count matching and total files
-            for file_data in self.model.get_folder_files(folder_path):
-                total_count += 1
-                if not self._current_search or self._current_search in file_data['path'].lower():
-                    matching_count += 1
+        self._pending_search = search_text
+        self._search_timer.start()
+    
+    def _apply_search_filter_now(self):
+        """Filter the tree by the most recent search text."""
+        # Words are matched separately, extra whitespace is irrelevant
+        self._current_search = " ".join(self._pending_search.lower().split())
+        # Remember which rows the previous search hid, so only rows whose
+        # visibility changes have to be touched below. Order is irrelevant
+        # here, so the folders are not sorted as get_folders() would
+        previous_flags = {folder: self.model.match_flags(folder) for folder in self.model.folder_files}
+        
+        # Count the matches of every folder in a single pass over all files
+        match_counts = self.model.count_matches(self._current_search) if self._current_search else None
+        if match_counts is not None:
+            # Matches are revealed below, fetch every folder before the row
+            # visibility is set. Inserted rows are hidden by the new search
+            # in _handle_rows_inserted, so they agree with the new flags and
+            # only rows whose match changes are touched below.
+            self.model.fetch_all()
+        
+        for folder_row in range(self.model.rowCount()):
+            folder_index = self.model.index(folder_row, 0)
+            folder_path = self.model.folder_at(folder_index)
             
             # Show/hide folder based on search
-            has_matching_children = matching_count > 0
-            folder_item.setHidden(not has_matching_children)
+            self.setRowHidden(folder_row, QModelIndex(),
+                              match_counts is not None and match_counts[folder_path] == 0)
             
-            # Update folder name with counts
-            base_name = folder_item.text(0).split(" *%*(")[0]
-            if self._current_search:
-                folder_item.setText(0, f"{base_name} *%*( {matching_count} / {total_count} files match )")
-            else:
-                folder_item.setText(0, f"{base_name} *%*( {total_count} files )")
+            # Update visibility of the file rows already fetched
+            fetched = self.model.fetched_count(folder_path)
+            old_flags = previous_flags.get(folder_path)
+            new_flags = self.model.match_flags(folder_path) if match_counts is not None else None
+            if old_flags is None and new_flags is None:
+                continue  # Every row is shown and stays shown
+            if any(flags is not None and len(flags) != fetched for flags in (old_flags, new_flags)):
+                # Files were added since the flags were computed
+                for row in range(fetched):
+                    matches_search = not self._current_search or self._file_matches_search(folder_path, row)
+                    self.setRowHidden(row, folder_index, not matches_search)
+                continue
+            # Without a search every row is shown
+            old_flags = repeat(True) if old_flags is None else old_flags
+            new_flags = repeat(True) if new_flags is None else new_flags
+            for row, (old_match, new_match) in enumerate(zip(old_flags, new_flags)):
+                if old_match != new_match:
+                    self.setRowHidden(row, folder_index, not new_match)
+        
+        # Update folder names with counts
+        self.model.set_match_counts(match_counts)
+
+        # Reveal the matching files
+        if self._current_search:
+            self.expand_for_search()
+
+    def expand_all_fast(self, collapse_folders: Optional[List[str]] = None):
+        """Expand the whole tree with a single layout pass.
+        
+        All folders are fetched while still collapsed and expanded with one
+        expandAll() call, instead of fetching and relaying out folder by
+        folder.
         
-        # Then update file visibility based on search
-        for file_path, file_item in self.file_items.items():
-            matches_search = not self._current_search or self._current_search in file_path.lower()
-            file_item.setHidden(not matches_search)
+        Args:
+            collapse_folders: Folders to collapse again afterwards
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.model.fetch_all()
+            self.expandAll()
+            for folder_path in collapse_folders or []:
+                self.collapse(self.model.folder_index(folder_path))
+        finally:
+            self.setUpdatesEnabled(True)
     
+    def expand_for_search(self):
+        """Expand all folders that contain search matches.
+
+        Expands everything in one recursive pass and then collapses the
+        folders without matches, which is much cheaper than expanding
+        folders one by one since each expansion triggers a relayout.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.expandAll()
+            for folder_row in range(self.model.rowCount()):
+                # Folders without matching files are hidden by the filter
+                if self.isRowHidden(folder_row, QModelIndex()):
+                    self.collapse(self.model.index(folder_row, 0))
+        finally:
+            self.setUpdatesEnabled(True)
+
     def clear_all_files(self):
         """Clear all loaded files and reset the tree."""
+        # Abandon loads in progress
+        self._load_timer.stop()
+        self._load_queue.clear()
+        self._current_load = None
+        self._sort_when_loaded = False
+        self._load_generation += 1
+        
         self.model.clear()
-        self.clear()
-        self.folder_items.clear()
-        self.file_items.clear()
-        self._last_selected_item = None
+        self._last_selected_index = QModelIndex()
         self._current_search = ""
+        self._pending_search = ""
+        self._search_timer.stop()
+        self._full_metadata_cache.clear()
     
     def get_checked_files(self) -> List[str]:
         """Get list of checked file paths.
@@ -948,6 +1162,26 @@ class AudioFileTreeWidget(QTreeWidget):
         """
         return self.model.get_checked_files()
     
+    def get_all_files(self) -> List[str]:
+        """Get list of all loaded file paths.
+        
+        Returns:
+            List of file paths
+        """
+        return [file_data['path'] for file_data in self.model.files]
+    
+    def get_selected_file(self) -> Optional[str]:
+        """Get the path of the current file if it is selected.
+        
+        Returns:
+            Path of the selected file, or None if no file is selected
+        """
+        current_index = self.currentIndex()
+        if not self.selectionModel().isSelected(current_index):
+            selected = self.selectionModel().selectedRows(0)
+            current_index = selected[0] if selected else QModelIndex()
+        return self._file_path(current_index)
+    
     def get_file_duration(self, file_path: str) -> int:
         """Get the duration of a file in milliseconds.
         
@@ -957,10 +1191,10 @@ class AudioFileTreeWidget(QTreeWidget):
         Returns:
             Duration in milliseconds, or 0 if not found
         """
-        for file_data in self.model.files:
-            if file_data['path'] == file_path:
-                return file_data['metadata'].get('duration_ms', 0)
-        return 0
+        file_data = self.model.get_file(file_path)
+        if file_data is None:
+            return 0
+        return file_data['metadata'].get('duration_ms', 0)
     
     def get_zip_path(self, file_path: str) -> Optional[str]:
         """Get the ZIP path for a file.
@@ -971,32 +1205,25 @@ class AudioFileTreeWidget(QTreeWidget):
         Returns:
             Path to the ZIP file containing this file, or None if not found
         """
-        for file_data in self.model.files:
-            if file_data['path'] == file_path:
-                return file_data.get('zip_path')
-        return None
+        file_data = self.model.get_file(file_path)
+        if file_data is None:
+            return None
+        return file_data.get('zip_path')
     
     def toggle_current_selection(self):
         """Toggle the checkbox state of all selected items."""
-        selected_items = self.selectedItems()
-        if not selected_items:
+        selected_indexes = self.selectionModel().selectedRows(0)
+        if not selected_indexes:
             return
             
         # Get the state of the first selected item
-        first_item = selected_items[0]
-        if first_item in self.file_items.values():
-            new_state = Qt.Unchecked if first_item.checkState(0) == Qt.Checked else Qt.Checked
+        first_index = selected_indexes[0]
+        if first_index.parent().isValid():
+            new_state = Qt.Unchecked if first_index.data(Qt.CheckStateRole) == Qt.Checked else Qt.Checked
             
-            # Apply the same state to all selected items
-            for item in selected_items:
-                if item in self.file_items.values():  # Only toggle file items
-                    item.setCheckState(0, new_state)
-                    # Update model state
-                    for path, file_item in self.file_items.items():
-                        if file_item == item:
-                            self.model.set_file_checked(path, new_state == Qt.Checked)
-                            # Update parent folder state
-                            folder_path = os.path.dirname(path)
-                            if folder_path in self.folder_items:
-                                self._update_folder_state(folder_path)
-                            break 
\ No newline at end of file
+            # Apply the same state to all selected items; the model
+            # updates the parent folder state and counts once at the end
+            with self.model.quiet_updates():
+                for index in selected_indexes:
+                    if index.parent().isValid():  # Only toggle file items
+                        self.model.setData(index, new_state, Qt.CheckStateRole)
@@ -6,6 +6,21 @@ from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QIcon
 import traceback
 
+def format_time(ms):
+    """Format milliseconds as MM:SS.mmm.
+    
+    Args:
+        ms (int): Time in milliseconds, or None
+        
+    Returns:
+        str: Formatted time string
+    """
+    if ms is None:
+        return "00:00.000"
+    total_seconds, milliseconds = divmod(ms, 1000)
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
 class ControlPanel(QWidget):
     """Control panel widget with playback controls and progress bar."""
     
@@ -28,6 +43,7 @@ class ControlPanel(QWidget):
         self._current_position = 0
         self._current_duration = 0
         self._duration = 0  # For percentage calculations
+        self._duration_str = format_time(0)  # Duration only changes per track
     
     def _init_ui(self):
         """Initialize the user interface."""
@@ -56,7 +72,7 @@ class ControlPanel(QWidget):
         layout.addWidget(self.progress_bar, stretch=2)
 
         # Time label
-        self.time_label = QLabel("00:00 / 00:00")
+        self.time_label = QLabel(f"{format_time(0)} / {format_time(0)}")
         layout.addWidget(self.time_label)
 
         # Volume control (smaller, right-aligned)
@@ -111,12 +127,10 @@ class ControlPanel(QWidget):
         Args:
             value (int): Progress value as percentage (0-100)
         """
-        # Only update if the slider is not being dragged
-        if not self.progress_bar.isSliderDown():
+        # Only update if the slider is not being dragged. The time label is
+        # updated by set_position, which gets the exact position first
+        if not self.progress_bar.isSliderDown() and self.progress_bar.value() != value:
             self.progress_bar.setValue(value)
-            # Calculate actual position in ms based on percentage and stored duration
-            position = int((value / 100.0) * getattr(self, '_duration', 0))
-            self.update_time_label(position=position)
     
     @Slot(str)
     def update_time(self, time_str):
@@ -195,22 +209,16 @@ class ControlPanel(QWidget):
     
     def update_time_label(self, position=None, duration=None):
         """Update the time label with current position and duration."""
+        if duration is not None and duration != self._current_duration:
+            self._current_duration = duration
+            self._duration_str = format_time(duration)
+        elif position is None or position == self._current_position:
+            return  # Nothing shown changed
         if position is not None:
             self._current_position = position
-        if duration is not None:
-            self._current_duration = duration
-            
-        # Format time strings directly without using ms_to_mmss
-        def format_time(ms):
-            if ms is None:
-                return "00:00.000"
-            total_seconds = ms // 1000
-            minutes = total_seconds // 60
-            seconds = total_seconds % 60
-            milliseconds = ms % 1000
-            return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-            
-        self.time_label.setText(f"{format_time(self._current_position)} / {format_time(self._current_duration)}") 
+        
+        # Only the position is formatted on playback ticks
+        self.time_label.setText(f"{format_time(self._current_position)} / {self._duration_str}")
     
     def _handle_progress_bar_click(self, event):
         """Handle clicks on the progress bar track."""
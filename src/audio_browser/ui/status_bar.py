@@ -48,10 +48,14 @@ class StatusBar(QStatusBar):
         Args:
             value (int): Progress value (0-100)
         """
+        # Skip updates that would not change what is shown
+        shown = not self.progress_bar.isHidden()
         if value > 0:
+            if shown and value == self.progress_bar.value():
+                return
             self.progress_bar.setValue(value)
             self.progress_bar.show()
-        else:
+        elif shown:
             self.progress_bar.hide()
     
     @Slot(str)
@@ -1,10 +1,59 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QListWidget, QListWidgetItem
+    QPushButton, QListView
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex, QTimer
+from functools import partial
 import os
 
+class RecentPathsModel(QAbstractListModel):
+    """List model showing recently used paths by name.
+    
+    The paths are kept as given and display data is only computed for the
+    rows a view actually asks for.
+    """
+    
+    def __init__(self, paths, parent=None):
+        """Initialize the model.
+        
+        Args:
+            paths (list): Paths to show, most recent first
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._paths = paths
+        self._names = {}  # Row -> display name, computed on first request
+    
+    def set_paths(self, paths):
+        """Replace the listed paths.
+        
+        Args:
+            paths (list): Paths to show, most recent first
+        """
+        self.beginResetModel()
+        self._paths = paths
+        self._names.clear()
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of paths."""
+        return 0 if parent.isValid() else len(self._paths)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the name of a path for display, or the full path."""
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            name = self._names.get(row)
+            if name is None:
+                # Views ask again on every repaint, parse each path once
+                name = self._names[row] = os.path.basename(self._paths[row])
+            return name
+        if role == Qt.ToolTipRole or role == Qt.UserRole:
+            return self._paths[row]
+        return None
+
 class WelcomeDialog(QDialog):
     """Welcome dialog shown when no file is loaded."""
     
@@ -16,6 +65,8 @@ class WelcomeDialog(QDialog):
     open_library_clicked = Signal()  # Emitted when Open Library button is clicked
     open_folder_clicked = Signal()  # Emitted when Open Folder button is clicked
     
+    LIST_BATCH_SIZE = 50  # Recent list rows laid out per event loop pass
+    
     def __init__(self, recent_files, recent_libraries, recent_folders, parent=None):
         """Initialize the welcome dialog.
         
@@ -28,7 +79,27 @@ class WelcomeDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Welcome to Audio Browser")
         self.setMinimumWidth(400)
-        self._setup_ui(recent_files, recent_libraries, recent_folders)
+        # Parsed once for the dialog, labels pick their rule by object name
+        self.setStyleSheet(
+            "QLabel#welcomeTitle { font-size: 16px; font-weight: bold; }"
+            "QLabel#sectionTitle { font-weight: bold; }"
+        )
+        # The contents are built when the dialog is first shown
+        self._recent_files = recent_files
+        self._recent_libraries = recent_libraries
+        self._recent_folders = recent_folders
+        self._ui_built = False
+    
+    def setVisible(self, visible):
+        """Build the contents right before the dialog is shown for the first time.
+        
+        Done here rather than in showEvent() so the contents exist when Qt
+        sizes the dialog and centers it over its parent.
+        """
+        if visible and not self._ui_built:
+            self._ui_built = True
+            self._setup_ui(self._recent_files, self._recent_libraries, self._recent_folders)
+        super().setVisible(visible)
         
     def _setup_ui(self, recent_files, recent_libraries, recent_folders):
         """Set up the user interface.
@@ -42,7 +113,7 @@ class WelcomeDialog(QDialog):
         
         # Welcome message
         welcome_label = QLabel("Welcome to Audio Browser!")
-        welcome_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        welcome_label.setObjectName("welcomeTitle")
         layout.addWidget(welcome_label)
         
         # Description
@@ -53,79 +124,21 @@ class WelcomeDialog(QDialog):
         desc_label.setWordWrap(True)
         layout.addWidget(desc_label)
         
-        # Recent files section
-        if recent_files:
-            layout.addSpacing(10)
-            recent_label = QLabel("Recent Files:")
-            recent_label.setStyleSheet("font-weight: bold;")
-            layout.addWidget(recent_label)
-            
-            self.recent_files_list = QListWidget()
-            for file_path in recent_files:
-                item = QListWidgetItem(os.path.basename(file_path))
-                item.setToolTip(file_path)
-                item.setData(Qt.UserRole, file_path)
-                self.recent_files_list.addItem(item)
-            
-            self.recent_files_list.itemDoubleClicked.connect(self._handle_recent_file)
-            layout.addWidget(self.recent_files_list)
-        
-        # Recent libraries section
-        if recent_libraries:
-            layout.addSpacing(10)
-            libraries_label = QLabel("Recent Libraries:")
-            libraries_label.setStyleSheet("font-weight: bold;")
-            layout.addWidget(libraries_label)
-            
-            self.recent_libraries_list = QListWidget()
-            for file_path in recent_libraries:
-                item = QListWidgetItem(os.path.basename(file_path))
-                item.setToolTip(file_path)
-                item.setData(Qt.UserRole, file_path)
-                self.recent_libraries_list.addItem(item)
-            
-            self.recent_libraries_list.itemDoubleClicked.connect(self._handle_recent_library)
-            layout.addWidget(self.recent_libraries_list)
-        
-        # Recent folders section
-        if recent_folders:
-            layout.addSpacing(10)
-            folders_label = QLabel("Recent Folders:")
-            folders_label.setStyleSheet("font-weight: bold;")
-            layout.addWidget(folders_label)
-            
-            self.recent_folders_list = QListWidget()
-            for folder_path in recent_folders:
-                item = QListWidgetItem(os.path.basename(folder_path))
-                item.setToolTip(folder_path)
-                item.setData(Qt.UserRole, folder_path)
-                self.recent_folders_list.addItem(item)
-            
-            self.recent_folders_list.itemDoubleClicked.connect(self._handle_recent_folder)
-            layout.addWidget(self.recent_folders_list)
-        
-        # Show message if no recent items
-        if not (recent_files or recent_libraries or recent_folders):
-            no_recent_label = QLabel("No recent items")
-            layout.addWidget(no_recent_label)
+        # Recent items sections, kept in their own layout so they can be
+        # replaced by set_recents()
+        self._recent_layout = QVBoxLayout()
+        layout.addLayout(self._recent_layout)
+        self._populate_recents(recent_files, recent_libraries, recent_folders)
         
         # Buttons
         button_layout = QHBoxLayout()
         
-        # Open ZIP button
-        open_zip_button = QPushButton("Open ZIP File")
-        open_zip_button.clicked.connect(self._handle_open_zip)
-        button_layout.addWidget(open_zip_button)
-        
-        # Open Library button
-        open_library_button = QPushButton("Open Library")
-        open_library_button.clicked.connect(self._handle_open_library)
-        button_layout.addWidget(open_library_button)
-        
-        # Open Folder button
-        open_folder_button = QPushButton("Open Folder")
-        open_folder_button.clicked.connect(self._handle_open_folder)
-        button_layout.addWidget(open_folder_button)
+        for text, signal in (("Open ZIP File", self.open_zip_clicked),
+                             ("Open Library", self.open_library_clicked),
+                             ("Open Folder", self.open_folder_clicked)):
+            button = QPushButton(text)
+            button.clicked.connect(partial(self._emit_and_accept, signal), Qt.DirectConnection)
+            button_layout.addWidget(button)
         
         layout.addLayout(button_layout)
         
@@ -137,47 +150,96 @@ class WelcomeDialog(QDialog):
         close_layout.addWidget(close_button)
         layout.addLayout(close_layout)
     
-    def _handle_recent_file(self, item):
-        """Handle selection of a recent file.
+    def _populate_recents(self, recent_files, recent_libraries, recent_folders):
+        """Add the recent items sections, or a note that there are none.
         
         Args:
-            item: The selected list item
+            recent_files (list): List of recent file paths
+            recent_libraries (list): List of recent library paths
+            recent_folders (list): List of recent folder paths
         """
-        file_path = item.data(Qt.UserRole)
-        self.recent_file_selected.emit(file_path)
-        self.accept()
+        self._recent_models = []
+        for title, paths, signal in (("Recent Files:", recent_files, self.recent_file_selected),
+                                     ("Recent Libraries:", recent_libraries, self.recent_library_selected),
+                                     ("Recent Folders:", recent_folders, self.recent_folder_selected)):
+            if paths:
+                self._recent_models.append(self._build_recent_section(self._recent_layout, title, paths, signal))
+        
+        # Show message if no recent items, no section was added
+        if not self._recent_models:
+            no_recent_label = QLabel("No recent items")
+            self._recent_layout.addWidget(no_recent_label)
     
-    def _handle_recent_library(self, item):
-        """Handle selection of a recent library.
+    def set_recents(self, recent_files, recent_libraries, recent_folders):
+        """Update the recent items so the dialog can be shown again.
+        
+        The existing list views are kept and only their models are reset,
+        unless sections have to be added or removed.
         
         Args:
-            item: The selected list item
+            recent_files (list): List of recent file paths
+            recent_libraries (list): List of recent library paths
+            recent_folders (list): List of recent folder paths
         """
-        file_path = item.data(Qt.UserRole)
-        self.recent_library_selected.emit(file_path)
-        self.accept()
+        previous = (self._recent_files, self._recent_libraries, self._recent_folders)
+        current = (recent_files, recent_libraries, recent_folders)
+        self._recent_files, self._recent_libraries, self._recent_folders = current
+        if not self._ui_built:
+            return
+        
+        if [bool(paths) for paths in previous] == [bool(paths) for paths in current]:
+            for model, paths in zip(self._recent_models, [paths for paths in current if paths]):
+                model.set_paths(paths)
+            return
+        
+        # Sections appear or disappear, rebuild them
+        while self._recent_layout.count():
+            widget = self._recent_layout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        self._populate_recents(*current)
     
-    def _handle_recent_folder(self, item):
-        """Handle selection of a recent folder.
+    def _build_recent_section(self, layout, title, paths, signal):
+        """Add a titled list of recent paths to the dialog.
         
         Args:
-            item: The selected list item
+            layout: Layout to add the section to
+            title (str): Title shown above the list
+            paths (list): Recent paths to list, not empty
+            signal: Signal emitted with the path of a double-clicked row
+            
+        Returns:
+            RecentPathsModel: Model of the section's list
         """
-        folder_path = item.data(Qt.UserRole)
-        self.recent_folder_selected.emit(folder_path)
-        self.accept()
+        layout.addSpacing(10)
+        title_label = QLabel(title)
+        title_label.setObjectName("sectionTitle")
+        layout.addWidget(title_label)
+        
+        view = QListView()
+        view.setUniformItemSizes(True)
+        # Long lists are laid out a batch per event loop pass, so the
+        # dialog paints before every row has been positioned
+        view.setLayoutMode(QListView.Batched)
+        view.setBatchSize(self.LIST_BATCH_SIZE)
+        model = RecentPathsModel(paths, view)
+        view.setModel(model)
+        # Sender and receiver both live in the GUI thread
+        view.doubleClicked.connect(partial(self._emit_and_accept, signal), Qt.DirectConnection)
+        layout.addWidget(view)
+        return model
     
-    def _handle_open_zip(self):
-        """Handle clicking the Open ZIP File button."""
-        self.open_zip_clicked.emit()
-        self.accept()
+    def _emit_and_accept(self, signal, index=None):
+        """Handle a double-clicked recent item or a clicked Open button.
         
-    def _handle_open_library(self):
-        """Handle clicking the Open Library button."""
-        self.open_library_clicked.emit()
+        Args:
+            signal: Signal to emit
+            index: Model index of the double-clicked row, whose path is
+                emitted, or None for a button
+        """
+        # Read the path now, the model may be reset once the dialog closes
+        args = (index.data(Qt.UserRole),) if isinstance(index, QModelIndex) else ()
+        # Close the dialog first and emit on the next event loop pass, so
+        # opening the selection does not run with the dialog still painted
         self.accept()
-        
-    def _handle_open_folder(self):
-        """Handle clicking the Open Folder button."""
-        self.open_folder_clicked.emit()
-        self.accept() 
\ No newline at end of file
+        QTimer.singleShot(0, partial(signal.emit, *args))
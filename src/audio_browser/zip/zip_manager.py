@@ -1,16 +1,60 @@
 import os
+import sys
+import mmap
+import struct
 import zipfile
 import tempfile
 import shutil
 import logging
-from pathlib import Path
 from typing import List, Optional, Callable, Dict, Tuple
-from PySide6.QtWidgets import QApplication
 import time
+import threading
 import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from audio_browser.cache.cache_manager import CacheManager
 
+def _folder_file_sort_key(name: str) -> Tuple[str, str, str]:
+    """Sort key ordering ZIP entries by folder, then by filename, ignoring case.
+    
+    The folder itself is part of the key so folders whose names only differ
+    in case are not interleaved.
+    """
+    slash = name.rfind('/')
+    folder = name[:max(slash, 0)]
+    return folder.lower(), folder, name[slash + 1:].lower()
+
+class _MappedFile:
+    """Read-only file object over a memory map of a whole file.
+    
+    ZipFile reads headers and entries with many small seek and read calls,
+    which are served from the page cache here instead of costing a system
+    call each. The map itself lacks the seekable() that ZipFile needs.
+    The file is unmapped once the ZipFile and its open entries are gone.
+    """
+    
+    def __init__(self, path: str):
+        """Map a file into memory.
+        
+        Args:
+            path: Path to the file
+            
+        Raises:
+            OSError: If the file cannot be opened or mapped
+            ValueError: If the file is empty
+        """
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.name = path  # Used by ZipFile as its filename
+        self.read = self._map.read
+        self.seek = self._map.seek
+        self.tell = self._map.tell
+    
+    def seekable(self) -> bool:
+        """Return True, a memory map supports random access."""
+        return True
+
 class ZipManager:
     """Manages ZIP file operations for audio files."""
     
@@ -19,13 +63,116 @@ class ZipManager:
     
     DEBUG = False
     
+    # Threads reading file metadata when a ZIP is loaded. Decompression and
+    # file reads release the GIL, so headers of several files are read at once.
+    METADATA_WORKERS = min(8, os.cpu_count() or 4)
+    
+    # Whether load_zip reads every file's duration. Off, durations are read
+    # when their rows come into view, so large ZIPs load without decoding
+    # the header of each file first.
+    READ_DURATIONS_ON_LOAD = False
+    
+    # Number of ZIPs kept open, each holds the ZipInfo of all its entries
+    MAX_OPEN_ZIPS = 8
+    
+    # Whether ZIPs are read through a memory map. Only where the address
+    # space is large enough to map big archives.
+    USE_MMAP = sys.maxsize > 2 ** 32
+    
+    # Threads extracting files in extract_files(), for the same reason
+    EXTRACT_WORKERS = METADATA_WORKERS
+    
+    # Bytes copied per read when extracting. Far fewer read() calls on the
+    # ZIP entry than shutil's default for multi-MB audio files.
+    COPY_BUFFER_SIZE = 1024 * 1024
+    
+    # Bytes read from a WAV file before trying to parse its header
+    WAV_HEADER_PROBE_SIZE = 64 * 1024
+    
+    # Bytes read from the start and the end of an Ogg file stored without
+    # compression. Ogg pages are at most 64 KB, so the end holds the last one.
+    OGG_HEAD_SIZE = 4 * 1024
+    OGG_TAIL_SIZE = 64 * 1024
+    
+    # MPEG audio bitrates in kbit/s by (MPEG 1 or 2, layer), indexed by the
+    # frame header's bitrate bits. MPEG 2.5 uses the MPEG 2 tables.
+    MP3_BITRATES = {
+        (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+        (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+        (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+        (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+        (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+        (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    }
+    
+    # MPEG audio sample rates by version bits of the frame header (1 is reserved)
+    MP3_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+    
+    # Seconds between saves of the metadata read so far while loading a ZIP
+    PARTIAL_SAVE_INTERVAL = 5.0
+    
+    # Seconds to wait for more metadata updates before the cache is written
+    CACHE_FLUSH_DELAY = 0.5
+    
+    # Minimum seconds between progress updates that are neither the start nor
+    # the end of a step. Each update processes pending UI events.
+    PROGRESS_INTERVAL = 0.05
+    
     def __init__(self):
         """Initialize the ZipManager."""
-        self.open_zips: Dict[str, zipfile.ZipFile] = {}  # Map of zip_path -> ZipFile
+        # Map of zip_path -> ZipFile, least recently used first
+        self.open_zips: "OrderedDict[str, zipfile.ZipFile]" = OrderedDict()
+        # ZIPs opened and not closed, in the order they were opened. Includes
+        # ZIPs whose handle was evicted, they are reopened when used again.
+        self._zip_paths: Dict[str, None] = {}
         self.temp_dir = tempfile.TemporaryDirectory()
         self.extracted_files: List[str] = []
         self._progress_callback: Optional[Callable[[str, int], None]] = None
+        self._last_progress_time = 0.0
         self.cache_manager = CacheManager()
+        # Metadata updated since the cache was last written, by ZIP path
+        self._dirty_metadata: Dict[str, dict] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        # Durations are read on many threads at once. Cached metadata is
+        # changed and written only while holding this lock, so no update is
+        # lost and no dict changes while it is pickled.
+        self._flush_lock = threading.Lock()
+        # ZIPs are loaded on a pool thread while the GUI thread reads from
+        # other ZIPs, so changes to open_zips are serialized by this lock
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def is_system_file(name: str) -> bool:
+        """Check whether a ZIP entry is macOS metadata rather than a real file.
+        
+        ZIP entry names always use '/' separators, so plain substring tests
+        are enough and no list is allocated per entry.
+        
+        Args:
+            name: Name of the entry in the ZIP
+            
+        Returns:
+            True for AppleDouble '._' files and anything inside '__MACOSX'
+        """
+        return (name[name.rfind('/') + 1:].startswith('._')
+                or name.startswith('__MACOSX/') or '/__MACOSX/' in name)
+    
+    @classmethod
+    def is_audio_file(cls, name: str) -> bool:
+        """Check whether a ZIP entry has a supported audio extension.
+        
+        Same result as Path(name).suffix.lower() in AUDIO_EXTENSIONS for
+        file entries, without building a path object per entry.
+        
+        Args:
+            name: Name of the entry in the ZIP
+            
+        Returns:
+            True if the entry's extension is one of AUDIO_EXTENSIONS
+        """
+        dot = name.rfind('.')
+        # A dot in a folder name or starting the filename is not a suffix
+        return dot > name.rfind('/') + 1 and name[dot:].lower() in cls.AUDIO_EXTENSIONS
     
     def set_progress_callback(self, callback: Callable[[str, int], None]):
         """Set a callback function for progress updates.
@@ -36,13 +183,16 @@ class ZipManager:
         self._progress_callback = callback
     
     def _update_progress(self, status: str, progress: int):
-        """Update progress if callback is set."""
+        """Update progress if callback is set, at most every PROGRESS_INTERVAL seconds."""
         if self._progress_callback:
+            now = time.monotonic()
+            if 0 < progress < 100 and now - self._last_progress_time < self.PROGRESS_INTERVAL:
+                return
+            self._last_progress_time = now
             self._progress_callback(status, progress)
-            QApplication.processEvents()  # Force UI update
     
     def _validate_zip(self, zip_path: str) -> Tuple[Optional[str], Optional[zipfile.ZipFile]]:
-        """Validate ZIP file integrity with progress reporting.
+        """Open a ZIP file, validating its structure.
         
         Args:
             zip_path: Path to the ZIP file
@@ -51,28 +201,9 @@ class ZipManager:
             Tuple of (error message if invalid, ZipFile object if valid)
         """
         try:
-            # Quick validation of ZIP structure
-            zip_file = zipfile.ZipFile(zip_path, 'r')
-            
-            # Just check if we can read the central directory
-            try:    
-                # Get list of audio files
-                audio_files = [
-                    zinfo for zinfo in zip_file.filelist
-                    if Path(zinfo.filename).suffix.lower() in self.AUDIO_EXTENSIONS
-                ]
-                
-                if not audio_files:
-                    self._update_progress("No audio files found in ZIP", 100)
-                    return "No audio files found", None
-                
-                self._update_progress(f"Found {len(audio_files)} audio files", 100)
-                
-            except Exception as e:
-                return f"Could not read ZIP directory: {e}", None
-            
-            return None, zip_file
-                
+            # Opening reads the whole central directory, so a ZIP that opens
+            # can be listed
+            return None, self._open_zip_file(zip_path)
         except zipfile.BadZipFile as e:
             logging.error(f"Invalid ZIP file: {e}")
             return "ZIP file is invalid", None
@@ -129,73 +260,99 @@ class ZipManager:
             self._update_progress("Opening and validating ZIP file...", 0)
             open_start = time.time()
             
-            # Check if ZIP is already open
-            if zip_path in self.open_zips:
-                self._update_progress("ZIP file already loaded", 100)
-                return {'total_time': 0, 'used_cache': True, 'steps': {'opening': 0}}
-            
-            # Validate and get the ZipFile object in one step
+            # Validate and get the ZipFile object in one step, reusing a
+            # handle opened by an earlier call
             validate_start = time.time()
-            error, zip_file = self._validate_zip(zip_path)
-            if error:
-                raise ValueError(error)
-            
-            # Store the validated ZipFile object
-            self.open_zips[zip_path] = zip_file
+            zip_file = self.open_zips.get(zip_path)
+            if zip_file is None:
+                error, zip_file = self._validate_zip(zip_path)
+                if error:
+                    raise ValueError(error)
             
             validate_time = time.time() - validate_start
             timing_info['steps']['validation'] = validate_time
             if self.DEBUG: print(f"[DEBUG] ZIP validation took {validate_time:.2f} seconds")
             
-            # Get list of audio files (already sorted)
+            # Get list of audio files (already sorted), scanned from the handle
+            # just opened as the cache was found to be missing
             list_start = time.time()
-            audio_files = self.list_audio_files(zip_path)
+            audio_files = self._scan_audio_files(zip_file)
+            if not audio_files:
+                if zip_path not in self.open_zips:
+                    zip_file.close()
+                self._update_progress("No audio files found in ZIP", 100)
+                raise ValueError("No audio files found")
+            
+            # Store the validated ZipFile object
+            self._store_open_zip(zip_path, zip_file)
             list_time = time.time() - list_start
             timing_info['steps']['listing'] = list_time
             if self.DEBUG: print(f"[DEBUG] Listing audio files took {list_time:.2f} seconds")
             
-            # Extract metadata for each audio file
+            # Extract metadata for each audio file, continuing from what an
+            # earlier load saved before it was interrupted
             metadata_start = time.time()
-            file_metadata = {}
+            file_metadata = self.cache_manager.get_partial_metadata(zip_path)
+            remaining_files = [file_path for file_path in audio_files if file_path not in file_metadata]
             total_files = len(audio_files)
+            if self.DEBUG and file_metadata: print(f"[DEBUG] Continuing with {len(file_metadata)} files read by an earlier load")
             
-            # Process files in batches for better performance
+            # Without durations everything comes from the ZipInfo objects,
+            # no file is opened
+            if not self.READ_DURATIONS_ON_LOAD:
+                name_to_info = zip_file.NameToInfo
+                for file_path in remaining_files:
+                    zip_info = name_to_info[file_path]
+                    file_metadata[file_path] = {'size': zip_info.file_size, 'timestamp': zip_info.date_time}
+                remaining_files = []
+                self._update_progress(f"Extracting metadata ({total_files}/{total_files})...", 100)
+            
+            # Read files on worker threads, progress is reported from this
+            # thread once per batch of finished files. The workers share the
+            # open ZipFile, entries opened from it read through a locked
+            # shared file handle.
             BATCH_SIZE = 50
-            for i in range(0, total_files, BATCH_SIZE):
-                batch = audio_files[i:i + BATCH_SIZE]
-                for file_path in batch:
+            last_save = time.time()
+            with ThreadPoolExecutor(max_workers=self.METADATA_WORKERS) as executor:
+                # The ZipInfo objects are looked up once here rather than
+                # with getinfo() in every task, and the methods used for
+                # every file are bound once outside the comprehension
+                name_to_info = zip_file.NameToInfo
+                submit = executor.submit
+                read_metadata = self._read_file_metadata
+                futures = {submit(read_metadata, zip_file, name_to_info[file_path]): file_path
+                           for file_path in remaining_files}
+                for done, future in enumerate(as_completed(futures), total_files - len(remaining_files) + 1):
+                    file_path = futures[future]
                     try:
-                        # Get basic metadata from ZIP info without reading the file
-                        zip_info = self.open_zips[zip_path].getinfo(file_path)
-                        file_metadata[file_path] = {
-                            'size': zip_info.file_size,
-                            'timestamp': zip_info.date_time
-                        }
-                        
-                        # Get duration for the file
-                        duration = self.get_audio_duration(zip_path, file_path)
-                        if duration is not None:
-                            file_metadata[file_path]['duration_ms'] = duration
-                            
+                        file_metadata[file_path] = future.result()
                     except Exception as e:
                         logging.warning(f"Failed to get metadata for {file_path}: {e}")
-                        continue
-                
-                # Update progress for batch
-                progress = int((i + len(batch)) / total_files * 100)
-                self._update_progress(f"Extracting metadata ({i + len(batch)}/{total_files})...", progress)
+                    
+                    # Update progress for batch
+                    if done % BATCH_SIZE == 0 or done == total_files:
+                        progress = int(done / total_files * 100)
+                        self._update_progress(f"Extracting metadata ({done}/{total_files})...", progress)
+                        # Save progress now and then, so a crash does not
+                        # lose the files read so far
+                        if time.time() - last_save >= self.PARTIAL_SAVE_INTERVAL and done < total_files:
+                            self.cache_manager.save_partial_metadata(zip_path, file_metadata)
+                            last_save = time.time()
             
             metadata_time = time.time() - metadata_start
             timing_info['steps']['metadata'] = metadata_time
             if self.DEBUG: print(f"[DEBUG] Extracting metadata took {metadata_time:.2f} seconds")
             
-            # Cache the metadata with durations
+            # Cache the metadata with durations, replacing pending updates
+            # to an outdated cache
             cache_write_start = time.time()
-            self.cache_manager.cache_metadata(zip_path, {
-                'audio_files': audio_files,  # Already sorted
-                'total_files': len(self.open_zips[zip_path].filelist),
-                'file_metadata': file_metadata
-            })
+            with self._flush_lock:
+                self._dirty_metadata.pop(zip_path, None)
+                self.cache_manager.cache_metadata(zip_path, {
+                    'audio_files': audio_files,  # Already sorted
+                    'total_files': len(zip_file.filelist),
+                    'file_metadata': file_metadata
+                })
             cache_write_time = time.time() - cache_write_start
             timing_info['steps']['cache_write'] = cache_write_time
             if self.DEBUG: print(f"[DEBUG] Writing cache took {cache_write_time:.2f} seconds")
@@ -239,56 +396,139 @@ class ZipManager:
             return cached_metadata['audio_files']
         
         # If no cache, ensure ZIP is open and get files
-        self._ensure_zip_open(zip_path)
+        return self._scan_audio_files(self._ensure_zip_open(zip_path))
+    
+    def _scan_audio_files(self, zip_file: zipfile.ZipFile, report_progress: bool = True) -> List[str]:
+        """
+        List the audio files of an open ZIP from its central directory.
         
-        self._update_progress("Scanning for audio files...", 0)
-        all_files = self.open_zips[zip_path].namelist()
-        total_files = len(all_files)
+        Args:
+            zip_file: Open ZIP file
+            report_progress: Whether to report the scan to the progress callback
+            
+        Returns:
+            List of audio file names in the ZIP, sorted by folder and filename
+        """
+        if report_progress:
+            self._update_progress("Scanning for audio files...", 0)
         
-        # Group files by folder for better organization
-        files_by_folder = {}
-        for name in all_files:
-            # Skip system files
-            if name.startswith('__MACOSX') or name.startswith('._'):
-                continue
-                
-            if Path(name).suffix.lower() in self.AUDIO_EXTENSIONS:
-                folder = os.path.dirname(name)
-                if folder not in files_by_folder:
-                    files_by_folder[folder] = []
-                files_by_folder[folder].append(name)
-        
-        # Sort folders and files within folders
-        sorted_folders = sorted(files_by_folder.keys(), key=str.lower)
-        audio_files = []
-        
-        # Add files in sorted order
-        for folder in sorted_folders:
-            # Sort files within each folder
-            files_by_folder[folder].sort(key=lambda x: os.path.basename(x).lower())
-            audio_files.extend(files_by_folder[folder])
-        
-        self._update_progress(f"Found {len(audio_files)} audio files", 100)
+        # Check the extension first, it rules out most entries. Skip system files.
+        audio_files = [name for name in zip_file.NameToInfo
+                       if self.is_audio_file(name) and not self.is_system_file(name)]
+        
+        # Sort by folder and by filename within folders in one pass
+        audio_files.sort(key=_folder_file_sort_key)
+        
+        if report_progress:
+            self._update_progress(f"Found {len(audio_files)} audio files", 100)
         return audio_files
     
-    def _ensure_zip_open(self, zip_path: str):
+    def _open_zip_file(self, zip_path: str) -> zipfile.ZipFile:
+        """Open a ZIP file for reading, through a memory map where possible.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            
+        Returns:
+            Open ZipFile
+            
+        Raises:
+            zipfile.BadZipFile: If the file is not a valid ZIP file
+            OSError: If the file cannot be opened
+        """
+        if self.USE_MMAP:
+            try:
+                return zipfile.ZipFile(_MappedFile(zip_path), 'r')
+            except (OSError, ValueError):
+                pass  # Empty files and some file systems cannot be mapped
+        return zipfile.ZipFile(zip_path, 'r')
+    
+    def _ensure_zip_open(self, zip_path: str) -> zipfile.ZipFile:
         """Ensure a ZIP file is open, opening it if necessary.
         
         Args:
             zip_path: Path to the ZIP file
             
+        Returns:
+            Open ZipFile. Use it rather than looking it up in open_zips again,
+            a load on another thread may have closed it since.
+            
         Raises:
             ValueError: If the file is not a valid ZIP file
             FileNotFoundError: If the file doesn't exist
         """
-        if zip_path not in self.open_zips:
+        with self._lock:
+            zip_file = self.open_zips.get(zip_path)
+            if zip_file is not None:
+                self.open_zips.move_to_end(zip_path)
+                return zip_file
+            
             if not os.path.exists(zip_path):
                 raise FileNotFoundError(f"ZIP file not found: {zip_path}")
             
             try:
-                self.open_zips[zip_path] = zipfile.ZipFile(zip_path, 'r')
+                zip_file = self._open_zip_file(zip_path)
             except zipfile.BadZipFile:
                 raise ValueError(f"Invalid ZIP file: {zip_path}")
+            self._store_open_zip(zip_path, zip_file)
+            return zip_file
+    
+    def _store_open_zip(self, zip_path: str, zip_file: zipfile.ZipFile):
+        """Keep a ZIP open, closing the least recently used ones beyond MAX_OPEN_ZIPS.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            zip_file: Open ZipFile
+        """
+        with self._lock:
+            self.open_zips[zip_path] = zip_file
+            self.open_zips.move_to_end(zip_path)
+            self._zip_paths[zip_path] = None
+            while len(self.open_zips) > self.MAX_OPEN_ZIPS:
+                self.evict_lru()
+    
+    def evict_lru(self) -> Optional[str]:
+        """Close the handle of the least recently used ZIP to free its memory.
+        
+        The ZIP stays in get_open_zips() and is reopened when it is used again.
+        
+        Returns:
+            Path of the ZIP whose handle was closed, or None if no ZIP is open
+        """
+        with self._lock:
+            if not self.open_zips:
+                return None
+            zip_path, zip_file = self.open_zips.popitem(last=False)
+        if self.DEBUG: print(f"[DEBUG] Closing least recently used ZIP: {zip_path}")
+        try:
+            zip_file.close()
+        except Exception:
+            pass
+        return zip_path
+    
+    def _get_zip_info(self, zip_path: str, file_name: str) -> Tuple[zipfile.ZipFile, zipfile.ZipInfo]:
+        """Get the ZIP info of a file, opening the ZIP if necessary.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            file_name: Name of the file in the ZIP
+            
+        Returns:
+            Tuple of (open ZipFile, ZipInfo of the file)
+            
+        Raises:
+            ValueError: If the file is not a valid ZIP file
+            FileNotFoundError: If the ZIP file doesn't exist
+            KeyError: If the file doesn't exist in the ZIP
+        """
+        zip_file = self._ensure_zip_open(zip_path)
+        
+        # NameToInfo is the dict getinfo() looks names up in, testing against
+        # namelist() would build a list of every name in the ZIP each time
+        zip_info = zip_file.NameToInfo.get(file_name)
+        if zip_info is None:
+            raise KeyError(f"File not found in ZIP: {file_name}")
+        return zip_file, zip_info
     
     def read_file(self, zip_path: str, file_name: str) -> bytes:
         """
@@ -306,25 +546,23 @@ class ZipManager:
             KeyError: If the file doesn't exist in the ZIP
             OSError: If file reading fails
         """
-        self._ensure_zip_open(zip_path)
-        
-        if file_name not in self.open_zips[zip_path].namelist():
-            raise KeyError(f"File not found in ZIP: {file_name}")
+        zip_file, zip_info = self._get_zip_info(zip_path, file_name)
         
         try:
-            with self.open_zips[zip_path].open(file_name) as file:
+            with zip_file.open(zip_info) as file:
                 return file.read()
         except Exception as e:
             raise OSError(f"Error reading file {file_name}: {str(e)}")
     
-    def stream_file(self, zip_path: str, file_name: str, chunk_size: int = 8192):
+    def stream_file(self, zip_path: str, file_name: str, chunk_size: int = 64 * 1024):
         """
         Stream a file from a ZIP archive without extracting it.
         
         Args:
             zip_path: Path to the ZIP file
             file_name: Name of the file to stream
-            chunk_size: Size of each chunk to yield
+            chunk_size: Size of each chunk to yield. Defaults to 64 KB, smaller
+                chunks mostly add per-read overhead in zipfile and zlib
             
         Yields:
             Chunks of file data
@@ -333,18 +571,41 @@ class ZipManager:
             RuntimeError: If the ZIP file is not loaded
             KeyError: If the file doesn't exist in the ZIP
         """
-        self._ensure_zip_open(zip_path)
+        zip_file, zip_info = self._get_zip_info(zip_path, file_name)
         
-        if file_name not in self.open_zips[zip_path].namelist():
-            raise KeyError(f"File not found in ZIP: {file_name}")
-        
-        with self.open_zips[zip_path].open(file_name) as file:
+        with zip_file.open(zip_info) as file:
             while True:
                 chunk = file.read(chunk_size)
                 if not chunk:
                     break
                 yield chunk
     
+    def stream_file_into(self, zip_path: str, file_name: str, target, chunk_size: int = 64 * 1024) -> int:
+        """
+        Write a file from a ZIP archive into a writable file object.
+        
+        Unlike stream_file() no chunk is handed back to the caller, so
+        the caller can reuse one buffer such as an io.BytesIO.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            file_name: Name of the file to stream
+            target: Object with a write() method receiving the file data
+            chunk_size: Size of each read from the ZIP
+            
+        Returns:
+            Number of bytes written
+            
+        Raises:
+            RuntimeError: If the ZIP file is not loaded
+            KeyError: If the file doesn't exist in the ZIP
+        """
+        zip_file, zip_info = self._get_zip_info(zip_path, file_name)
+        
+        with zip_file.open(zip_info) as file:
+            shutil.copyfileobj(file, target, chunk_size)
+        return zip_info.file_size
+    
     def extract_file(self, zip_path: str, file_name: str, output_dir: str) -> str:
         """
         Extract a single file from a ZIP.
@@ -362,10 +623,7 @@ class ZipManager:
             KeyError: If the file doesn't exist in the ZIP
             OSError: If file extraction fails
         """
-        self._ensure_zip_open(zip_path)
-        
-        if file_name not in self.open_zips[zip_path].namelist():
-            raise KeyError(f"File not found in ZIP: {file_name}")
+        zip_file, zip_info = self._get_zip_info(zip_path, file_name)
         
         try:
             # Get just the filename without any directory structure
@@ -375,9 +633,9 @@ class ZipManager:
             logging.info(f"Extracting {file_name} to {output_path}")
             
             # Extract the file
-            with self.open_zips[zip_path].open(file_name) as source:
+            with zip_file.open(zip_info) as source:
                 with open(output_path, 'wb') as target:
-                    shutil.copyfileobj(source, target)
+                    shutil.copyfileobj(source, target, self.COPY_BUFFER_SIZE)
             
             # Verify the file was extracted successfully
             if not os.path.exists(output_path):
@@ -410,27 +668,139 @@ class ZipManager:
             KeyError: If any file doesn't exist in the ZIP
         """
         logging.info(f"Starting batch extraction of {len(file_names)} files to {output_dir}")
-        extracted_paths = []
+        # Open the ZIP before the workers start, they share its handle
+        self._ensure_zip_open(zip_path)
         
-        for i, name in enumerate(file_names):
-            try:
-                path = self.extract_file(zip_path, name, output_dir)
-                extracted_paths.append(path)
-                logging.info(f"Progress: {i+1}/{len(file_names)} files extracted")
-            except Exception as e:
-                logging.error(f"Failed to extract {name}: {str(e)}", exc_info=True)
-                raise
+        # Files are written under their base name, so a later file with the
+        # same name replaces an earlier one. Only the last one is extracted,
+        # no two workers may write the same path.
+        last_by_name = {os.path.basename(name): name for name in file_names}
+        
+        extracted = {}
+        with ThreadPoolExecutor(max_workers=self.EXTRACT_WORKERS) as executor:
+            futures = {name: executor.submit(self.extract_file, zip_path, name, output_dir)
+                       for name in last_by_name.values()}
+            for i, (name, future) in enumerate(futures.items()):
+                try:
+                    extracted[name] = future.result()
+                    logging.info(f"Progress: {i+1}/{len(futures)} files extracted")
+                except Exception as e:
+                    logging.error(f"Failed to extract {name}: {str(e)}", exc_info=True)
+                    for pending in futures.values():
+                        pending.cancel()
+                    raise
         
+        extracted_paths = [extracted[last_by_name[os.path.basename(name)]] for name in file_names]
         logging.info(f"Completed batch extraction. Successfully extracted {len(extracted_paths)} files")
         return extracted_paths
     
+    def _new_cached_metadata(self, zip_path: str) -> dict:
+        """Build the metadata cached for a ZIP without file metadata.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            
+        Returns:
+            Dictionary with the ZIP's audio files and total number of files
+        """
+        zip_file = self._ensure_zip_open(zip_path)
+        return {
+            'audio_files': self._scan_audio_files(zip_file, report_progress=False),
+            'total_files': len(zip_file.filelist),
+            'file_metadata': {}
+        }
+    
+    def _update_cached_file_metadata(self, zip_path: str, file_name: str, key: str, value):
+        """Store a file's duration or full metadata in the ZIP's cached metadata.
+        
+        Safe to call from worker threads. Updates to metadata already cached
+        are written together once no update came for CACHE_FLUSH_DELAY
+        seconds, instead of writing the whole cache for every file.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            file_name: Name of the file in the ZIP
+            key: Metadata key to set, such as 'duration_ms'
+            value: Value to store
+        """
+        # Without cached metadata the ZIP's files are listed before taking
+        # the lock, so other updates do not wait for the scan. This runs on
+        # duration workers, which do not report load progress.
+        new_metadata = None
+        if zip_path not in self._dirty_metadata and self.cache_manager.get_cached_metadata(zip_path) is None:
+            new_metadata = self._new_cached_metadata(zip_path)
+        
+        with self._flush_lock:
+            # Pending updates are applied to the same metadata, even if the
+            # cache manager has since dropped it from memory and would load
+            # an older copy from disk
+            metadata = self._dirty_metadata.get(zip_path)
+            if metadata is None:
+                metadata = self.cache_manager.get_cached_metadata(zip_path)
+            is_new = metadata is None
+            if is_new:
+                if self.DEBUG: print(f"[DEBUG] Creating new cache structure")
+                # Only listed here if the cache went away after the check
+                metadata = new_metadata or self._new_cached_metadata(zip_path)
+            
+            file_metadata = metadata.setdefault('file_metadata', {})
+            if file_name not in file_metadata:
+                # Basic metadata comes from the ZIP info
+                zip_file, zip_info = self._get_zip_info(zip_path, file_name)
+                file_metadata[file_name] = {
+                    'size': zip_info.file_size,
+                    'timestamp': zip_info.date_time
+                }
+            file_metadata[file_name][key] = value
+            
+            if is_new:
+                # Later lookups only find new metadata once it is cached
+                self.cache_manager.cache_metadata(zip_path, metadata)
+                return
+            
+            self._dirty_metadata[zip_path] = metadata
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            # May be called from worker threads, so no Qt timer
+            self._flush_timer = threading.Timer(self.CACHE_FLUSH_DELAY, self._flush_cache)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flush_cache(self, zip_path: Optional[str] = None):
+        """Write pending metadata updates to the cache.
+        
+        Args:
+            zip_path: Only write updates of this ZIP, or None for all ZIPs
+        """
+        with self._flush_lock:
+            if zip_path is None:
+                pending = self._dirty_metadata
+                self._dirty_metadata = {}
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            else:
+                metadata = self._dirty_metadata.pop(zip_path, None)
+                pending = {zip_path: metadata} if metadata is not None else {}
+            
+            # Written under the lock, so no worker changes the metadata
+            # while it is pickled
+            for path, metadata in pending.items():
+                if self.DEBUG: print(f"[DEBUG] Writing pending cache updates for {path}")
+                try:
+                    self.cache_manager.cache_metadata(path, metadata)
+                except OSError as e:
+                    logging.warning(f"Failed to write cache for {path}: {e}")
+    
     def cleanup(self) -> None:
         """Clean up temporary files and close all ZIP files."""
-        # Remove extracted files
+        self._flush_cache()
+        
+        # Remove extracted files. A file that is already gone fails the
+        # remove, so no separate existence check is needed.
         for file_path in self.extracted_files:
             try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+                os.remove(file_path)
             except OSError:
                 pass  # Ignore errors during cleanup
         
@@ -442,13 +812,15 @@ class ZipManager:
             self.temp_dir = None
         
         # Close all ZIP files
-        for zip_file in self.open_zips.values():
-            try:
-                zip_file.close()
-            except Exception:
-                pass
-        
-        self.open_zips.clear()
+        with self._lock:
+            for zip_file in self.open_zips.values():
+                try:
+                    zip_file.close()
+                except Exception:
+                    pass
+            
+            self.open_zips.clear()
+            self._zip_paths.clear()
     
     def __del__(self):
         """Ensure cleanup on object destruction."""
@@ -460,20 +832,23 @@ class ZipManager:
         Args:
             zip_path: Path to the ZIP file to close
         """
-        if zip_path in self.open_zips:
-            try:
-                self.open_zips[zip_path].close()
-            except Exception:
-                pass
-            del self.open_zips[zip_path]
+        self._flush_cache(zip_path)
+        with self._lock:
+            zip_file = self.open_zips.pop(zip_path, None)
+            if zip_file is not None:
+                try:
+                    zip_file.close()
+                except Exception:
+                    pass
+            self._zip_paths.pop(zip_path, None)
     
     def get_open_zips(self) -> List[str]:
         """Get list of currently open ZIP files.
         
         Returns:
-            List of paths to open ZIP files
+            List of paths to open ZIP files, in the order they were opened
         """
-        return list(self.open_zips.keys())
+        return list(self._zip_paths)
     
     def get_file_duration(self, zip_path: str, file_name: str) -> Optional[int]:
         """
@@ -486,7 +861,7 @@ class ZipManager:
         Returns:
             Duration in milliseconds, or None if duration couldn't be determined
         """
-        print(f"\n[DEBUG] Getting duration for {file_name}")
+        if self.DEBUG: print(f"\n[DEBUG] Getting duration for {file_name}")
         
         # Try to get from cache first
         cached_metadata = self.cache_manager.get_cached_metadata(zip_path)
@@ -505,35 +880,7 @@ class ZipManager:
         duration = self.get_audio_duration(zip_path, file_name)
         if duration is not None:
             if self.DEBUG: print(f"[DEBUG] Got duration: {duration}ms")
-            # Update cache with duration
-            if cached_metadata is None:
-                if self.DEBUG: print(f"[DEBUG] Creating new cache structure")
-                cached_metadata = {
-                    'audio_files': self.list_audio_files(zip_path),
-                    'total_files': len(self.open_zips[zip_path].filelist),
-                    'file_metadata': {}
-                }
-            
-            if 'file_metadata' not in cached_metadata:
-                if self.DEBUG: print(f"[DEBUG] Creating file_metadata dictionary")
-                cached_metadata['file_metadata'] = {}
-            
-            if file_name not in cached_metadata['file_metadata']:
-                if self.DEBUG: print(f"[DEBUG] Adding basic metadata for {file_name}")
-                # Get basic metadata from ZIP info
-                zip_info = self.open_zips[zip_path].getinfo(file_name)
-                cached_metadata['file_metadata'][file_name] = {
-                    'size': zip_info.file_size,
-                    'timestamp': zip_info.date_time
-                }
-            
-            # Add duration to metadata
-            if self.DEBUG: print(f"[DEBUG] Adding duration to cache")
-            cached_metadata['file_metadata'][file_name]['duration_ms'] = duration
-            
-            # Save updated cache
-            if self.DEBUG: print(f"[DEBUG] Saving updated cache")
-            self.cache_manager.cache_metadata(zip_path, cached_metadata)
+            self._update_cached_file_metadata(zip_path, file_name, 'duration_ms', duration)
         else:
             if self.DEBUG: print(f"[DEBUG] Could not get duration for {file_name}")
         
@@ -566,10 +913,7 @@ class ZipManager:
                 return file_metadata['full_metadata']
         
         # If not in cache, ensure ZIP is open and get metadata
-        self._ensure_zip_open(zip_path)
-        
-        if file_name not in self.open_zips[zip_path].namelist():
-            raise KeyError(f"File not found in ZIP: {file_name}")
+        zip_file, zip_info = self._get_zip_info(zip_path, file_name)
         
         try:
             from tinytag import TinyTag
@@ -577,19 +921,16 @@ class ZipManager:
             
             time_start = time.time()
             
-            # Get file info to check size
-            zip_info = self.open_zips[zip_path].getinfo(file_name)
-            
             # For very small files, read the whole thing
             if zip_info.file_size <= max_header_size:
                 if self.DEBUG: print(f"[DEBUG] {file_name} File size: {zip_info.file_size} bytes. Reading entire file (small file)")
-                with self.open_zips[zip_path].open(file_name) as zip_file:
-                    file_data = zip_file.read()
+                with zip_file.open(zip_info) as entry:
+                    file_data = entry.read()
             else:
                 # For larger files, only read the header portion
                 if self.DEBUG: print(f"[DEBUG] {file_name} File size: {zip_info.file_size} bytes. Reading header only (max {max_header_size} bytes)")
-                with self.open_zips[zip_path].open(file_name) as zip_file:
-                    file_data = zip_file.read(max_header_size)
+                with zip_file.open(zip_info) as entry:
+                    file_data = entry.read(max_header_size)
             
             # Create a BytesIO object and use it with file_obj parameter
             file_obj = BytesIO(file_data)
@@ -647,27 +988,7 @@ class ZipManager:
                 if self.DEBUG: print(f"[DEBUG] Got full metadata. Time took {time.time() - time_start:.2f} seconds. Metadata: {metadata}")
                 
                 # Update cache with full metadata
-                if cached_metadata is None:
-                    cached_metadata = {
-                        'audio_files': self.list_audio_files(zip_path),
-                        'total_files': len(self.open_zips[zip_path].filelist),
-                        'file_metadata': {}
-                    }
-                
-                if 'file_metadata' not in cached_metadata:
-                    cached_metadata['file_metadata'] = {}
-                
-                if file_name not in cached_metadata['file_metadata']:
-                    cached_metadata['file_metadata'][file_name] = {
-                        'size': zip_info.file_size,
-                        'timestamp': zip_info.date_time
-                    }
-                
-                # Add full metadata to cache
-                cached_metadata['file_metadata'][file_name]['full_metadata'] = metadata
-                
-                # Save updated cache
-                self.cache_manager.cache_metadata(zip_path, cached_metadata)
+                self._update_cached_file_metadata(zip_path, file_name, 'full_metadata', metadata)
                 
                 return metadata
             
@@ -706,56 +1027,420 @@ class ZipManager:
                 return file_metadata['duration_ms']
         
         # If not in cache, ensure ZIP is open and get duration
-        self._ensure_zip_open(zip_path)
+        zip_file, zip_info = self._get_zip_info(zip_path, file_name)
         
-        if file_name not in self.open_zips[zip_path].namelist():
-            raise KeyError(f"File not found in ZIP: {file_name}")
+        return self._read_audio_duration(zip_file, zip_info, max_header_size)
+    
+    def get_durations(self, zip_path: str, file_names: List[str],
+                      max_workers: Optional[int] = None) -> Dict[str, Optional[int]]:
+        """
+        Get the durations of several files of a ZIP, reading them on worker threads.
         
-        try:
-            import mutagen
-            from io import BytesIO
-            
-            time_start = time.time()
+        Durations found in the cache are not read again, and the ones read
+        are cached like those of get_file_duration. The workers share the
+        ZIP's handle like those of load_zip; decompression and parsing run
+        in parallel.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            file_names: Names of the audio files in the ZIP
+            max_workers: Number of worker threads (default METADATA_WORKERS)
             
-            # Get file info to check size
-            zip_info = self.open_zips[zip_path].getinfo(file_name)
+        Returns:
+            Dictionary of duration in milliseconds by file name, None where
+            the duration couldn't be determined
             
-            # For very small files, read the whole thing
-            if zip_info.file_size <= max_header_size:
-                if self.DEBUG: print(f"[DEBUG] {file_name} File size: {zip_info.file_size} bytes. Reading entire file (small file)")
-                with self.open_zips[zip_path].open(file_name) as zip_file:
-                    file_data = zip_file.read()
+        Raises:
+            KeyError: If a file doesn't exist in the ZIP
+        """
+        cached_metadata = self.cache_manager.get_cached_metadata(zip_path)
+        cached_files = (cached_metadata or {}).get('file_metadata', {})
+        
+        durations = {}
+        to_read = []
+        for file_name in file_names:
+            duration = cached_files.get(file_name, {}).get('duration_ms')
+            if duration is not None:
+                durations[file_name] = duration
             else:
-                # For larger files, only read the header portion
-                if self.DEBUG: print(f"[DEBUG] {file_name} File size: {zip_info.file_size} bytes. Reading header only (max {max_header_size} bytes)")
-                with self.open_zips[zip_path].open(file_name) as zip_file:
-                    file_data = zip_file.read(max_header_size)
+                to_read.append(file_name)
+        if not to_read:
+            return durations
+        
+        zip_file = self._ensure_zip_open(zip_path)
+        name_to_info = zip_file.NameToInfo
+        zip_infos = []
+        for file_name in to_read:
+            zip_info = name_to_info.get(file_name)
+            if zip_info is None:
+                raise KeyError(f"File not found in ZIP: {file_name}")
+            zip_infos.append(zip_info)
+        
+        with ThreadPoolExecutor(max_workers=max_workers or self.METADATA_WORKERS) as executor:
+            results = executor.map(self._read_audio_duration, [zip_file] * len(zip_infos), zip_infos)
+            durations.update(zip(to_read, results))
+        
+        for file_name in to_read:
+            duration = durations[file_name]
+            if duration is not None:
+                self._update_cached_file_metadata(zip_path, file_name, 'duration_ms', duration)
+        return durations
+    
+    def _read_file_metadata(self, zip_file: zipfile.ZipFile, zip_info: zipfile.ZipInfo) -> dict:
+        """
+        Read the metadata cached for an audio file when its ZIP is loaded.
+        Safe to call from worker threads.
+        
+        Args:
+            zip_file: Open ZIP containing the file
+            zip_info: ZIP info of the audio file
             
-            # Create a BytesIO object for mutagen
-            file_obj = BytesIO(file_data)
+        Returns:
+            Dictionary with size and timestamp, and duration_ms if it could be determined
+        """
+        # Basic metadata comes from the ZIP info without reading the file
+        metadata = {
+            'size': zip_info.file_size,
+            'timestamp': zip_info.date_time
+        }
+        duration = self._read_audio_duration(zip_file, zip_info)
+        if duration is not None:
+            metadata['duration_ms'] = duration
+        return metadata
+    
+    @staticmethod
+    def _parse_wav_duration(header: bytes) -> Optional[int]:
+        """Compute a WAV file's duration from the RIFF chunk headers at its start.
+        
+        Follows mutagen's calculation: data size / block align / sample rate.
+        
+        Args:
+            header: Bytes from the start of the file, up to and including the
+                header of the data chunk
+            
+        Returns:
+            Duration in milliseconds, or None if the header is not a RIFF WAV
+            header with the format chunk before the data chunk (e.g. RF64)
+        """
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            return None
+        
+        block_align = sample_rate = None
+        pos = 12
+        while pos + 8 <= len(header):
+            chunk_id, chunk_size = struct.unpack_from('<4sI', header, pos)
+            if chunk_id == b'fmt ':
+                if chunk_size < 16 or pos + 24 > len(header):
+                    return None
+                _, _, sample_rate, _, block_align, _ = struct.unpack_from('<HHIIHH', header, pos + 8)
+            elif chunk_id == b'data':
+                # A size of 0xFFFFFFFF is left by writers that stream the file
+                if block_align is None or chunk_size == 0xFFFFFFFF:
+                    return None
+                if not block_align or not sample_rate:
+                    return 0
+                return int(chunk_size / block_align / sample_rate * 1000)
+            # Chunks are padded to an even size
+            pos += 8 + chunk_size + (chunk_size & 1)
+        return None
+    
+    @classmethod
+    def _parse_mp3_frame_header(cls, data: bytes, pos: int) -> Optional[Tuple[int, int, int]]:
+        """Parse the MPEG audio frame header at a position.
+        
+        Args:
+            data: Bytes of the file
+            pos: Offset of the frame header in data
             
-            # Use mutagen to get the duration
-            audio = mutagen.File(file_obj)
-            if audio is not None and hasattr(audio.info, 'length'):
-                duration = int(audio.info.length * 1000)  # Convert to milliseconds
-                if self.DEBUG: print(f"[DEBUG] Got duration from header: {duration}ms. Time took {time.time() - time_start:.2f} seconds")
+        Returns:
+            Tuple of (bitrate in bit/s, frame length in bytes, offset of a
+            Xing header from the frame start), or None if there is no valid
+            frame header at pos
+        """
+        if pos + 4 > len(data):
+            return None
+        header = int.from_bytes(data[pos:pos + 4], 'big')
+        version_bits = (header >> 19) & 0x3
+        layer = 4 - ((header >> 17) & 0x3)
+        bitrate_index = (header >> 12) & 0xF
+        rate_index = (header >> 10) & 0x3
+        padding = (header >> 9) & 0x1
+        mode = (header >> 6) & 0x3
+        if ((header >> 21) != 0x7FF or version_bits == 1 or layer == 4
+                or rate_index == 3 or bitrate_index in (0, 0xF)):
+            return None
+        
+        mpeg1 = version_bits == 3
+        bitrate = cls.MP3_BITRATES[(1 if mpeg1 else 2, layer)][bitrate_index] * 1000
+        sample_rate = cls.MP3_SAMPLE_RATES[version_bits][rate_index]
+        if layer == 1:
+            samples, slot = 384, 4
+        elif not mpeg1 and layer == 3:
+            samples, slot = 576, 1
+        else:
+            samples, slot = 1152, 1
+        # Layer 1 counts the frame in 4 byte slots
+        frame_length = ((samples // 8 // slot * bitrate) // sample_rate + padding) * slot
+        mono = mode == 3
+        xing_offset = (21 if mono else 36) if mpeg1 else (13 if mono else 21)
+        return bitrate, frame_length, xing_offset
+    
+    @classmethod
+    def _parse_mp3_duration(cls, header: bytes, file_size: int) -> Optional[int]:
+        """Compute a constant bitrate MP3 file's duration from its first frames.
+        
+        Follows mutagen's estimate for files without a VBR header: the bytes
+        from the first frame to the end of the file at the frame bitrate.
+        Unlike mutagen given only the header bytes, the real file size is used.
+        
+        Args:
+            header: Bytes from the start of the file
+            file_size: Size of the whole file in bytes
+            
+        Returns:
+            Duration in milliseconds, or None if the file does not start with
+            ID3 tags followed by four valid frames, or has a Xing, Info or
+            VBRI header (those need mutagen's VBR handling)
+        """
+        # Skip ID3v2 tags, some writers add more than one
+        pos = 0
+        while header[pos:pos + 3] == b'ID3' and pos + 10 <= len(header):
+            size_bytes = header[pos + 6:pos + 10]
+            size = (size_bytes[0] << 21) | (size_bytes[1] << 14) | (size_bytes[2] << 7) | size_bytes[3]
+            if size == 0:
+                break
+            pos += 10 + size
+        
+        first_frame = cls._parse_mp3_frame_header(header, pos)
+        if first_frame is None:
+            return None
+        bitrate, _, xing_offset = first_frame
+        if (header[pos + xing_offset:pos + xing_offset + 4] in (b'Xing', b'Info')
+                or header[pos + 36:pos + 40] == b'VBRI'):
+            return None
+        
+        # Like mutagen, trust the sync only if the next frames follow it
+        frame_pos = pos
+        for _ in range(4):
+            frame = cls._parse_mp3_frame_header(header, frame_pos)
+            if frame is None:
+                return None
+            frame_pos += frame[1]
+        
+        return int(8 * (file_size - pos) / bitrate * 1000)
+    
+    @staticmethod
+    def _parse_ogg_duration(head: bytes, tail: bytes) -> Optional[int]:
+        """Compute an Ogg Vorbis or Opus file's duration from its first and last pages.
+        
+        Follows mutagen's calculation: the granule position of the stream's
+        last page over the sample rate, less Opus' pre-skip.
+        
+        Args:
+            head: Bytes from the start of the file, holding the first page
+            tail: Bytes from the end of the file, holding the last page
+            
+        Returns:
+            Duration in milliseconds, or None if the first page does not start
+            a Vorbis or Opus stream or no page of it is found in tail
+        """
+        if len(head) < 28 or head[:4] != b'OggS':
+            return None
+        serial = head[14:18]
+        packet = head[27 + head[26]:]  # After the segment table
+        if packet[:7] == b'\x01vorbis' and len(packet) >= 16:
+            sample_rate, pre_skip = struct.unpack_from('<I', packet, 12)[0], 0
+        elif packet[:8] == b'OpusHead' and len(packet) >= 12:
+            sample_rate, pre_skip = 48000, struct.unpack_from('<H', packet, 10)[0]
+        else:
+            return None
+        if not sample_rate:
+            return None
+        
+        # Search backwards for the last page of the stream with a position
+        pos = tail.rfind(b'OggS')
+        while pos >= 0:
+            if pos + 27 <= len(tail) and tail[pos + 14:pos + 18] == serial:
+                granule = struct.unpack_from('<q', tail, pos + 6)[0]
+                if granule >= 0:
+                    return int(max(0, granule - pre_skip) / sample_rate * 1000)
+            pos = tail.rfind(b'OggS', 0, pos)
+        return None
+    
+    def _read_stored_data(self, zip_file: zipfile.ZipFile, zip_info: zipfile.ZipInfo,
+                          ranges: List[Tuple[int, int]]) -> Optional[List[bytes]]:
+        """Read parts of a file stored without compression directly from the ZIP.
+        
+        Skips the entry reader, which buffers the data and checks its CRC
+        as it goes. With a memory mapped ZIP each part is a single copy.
+        
+        Args:
+            zip_file: Open ZIP containing the file
+            zip_info: ZIP info of the file, which must be stored without compression
+            ranges: (offset, size) of each part within the file, clipped to its end
+            
+        Returns:
+            Bytes of each part, or None if the file cannot be read this way
+        """
+        if zip_info.compress_type != zipfile.ZIP_STORED or zip_info.flag_bits & 0x1:
+            return None  # Compressed or encrypted
+        
+        # The data follows the local header, whose name and extra field
+        # lengths may differ from the central directory's. zipfile's lock
+        # guards the position of the file its open entries read from. Both
+        # are zipfile internals, without them the entry reader is used.
+        lock = getattr(zip_file, '_lock', None)
+        if lock is None:
+            return None
+        size = zip_info.file_size
+        with lock:
+            fp = getattr(zip_file, 'fp', None)
+            if fp is None:
+                return None
+            fp.seek(zip_info.header_offset)
+            local_header = fp.read(30)
+            if len(local_header) < 30 or local_header[:4] != b'PK\x03\x04':
+                return None
+            name_length, extra_length = struct.unpack('<HH', local_header[26:30])
+            # Like ZipFile.open, only trust the offset if the local header
+            # names the same file
+            encoding = 'utf-8' if zip_info.flag_bits & 0x800 else 'cp437'
+            if fp.read(name_length).decode(encoding, 'replace') != zip_info.orig_filename:
+                return None
+            data_start = zip_info.header_offset + 30 + name_length + extra_length
+            parts = []
+            for offset, length in ranges:
+                fp.seek(data_start + offset)
+                parts.append(fp.read(max(0, min(length, size - offset))))
+        return parts
+    
+    @classmethod
+    def _parse_header_duration(cls, extension: str, header: bytes, file_size: int) -> Optional[int]:
+        """Compute a duration from the start of a file with the format's own parser.
+        
+        Args:
+            extension: Lower case file extension including the dot
+            header: Bytes from the start of the file
+            file_size: Size of the whole file in bytes
+            
+        Returns:
+            Duration in milliseconds, or None if the format has no parser or
+            the parser does not understand the file
+        """
+        if extension == '.wav':
+            return cls._parse_wav_duration(header)
+        if extension == '.mp3':
+            return cls._parse_mp3_duration(header, file_size)
+        return None
+    
+    @staticmethod
+    def _mutagen_length(extension: str, file_obj) -> Optional[float]:
+        """Read an audio file's length in seconds with mutagen.
+        
+        MP3 and WAV files are read with mutagen's stream info classes
+        alone, which skip the tags (and any cover art in them) that
+        mutagen.File would also parse.
+        
+        Args:
+            extension: Lower case file extension including the dot
+            file_obj: File object positioned at the start of the file
+            
+        Returns:
+            Length in seconds, or None if mutagen does not recognize the file
+            
+        Raises:
+            Exception: If mutagen fails to parse the file
+        """
+        if extension == '.mp3':
+            import mutagen.mp3
+            return mutagen.mp3.MPEGInfo(file_obj).length
+        if extension == '.wav':
+            import mutagen.wave
+            return mutagen.wave.WaveStreamInfo(file_obj).length
+        import mutagen
+        audio = mutagen.File(file_obj)
+        return getattr(audio.info, 'length', None) if audio is not None else None
+    
+    def _read_audio_duration(self, zip_file: zipfile.ZipFile, zip_info: zipfile.ZipInfo,
+                             max_header_size: int = 1024 * 1024) -> Optional[int]:
+        """
+        Read audio duration in milliseconds from the header of a file in an open ZIP.
+        
+        Args:
+            zip_file: Open ZIP containing the file
+            zip_info: ZIP info of the audio file
+            max_header_size: Maximum number of bytes to read for header (default 1MB)
+            
+        Returns:
+            Duration in milliseconds, or None if duration couldn't be determined
+        """
+        # Runs for every file of a ZIP, so the flag is read once and the
+        # time is only taken when it is printed
+        debug = self.DEBUG
+        if debug: time_start = time.time()
+        file_name = zip_info.filename
+        try:
+            from io import BytesIO
+            
+            # Amounts to read in turn, ending with the whole file. A WAV's
+            # duration follows from the chunk headers in front of its
+            # samples, so a short probe is tried first. Other formats
+            # estimate their length from the data read, so they start
+            # with the full header.
+            extension = os.path.splitext(file_name)[1].lower()
+            read_sizes = [max_header_size]
+            if extension == '.wav':
+                read_sizes.insert(0, self.WAV_HEADER_PROBE_SIZE)
+            read_sizes = [size for size in read_sizes if size < zip_info.file_size] + [zip_info.file_size]
+            
+            # Files stored without compression are parsed from bytes read
+            # straight from the ZIP. An Ogg stream's length is the position
+            # of its last page, so its end is read too. Compressed files
+            # are decompressed below, Ogg ones up to the end.
+            duration = None
+            if extension == '.ogg':
+                parts = self._read_stored_data(zip_file, zip_info, [
+                    (0, self.OGG_HEAD_SIZE),
+                    (max(0, zip_info.file_size - self.OGG_TAIL_SIZE), self.OGG_TAIL_SIZE)])
+                if parts is not None:
+                    duration = self._parse_ogg_duration(*parts)
+            elif extension in ('.wav', '.mp3'):
+                parts = self._read_stored_data(zip_file, zip_info, [(0, read_sizes[0])])
+                if parts is not None:
+                    duration = self._parse_header_duration(extension, parts[0], zip_info.file_size)
+            if duration is not None:
+                if debug: print(f"[DEBUG] Got duration from stored data: {duration}ms")
                 return duration
             
-            # If we couldn't get duration from header, try reading more
-            if zip_info.file_size > max_header_size:
-                if self.DEBUG: print(f"[DEBUG] Could not get duration from header, trying full file")
-                with self.open_zips[zip_path].open(file_name) as zip_file:
-                    file_data = zip_file.read()
-                file_obj = BytesIO(file_data)
-                audio = mutagen.File(file_obj)
-                if audio is not None and hasattr(audio.info, 'length'):
-                    duration = int(audio.info.length * 1000)
-                    if self.DEBUG: print(f"[DEBUG] Got duration from full file: {duration}ms. Time took {time.time() - time_start:.2f} seconds")
-                    return duration
+            with zip_file.open(zip_info) as entry:
+                file_data = b''
+                for read_size in read_sizes:
+                    if debug: print(f"[DEBUG] {file_name} File size: {zip_info.file_size} bytes. Reading {read_size} bytes")
+                    # Continue where the previous attempt stopped reading
+                    file_data += entry.read(read_size - len(file_data))
+                    # Plain WAV and constant bitrate MP3 headers are parsed
+                    # here, mutagen is only needed for the files these
+                    # parsers do not understand
+                    duration = self._parse_header_duration(extension, file_data, zip_info.file_size)
+                    if duration is not None:
+                        if debug: print(f"[DEBUG] Got duration from header: {duration}ms")
+                        return duration
+                    try:
+                        length = self._mutagen_length(extension, BytesIO(file_data))
+                    except Exception:
+                        if read_size == zip_info.file_size:
+                            raise
+                        continue
+                    if read_size < zip_info.file_size and length == 0:
+                        continue  # The data chunk is not within the bytes read yet
+                    if length is not None:
+                        duration = int(length * 1000)  # Convert to milliseconds
+                        if debug: print(f"[DEBUG] Got duration from {len(file_data)} bytes: {duration}ms. Time took {time.time() - time_start:.2f} seconds")
+                        return duration
                 
         except Exception as e:
-            if self.DEBUG: print(f"[DEBUG] Error getting duration: {e}")
+            if debug: print(f"[DEBUG] Error getting duration: {e}")
             logging.warning(f"Failed to get duration for {file_name}: {e}")
         
-        if self.DEBUG: print(f"[DEBUG] Could not determine duration")
-        return None 
\ No newline at end of file
+        if debug: print(f"[DEBUG] Could not determine duration")
+        return None
@@ -0,0 +1,215 @@
+import pytest
+from PySide6.QtCore import Qt
+from src.audio_browser.ui.audio_file_model import AudioFileModel, PATH_ROLE
+
+@pytest.fixture
+def model(qapp):
+    """Fixture providing a model with two folders of three files each."""
+    model = AudioFileModel()
+    for folder in ("pack/drums", "pack/synths"):
+        for i in range(3):
+            model.add_file(f"{folder}/sample{i}.wav", file_metadata={'duration_ms': 1000, 'size': 2048})
+    model.sort_files()
+    return model
+
+def fetch_folder(model, row):
+    """Expose the files of the folder at the given row and return its index."""
+    folder_index = model.index(row, 0)
+    model.fetchMore(folder_index)
+    return folder_index
+
+def test_model_structure(model):
+    """Test folders are top-level rows and files are fetched lazily."""
+    assert model.rowCount() == 2
+    folder_index = model.index(0, 0)
+    assert model.hasChildren(folder_index)
+    assert model.rowCount(folder_index) == 0
+
+    fetch_folder(model, 0)
+    assert model.rowCount(folder_index) == 3
+    assert model.index(0, 0, folder_index).data() == "sample0.wav"
+    assert model.index(0, 0, folder_index).parent() == folder_index
+
+def test_folder_check_state(model):
+    """Test checking a folder checks all of its files."""
+    folder_index = fetch_folder(model, 0)
+    model.setData(folder_index, Qt.Checked, Qt.CheckStateRole)
+
+    assert sorted(model.get_checked_files()) == [f"pack/drums/sample{i}.wav" for i in range(3)]
+    assert folder_index.data(Qt.CheckStateRole) == Qt.Checked
+    assert "3 selected" in folder_index.data()
+
+def test_quiet_updates_coalesce_signals(model, qtbot):
+    """Test quiet_updates emits one change per affected folder."""
+    folder_index = fetch_folder(model, 0)
+    changes = []
+    model.dataChanged.connect(lambda top_left, bottom_right, roles: changes.append((top_left, bottom_right)))
+
+    with model.quiet_updates():
+        for row in range(3):
+            model.setData(model.index(row, 0, folder_index), Qt.Checked, Qt.CheckStateRole)
+        assert not changes
+
+    assert len(changes) == 2
+    assert (changes[0][0].row(), changes[0][1].row()) == (0, 2)
+    assert changes[1][0] == folder_index
+    assert folder_index.data(Qt.CheckStateRole) == Qt.Checked
+
+def test_index_for_path(model):
+    """Test file indexes are resolved by path once their folder is fetched."""
+    assert not model.index_for_path("pack/synths/sample1.wav").isValid()
+
+    folder_index = fetch_folder(model, 1)
+    index = model.index_for_path("pack/synths/sample1.wav")
+    assert index.isValid()
+    assert index.parent() == folder_index
+    assert index.data(PATH_ROLE) == "pack/synths/sample1.wav"
+    assert folder_index.data(PATH_ROLE) == "pack/synths"
+    assert not model.index_for_path("pack/missing.wav").isValid()
+
+def test_get_file(model):
+    """Test file data is looked up by path."""
+    file_data = model.get_file("pack/drums/sample2.wav")
+    assert file_data['folder'] == "pack/drums"
+    assert file_data['metadata']['duration_ms'] == 1000
+    assert model.get_file("pack/missing.wav") is None
+
+    model.clear()
+    assert model.get_file("pack/drums/sample2.wav") is None
+
+def test_count_matches(model):
+    """Test search matches are counted per folder, ignoring case."""
+    model.add_file("pack/drums/Kick.wav")
+    model.sort_files()
+
+    assert model.count_matches("kick") == {"pack/drums": 1, "pack/synths": 0}
+    assert model.count_matches("sample1") == {"pack/drums": 1, "pack/synths": 1}
+
+def test_add_files_bulk(model, qtbot):
+    """Test a batch of files is inserted with one notification for new folders."""
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((parent.isValid(), first, last)))
+
+    model.add_files_bulk([("pack/fx/rise.wav", {'duration_ms': 500}),
+                          ("pack/fx/fall.wav", None),
+                          ("pack/drums/sample3.wav", None),
+                          ("pack/vox/hey.wav", None)], zip_path="test.zip")
+
+    assert inserted == [(False, 2, 3)]
+    assert model.rowCount() == 4
+    assert model.folder_at(model.index(2, 0)) == "pack/fx"
+    assert model.get_file("pack/fx/rise.wav")['zip_path'] == "test.zip"
+    assert len(model.get_folder_files("pack/drums")) == 4
+
+    folder_index = fetch_folder(model, 2)
+    assert model.rowCount(folder_index) == 2
+    assert model.index_for_path("pack/fx/fall.wav").row() == 1
+
+def test_match_flags(model):
+    """Test per-file results of the last search are kept in row order."""
+    assert model.match_flags("pack/drums") is None
+
+    model.count_matches("sample1")
+    assert model.match_flags("pack/drums") == [False, True, False]
+
+    model.set_match_counts(None)
+    assert model.match_flags("pack/drums") is None
+
+def test_count_matches_narrows_previous_search(model):
+    """Test extending a search only retests files that matched before."""
+    model.count_matches("drums/")
+    model.folder_paths_lower("pack/drums")[0] = "renamed"
+
+    # Files that did not match before are not tested again
+    model.folder_paths_lower("pack/synths")[1] = "pack/drums/sample1.wav"
+    assert model.count_matches("drums/sample") == {"pack/drums": 2, "pack/synths": 0}
+    assert model.match_flags("pack/drums") == [False, True, True]
+
+    # An unrelated search starts over
+    assert model.count_matches("sample1") == {"pack/drums": 1, "pack/synths": 1}
+
+def test_fetch_all(model, qtbot):
+    """Test every folder left unfetched gets one row insertion and no reset."""
+    resets, inserted = [], []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((parent.row(), first, last)))
+    fetch_folder(model, 0)
+
+    assert model.fetch_all()
+    assert [model.rowCount(model.index(row, 0)) for row in range(2)] == [3, 3]
+    assert not model.canFetchMore(model.index(0, 0))
+
+    assert not model.fetch_all()
+    assert inserted == [(0, 0, 2), (1, 0, 2)]
+    assert not resets
+
+def test_set_match_counts_notifies_changed_folders(model, qtbot):
+    """Test only folders whose match count changed are repainted."""
+    model.set_match_counts(model.count_matches("sample"))
+    changes = []
+    model.dataChanged.connect(lambda top_left, bottom_right, roles: changes.append((top_left.row(), bottom_right.row())))
+
+    model.set_match_counts(model.count_matches("sample1"))
+    assert changes == [(0, 1)]
+    assert model.index(1, 0).data() == "synths *%*( 1 / 3 files match )"
+
+    changes.clear()
+    model.set_match_counts(model.count_matches("sample1."))
+    assert changes == []
+
+def test_checked_counts_follow_file_changes(model):
+    """Test folder labels and states track checks without rescanning files."""
+    folder_index = fetch_folder(model, 1)
+    model.set_file_checked("pack/synths/sample0.wav", True)
+    model.set_file_checked("pack/synths/sample0.wav", True)
+    assert "1 selected" in folder_index.data()
+
+    # The same path added again from another ZIP is checked as well
+    model.add_file("pack/synths/sample0.wav", zip_path="other.zip")
+    assert "2 selected" in folder_index.data()
+
+    model.set_file_checked("pack/synths/sample1.wav", True)
+    model.set_file_checked("pack/synths/sample2.wav", True)
+    assert folder_index.data(Qt.CheckStateRole) == Qt.Checked
+
+    model.set_file_checked("pack/synths/sample0.wav", False)
+    assert "2 selected" in folder_index.data()
+    assert folder_index.data(Qt.CheckStateRole) == Qt.PartiallyChecked
+
+def test_count_matches_multiple_words(model):
+    """Test a search of several words matches paths containing all of them."""
+    assert model.count_matches("synths 2") == {"pack/drums": 0, "pack/synths": 1}
+    assert model.match_flags("pack/synths") == [False, False, True]
+    assert model.count_matches("sample pack") == {"pack/drums": 3, "pack/synths": 3}
+    assert model.count_matches("sample packs") == {"pack/drums": 0, "pack/synths": 0}
+
+def test_missing_duration_requested_when_shown(model, qtbot):
+    """Test a shown file without a duration asks for it once and displays it when set."""
+    requested = []
+    model.duration_needed.connect(requested.append)
+    model.add_files_bulk([("pack/fx/rise.wav", {'size': 2048})], zip_path="test.zip", zip_manager=object())
+    model.sort_files()
+    fetch_folder(model, 1)
+    index = model.index_for_path("pack/fx/rise.wav", 1)
+
+    assert index.data() == "?"
+    assert index.data() == "?"
+    assert [file_data['path'] for file_data in requested] == ["pack/fx/rise.wav"]
+
+    with qtbot.waitSignal(model.dataChanged):
+        model.set_file_duration(requested[0], 1500)
+    assert index.data() != "?"
+    assert model.get_file("pack/fx/rise.wav")['metadata']['duration_ms'] == 1500
+
+def test_duplicate_path_resolves_to_first_zip(model):
+    """Test a path found in two ZIPs resolves to the first one's row, also after sorting."""
+    model.add_files_bulk([("d/kick.wav", None)], zip_path="z1.zip")
+    model.add_files_bulk([("d/kick.wav", None)], zip_path="z2.zip")
+    model.add_files_bulk([("d/clap.wav", None)], zip_path="z2.zip")
+    model.sort_files()
+    fetch_folder(model, model.folder_index("d").row())
+
+    index = model.index_for_path("d/kick.wav")
+    first = model.get_file("d/kick.wav")
+    assert first['zip_path'] == "z1.zip"
+    assert model.get_folder_files("d")[index.row()] is first
@@ -0,0 +1,131 @@
+import os
+import json
+import pytest
+from src.audio_browser.cache.cache_manager import CacheManager
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    """Fixture providing a CacheManager writing to a temporary directory."""
+    return CacheManager(cache_dir=str(tmp_path / "cache"))
+
+@pytest.fixture
+def zip_path(tmp_path):
+    """Fixture providing a file standing in for a ZIP."""
+    path = tmp_path / "test.zip"
+    path.write_bytes(b"zip contents")
+    return str(path)
+
+@pytest.fixture
+def metadata():
+    """Fixture providing metadata as produced by ZipManager.load_zip."""
+    return {
+        'audio_files': ['drums/kick.wav'],
+        'total_files': 1,
+        'file_metadata': {'drums/kick.wav': {'size': 1024, 'duration_ms': 500}}
+    }
+
+def test_cache_roundtrip(cache_manager, zip_path, metadata):
+    """Test metadata survives being written and read by a new instance."""
+    cache_manager.cache_metadata(zip_path, metadata)
+
+    reloaded = CacheManager(cache_dir=cache_manager.cache_dir)
+    assert reloaded.get_cached_metadata(zip_path) == metadata
+
+def test_cache_served_from_memory(cache_manager, zip_path, metadata):
+    """Test repeated lookups do not read the cache file again."""
+    cache_manager.cache_metadata(zip_path, metadata)
+    os.remove(cache_manager._get_cache_file_path(zip_path))
+
+    assert cache_manager.get_cached_metadata(zip_path) == metadata
+
+def test_cache_invalidated_when_zip_changes(cache_manager, zip_path, metadata):
+    """Test a modified ZIP does not use stale metadata."""
+    cache_manager.cache_metadata(zip_path, metadata)
+    with open(zip_path, 'ab') as f:
+        f.write(b"more")
+
+    assert cache_manager.get_cached_metadata(zip_path) is None
+    assert zip_path not in cache_manager.list_cached_zips()
+
+def test_legacy_json_cache_is_converted(cache_manager, zip_path, metadata):
+    """Test caches written as JSON by older versions are still used."""
+    cache_file = cache_manager._get_cache_file_path(zip_path)
+    with open(cache_file, 'w') as f:
+        json.dump({'file_stats': cache_manager._calculate_file_stats(zip_path),
+                   'metadata': metadata}, f)
+    cache_manager.cache_index[zip_path] = cache_file
+
+    assert cache_manager.get_cached_metadata(zip_path) == metadata
+    with open(cache_file, 'rb') as f:
+        assert f.read(1) != b'{'
+
+def test_zips_with_same_name_have_separate_caches(cache_manager, tmp_path, metadata):
+    """Test ZIPs with the same filename in different folders do not share a cache."""
+    zip_paths = []
+    for folder in ("drums", "synths"):
+        (tmp_path / folder).mkdir()
+        path = tmp_path / folder / "samples.zip"
+        path.write_bytes(folder.encode())
+        zip_paths.append(str(path))
+    other_metadata = dict(metadata, total_files=2)
+    cache_manager.cache_metadata(zip_paths[0], metadata)
+    cache_manager.cache_metadata(zip_paths[1], other_metadata)
+
+    reloaded = CacheManager(cache_dir=cache_manager.cache_dir)
+    assert reloaded.get_cached_metadata(zip_paths[0]) == metadata
+    assert reloaded.get_cached_metadata(zip_paths[1]) == other_metadata
+
+def test_cache_invalidated_by_subsecond_change(cache_manager, zip_path, metadata):
+    """Test a ZIP rewritten with the same size within a second is detected."""
+    cache_manager.cache_metadata(zip_path, metadata)
+    stats = os.stat(zip_path)
+    os.utime(zip_path, ns=(stats.st_atime_ns, stats.st_mtime_ns + 1000))
+
+    assert cache_manager.get_cached_metadata(zip_path) is None
+
+def test_cache_removed_when_zip_deleted(cache_manager, zip_path, metadata):
+    """Test metadata of a deleted ZIP is dropped, even when held in memory."""
+    cache_manager.cache_metadata(zip_path, metadata)
+    os.remove(zip_path)
+
+    assert cache_manager.get_cached_metadata(zip_path) is None
+    assert zip_path not in cache_manager.list_cached_zips()
+
+def test_partial_metadata_kept_until_load_finishes(cache_manager, zip_path, metadata):
+    """Test metadata saved by an unfinished load is used until the ZIP is cached."""
+    cache_manager.save_partial_metadata(zip_path, metadata['file_metadata'])
+
+    reloaded = CacheManager(cache_dir=cache_manager.cache_dir)
+    assert reloaded.get_partial_metadata(zip_path) == metadata['file_metadata']
+
+    reloaded.cache_metadata(zip_path, metadata)
+    assert reloaded.get_partial_metadata(zip_path) == {}
+
+def test_partial_metadata_dropped_when_zip_changes(cache_manager, zip_path, metadata):
+    """Test metadata saved by an unfinished load is not used for a modified ZIP."""
+    cache_manager.save_partial_metadata(zip_path, metadata['file_metadata'])
+    with open(zip_path, 'ab') as f:
+        f.write(b"more")
+
+    assert cache_manager.get_partial_metadata(zip_path) == {}
+
+def test_prefetch_uses_bounded_pool(cache_manager, tmp_path, metadata):
+    """Test prefetching many ZIPs loads them on the prefetch pool's threads only."""
+    import threading
+    zip_paths = []
+    for i in range(6):
+        path = tmp_path / f"pack{i}.zip"
+        path.write_bytes(bytes([i]))
+        cache_manager.cache_metadata(str(path), metadata)
+        zip_paths.append(str(path))
+
+    reloaded = CacheManager(cache_dir=cache_manager.cache_dir)
+    threads = set()
+    load = reloaded.get_cached_metadata
+    reloaded.get_cached_metadata = lambda zip_path: threads.add(threading.get_ident()) or load(zip_path)
+    for zip_path in zip_paths:
+        reloaded.prefetch_metadata(zip_path)
+    reloaded._prefetch_executor.shutdown(wait=True)
+
+    assert len(threads) <= CacheManager.PREFETCH_WORKERS
+    assert all(zip_path in reloaded._memory_cache for zip_path in zip_paths)
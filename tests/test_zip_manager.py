@@ -1,9 +1,12 @@
+import io
 import os
 import tempfile
+import wave
 import zipfile
 import pytest
 from pathlib import Path
 from src.audio_browser.zip.zip_manager import ZipManager
+from src.audio_browser.cache.cache_manager import CacheManager
 
 @pytest.fixture
 def temp_dir():
@@ -29,6 +32,26 @@ def sample_zip(temp_dir):
     
     return zip_path
 
+def wav_bytes(duration_ms, sample_rate=8000):
+    """Build a silent mono 16-bit WAV file of the given duration."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\0\0" * (sample_rate * duration_ms // 1000))
+    return buffer.getvalue()
+
+@pytest.fixture
+def wav_zip(temp_dir):
+    """Create a ZIP file with real WAV files of known durations."""
+    zip_path = os.path.join(temp_dir, "wavs.zip")
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for i in range(120):
+            zf.writestr(f"drums/kick{i}.wav", wav_bytes(10 * (i + 1)))
+        zf.writestr("drums/readme.txt", b"text content")
+    return zip_path
+
 @pytest.fixture
 def invalid_zip(temp_dir):
     """Create an invalid ZIP file."""
@@ -107,4 +130,353 @@ def test_stream_file(zip_manager, sample_zip):
     file_name = "audio1.wav"
     expected_content = b"fake wav content"
     chunks = list(zip_manager.stream_file(file_name))
-    assert b''.join(chunks) == expected_content 
\ No newline at end of file
+    assert b''.join(chunks) == expected_content
+
+def test_is_system_file():
+    """Test macOS metadata entries are recognized at any depth."""
+    assert ZipManager.is_system_file("._audio1.wav")
+    assert ZipManager.is_system_file("drums/._kick.wav")
+    assert ZipManager.is_system_file("__MACOSX/drums/kick.wav")
+    assert ZipManager.is_system_file("pack/__MACOSX/kick.wav")
+    
+    assert not ZipManager.is_system_file("drums/kick.wav")
+    assert not ZipManager.is_system_file("drums.__/kick.wav")
+    assert not ZipManager.is_system_file("__MACOSX_samples/kick.wav")
+
+def test_load_zip_reads_metadata_of_every_file(zip_manager, wav_zip, temp_dir):
+    """Test durations read on worker threads end up in the cache for every file."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    zip_manager.READ_DURATIONS_ON_LOAD = True
+    zip_manager.load_zip(wav_zip)
+    
+    metadata = zip_manager.cache_manager.get_cached_metadata(wav_zip)['file_metadata']
+    assert len(metadata) == 120
+    assert metadata["drums/kick0.wav"]['duration_ms'] == 10
+    assert metadata["drums/kick119.wav"]['duration_ms'] == 1200
+    assert metadata["drums/kick5.wav"]['size'] == 44 + 960
+
+def test_load_zip_continues_interrupted_load(zip_manager, wav_zip, temp_dir):
+    """Test metadata saved by an interrupted load is not read again."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    saved = {"drums/kick0.wav": {'size': 0, 'timestamp': None, 'duration_ms': 12345}}
+    zip_manager.cache_manager.save_partial_metadata(wav_zip, saved)
+    zip_manager.READ_DURATIONS_ON_LOAD = True
+    zip_manager.load_zip(wav_zip)
+    
+    metadata = zip_manager.cache_manager.get_cached_metadata(wav_zip)['file_metadata']
+    assert len(metadata) == 120
+    assert metadata["drums/kick0.wav"]['duration_ms'] == 12345
+    assert metadata["drums/kick1.wav"]['duration_ms'] == 20
+    assert zip_manager.cache_manager.get_partial_metadata(wav_zip) == {}
+
+def test_load_zip_leaves_durations_for_later(zip_manager, wav_zip, temp_dir):
+    """Test durations are not read on load by default but on request."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    zip_manager.load_zip(wav_zip)
+    
+    metadata = zip_manager.cache_manager.get_cached_metadata(wav_zip)['file_metadata']
+    assert len(metadata) == 120
+    assert metadata["drums/kick5.wav"]['size'] == 44 + 960
+    assert 'duration_ms' not in metadata["drums/kick5.wav"]
+    assert zip_manager.get_file_duration(wav_zip, "drums/kick5.wav") == 60
+
+def test_durations_read_on_many_threads_are_all_cached(zip_manager, wav_zip, temp_dir):
+    """Test durations read at once on several threads all reach the cache file."""
+    from concurrent.futures import ThreadPoolExecutor
+    cache_dir = os.path.join(temp_dir, "cache")
+    zip_manager.cache_manager = CacheManager(cache_dir=cache_dir)
+    zip_manager.cache_manager.MEMORY_CACHE_SIZE = 0  # Reload the cache on every lookup
+    file_names = zip_manager.list_audio_files(wav_zip)
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(zip_manager.get_file_duration, [wav_zip] * len(file_names), file_names))
+    zip_manager.close_zip(wav_zip)
+    
+    on_disk = CacheManager(cache_dir=cache_dir).get_cached_metadata(wav_zip)['file_metadata']
+    assert [on_disk[name].get('duration_ms') for name in file_names] == [
+        zip_manager.get_audio_duration(wav_zip, name) for name in file_names]
+
+def test_missing_file_raises_key_error(zip_manager, sample_zip, temp_dir):
+    """Test files are looked up by name without scanning the ZIP's name list."""
+    assert zip_manager.read_file(sample_zip, "audio1.wav") == b"fake wav content"
+    with pytest.raises(KeyError):
+        zip_manager.read_file(sample_zip, "missing.wav")
+    with pytest.raises(KeyError):
+        zip_manager.extract_file(sample_zip, "missing.wav", temp_dir)
+
+def test_metadata_updates_are_written_together(zip_manager, wav_zip, temp_dir):
+    """Test metadata read after loading is cached once the ZIP is closed."""
+    cache_dir = os.path.join(temp_dir, "cache")
+    zip_manager.cache_manager = CacheManager(cache_dir=cache_dir)
+    zip_manager.load_zip(wav_zip)
+    
+    for i in range(3):
+        metadata = zip_manager.get_full_audio_metadata(wav_zip, f"drums/kick{i}.wav")
+        assert metadata['sample_rate'] == 8000
+    on_disk = CacheManager(cache_dir=cache_dir).get_cached_metadata(wav_zip)['file_metadata']
+    assert 'full_metadata' not in on_disk["drums/kick0.wav"]
+    
+    zip_manager.close_zip(wav_zip)
+    on_disk = CacheManager(cache_dir=cache_dir).get_cached_metadata(wav_zip)['file_metadata']
+    assert [on_disk[f"drums/kick{i}.wav"]['full_metadata']['sample_rate'] for i in range(3)] == [8000] * 3
+
+def test_wav_duration_read_past_large_leading_chunk(zip_manager, temp_dir):
+    """Test WAV files whose header does not fit the first read still get a duration."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    wav = wav_bytes(2000)
+    # Move the sample data behind a chunk larger than the header probe
+    junk = b"JUNK" + (200 * 1024).to_bytes(4, 'little') + bytes(200 * 1024)
+    data_start = wav.index(b"data")
+    wav = wav[:data_start] + junk + wav[data_start:]
+    wav = wav[:4] + (len(wav) - 8).to_bytes(4, 'little') + wav[8:]
+    
+    zip_path = os.path.join(temp_dir, "junk.zip")
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        zf.writestr("junk.wav", wav)
+        zf.writestr("plain.wav", wav_bytes(5000, 44100))
+    
+    zip_manager.load_zip(zip_path)
+    assert zip_manager.get_audio_duration(zip_path, "junk.wav") == 2000
+    assert zip_manager.get_audio_duration(zip_path, "plain.wav") == 5000
+
+def test_is_audio_file():
+    """Test audio entries are recognized by extension like Path.suffix would."""
+    assert ZipManager.is_audio_file("kick.wav")
+    assert ZipManager.is_audio_file("drums/Kick.WAV")
+    assert ZipManager.is_audio_file("loops.v2/bass.mp3")
+    
+    assert not ZipManager.is_audio_file("drums/readme.txt")
+    assert not ZipManager.is_audio_file("drums.wav/readme")
+    assert not ZipManager.is_audio_file("drums/.wav")
+    assert not ZipManager.is_audio_file("drums.wav/")
+
+def test_audio_files_sorted_by_folder_then_name(zip_manager, temp_dir):
+    """Test audio files are listed folder by folder, ignoring case."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    zip_path = os.path.join(temp_dir, "unsorted.zip")
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        for name in ("synths/pad.wav", "Drums/snare.wav", "root.mp3", "drums/loops/Beat.ogg",
+                     "Drums/Kick.wav", "__MACOSX/Drums/._Kick.wav", "synths/notes.txt"):
+            zf.writestr(name, b"content")
+    
+    assert zip_manager.list_audio_files(zip_path) == [
+        "root.mp3", "Drums/Kick.wav", "Drums/snare.wav", "drums/loops/Beat.ogg", "synths/pad.wav"]
+
+def test_extract_files_in_parallel(zip_manager, temp_dir):
+    """Test a batch is extracted in order, later files replacing same-named ones."""
+    zip_path = os.path.join(temp_dir, "batch.zip")
+    names = [f"drums/hit{i}.wav" for i in range(20)] + ["synths/hit3.wav"]
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name in names:
+            zf.writestr(name, name.encode() * 1000)
+    output_dir = os.path.join(temp_dir, "out")
+    os.mkdir(output_dir)
+    
+    paths = zip_manager.extract_files(zip_path, names, output_dir)
+    
+    assert paths == [os.path.join(output_dir, os.path.basename(name)) for name in names]
+    with open(paths[0], 'rb') as f:
+        assert f.read() == b"drums/hit0.wav" * 1000
+    with open(paths[3], 'rb') as f:
+        assert f.read() == b"synths/hit3.wav" * 1000
+    with pytest.raises(KeyError):
+        zip_manager.extract_files(zip_path, ["drums/hit1.wav", "missing.wav"], output_dir)
+
+def test_stream_file_into(zip_manager, sample_zip):
+    """Test a file is written into a caller supplied buffer."""
+    buffer = io.BytesIO()
+    assert zip_manager.stream_file_into(sample_zip, "audio2.mp3", buffer, chunk_size=4) == 16
+    assert buffer.getvalue() == b"fake mp3 content"
+    assert b"".join(zip_manager.stream_file(sample_zip, "audio2.mp3")) == b"fake mp3 content"
+
+def test_load_zip_reuses_open_handle(zip_manager, wav_zip, temp_dir):
+    """Test a ZIP opened before loading is loaded and cached through the same handle."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    zip_manager.read_file(wav_zip, "drums/kick0.wav")
+    handle = zip_manager.open_zips[wav_zip]
+    
+    timing_info = zip_manager.load_zip(wav_zip)
+    
+    assert not timing_info['used_cache']
+    assert zip_manager.open_zips[wav_zip] is handle
+    assert len(zip_manager.cache_manager.get_cached_metadata(wav_zip)['audio_files']) == 120
+
+def test_load_zip_without_audio_files(zip_manager, temp_dir):
+    """Test a ZIP without audio files is rejected and not kept open."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    zip_path = os.path.join(temp_dir, "text.zip")
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        zf.writestr("readme.txt", b"text content")
+        zf.writestr("__MACOSX/._kick.wav", b"resource fork")
+    
+    with pytest.raises(ValueError):
+        zip_manager.load_zip(zip_path)
+    assert zip_path not in zip_manager.get_open_zips()
+
+def test_zip_read_through_memory_map(zip_manager, sample_zip, temp_dir):
+    """Test ZIPs are read through a memory map, falling back for empty files."""
+    assert zip_manager.read_file(sample_zip, "audio3.ogg") == b"fake ogg content"
+    assert zip_manager.open_zips[sample_zip].filename == sample_zip
+    assert not isinstance(zip_manager.open_zips[sample_zip].fp, io.IOBase)
+    
+    empty_zip = os.path.join(temp_dir, "empty.zip")
+    open(empty_zip, 'wb').close()
+    with pytest.raises(ValueError):
+        zip_manager.read_file(empty_zip, "audio1.wav")
+
+def test_open_zips_limited_to_recently_used(zip_manager, temp_dir):
+    """Test only the most recently used ZIPs keep a handle open."""
+    zip_manager.MAX_OPEN_ZIPS = 2
+    zip_paths = []
+    for i in range(3):
+        zip_path = os.path.join(temp_dir, f"pack{i}.zip")
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("kick.wav", f"kick {i}".encode())
+        zip_paths.append(zip_path)
+    
+    for zip_path in zip_paths[:2]:
+        zip_manager.read_file(zip_path, "kick.wav")
+    zip_manager.read_file(zip_paths[0], "kick.wav")
+    zip_manager.read_file(zip_paths[2], "kick.wav")
+    
+    assert list(zip_manager.open_zips) == [zip_paths[0], zip_paths[2]]
+    assert zip_manager.get_open_zips() == zip_paths
+    assert zip_manager.read_file(zip_paths[1], "kick.wav") == b"kick 1"
+    
+    assert zip_manager.evict_lru() == zip_paths[2]
+    zip_manager.close_zip(zip_paths[0])
+    assert zip_manager.get_open_zips() == zip_paths[1:]
+
+def test_progress_updates_throttled(zip_manager):
+    """Test intermediate progress is reported at most every PROGRESS_INTERVAL seconds."""
+    updates = []
+    zip_manager.set_progress_callback(lambda status, progress: updates.append(progress))
+    zip_manager.PROGRESS_INTERVAL = 60
+    for progress in (0, 10, 20, 30, 100):
+        zip_manager._update_progress("Loading...", progress)
+    
+    assert updates == [0, 100]
+
+def test_duration_of_uncached_zip_reports_no_progress(zip_manager, wav_zip, temp_dir):
+    """Test a duration read for a ZIP without cache lists its files without reporting load progress."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    updates = []
+    zip_manager.set_progress_callback(lambda status, progress: updates.append(status))
+    
+    assert zip_manager.get_file_duration(wav_zip, "drums/kick5.wav") == 60
+    assert updates == []
+    cached = zip_manager.cache_manager.get_cached_metadata(wav_zip)
+    assert len(cached['audio_files']) == 120
+    assert cached['file_metadata']["drums/kick5.wav"]['duration_ms'] == 60
+
+def test_wav_duration_parsed_from_header():
+    """Test WAV durations are computed from the RIFF header like mutagen does."""
+    import mutagen
+    assert ZipManager._parse_wav_duration(wav_bytes(250)[:64]) == 250
+    data = wav_bytes(250, sample_rate=22050)
+    assert ZipManager._parse_wav_duration(data[:64]) == int(mutagen.File(io.BytesIO(data)).info.length * 1000)
+    assert ZipManager._parse_wav_duration(b"RF64" + data[4:64]) is None
+    assert ZipManager._parse_wav_duration(data[:30]) is None
+
+def test_cbr_mp3_duration_uses_whole_file_size(zip_manager, temp_dir):
+    """Test constant bitrate MP3 durations cover the whole file, not just the header read."""
+    # 128 kbit/s MPEG 1 layer 3 frames at 44.1 kHz, 417 bytes each
+    frames = (b"\xff\xfb\x90\x00" + b"\0" * 413) * 3000
+    zip_path = os.path.join(temp_dir, "mp3.zip")
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("loop.mp3", frames)
+    
+    assert ZipManager._parse_mp3_duration(frames[:4096], len(frames)) == int(8 * len(frames) / 128000 * 1000)
+    assert zip_manager.get_audio_duration(zip_path, "loop.mp3") == 78187
+
+def ogg_vorbis_bytes(seconds, sample_rate=44100):
+    """Build a minimal Ogg Vorbis stream whose last page ends at the given time."""
+    import struct
+    from mutagen.ogg import OggPage
+    def page(packets, position, sequence):
+        ogg_page = OggPage()
+        ogg_page.packets, ogg_page.position = packets, position
+        ogg_page.serial, ogg_page.sequence = 1234, sequence
+        ogg_page.first, ogg_page.last = sequence == 0, sequence == seconds + 1
+        return ogg_page.write()
+    identification = b"\x01vorbis" + struct.pack('<IBIiii', 0, 2, sample_rate, 0, 128000, 0) + b"\xb8\x01"
+    comment = b"\x03vorbis" + struct.pack('<I', 0) + struct.pack('<I', 0) + b"\x01"
+    pages = [page([identification], 0, 0), page([comment, b"\x05vorbis"], 0, 1)]
+    pages += [page([b"\0" * 3000], sample_rate * i, i + 1) for i in range(1, seconds + 1)]
+    return b"".join(pages)
+
+def test_ogg_duration_read_from_last_page(zip_manager, temp_dir):
+    """Test stored Ogg files get their duration from the last page like compressed ones."""
+    zip_path = os.path.join(temp_dir, "ogg.zip")
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        zf.writestr("stored.ogg", ogg_vorbis_bytes(5), zipfile.ZIP_STORED)
+        zf.writestr("deflated.ogg", ogg_vorbis_bytes(5), zipfile.ZIP_DEFLATED)
+    
+    assert zip_manager.get_audio_duration(zip_path, "stored.ogg") == 5000
+    assert zip_manager.get_audio_duration(zip_path, "deflated.ogg") == 5000
+
+def test_get_durations(zip_manager, wav_zip, temp_dir):
+    """Test durations of several files are read on worker threads."""
+    zip_manager.cache_manager = CacheManager(cache_dir=os.path.join(temp_dir, "cache"))
+    names = [f"drums/kick{i}.wav" for i in range(0, 120, 7)]
+    
+    durations = zip_manager.get_durations(wav_zip, names, max_workers=4)
+    
+    assert durations == {name: 10 * (int(name[10:-4]) + 1) for name in names}
+    cached = zip_manager.cache_manager.get_cached_metadata(wav_zip)['file_metadata']
+    assert {name: cached[name]['duration_ms'] for name in names} == durations
+    with pytest.raises(KeyError):
+        zip_manager.get_durations(wav_zip, ["missing.wav"])
+
+def test_stored_durations_read_without_entry_reader(zip_manager, temp_dir, monkeypatch):
+    """Test stored WAV and MP3 durations are parsed from bytes read straight from the ZIP."""
+    zip_path = os.path.join(temp_dir, "stored.zip")
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zf:
+        zf.writestr("kick.wav", wav_bytes(300))
+        zf.writestr("loop.mp3", (b"\xff\xfb\x90\x00" + b"\0" * 413) * 100)
+    zip_file = zip_manager._ensure_zip_open(zip_path)
+    monkeypatch.setattr(zip_file, "open", None)
+    
+    assert zip_manager.get_audio_duration(zip_path, "kick.wav") == 300
+    assert zip_manager.get_audio_duration(zip_path, "loop.mp3") == int(8 * 41700 / 128000 * 1000)
+
+def test_stored_data_not_read_for_mismatched_local_header(zip_manager, temp_dir):
+    """Test stored data is only read when the local header names the file, as ZipFile.open checks."""
+    zip_path = os.path.join(temp_dir, "renamed.zip")
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zf:
+        zf.writestr("kick.wav", wav_bytes(300))
+    with open(zip_path, 'r+b') as f:
+        f.seek(30)
+        f.write(b"kock")
+    zip_file = zip_manager._ensure_zip_open(zip_path)
+    zip_info = zip_file.getinfo("kick.wav")
+    
+    assert zip_manager._read_stored_data(zip_file, zip_info, [(0, 44)]) is None
+    with pytest.raises(zipfile.BadZipFile):
+        zip_file.open(zip_info)
+
+def test_layer1_mp3_duration_parsed_from_header(zip_manager, temp_dir, monkeypatch):
+    """Test MPEG layer 1 frames are measured in 4 byte slots so consecutive frames are found."""
+    # MPEG-1 layer 1, 256 kbit/s, 44100 Hz: (12 * 256000 // 44100) * 4 = 276 bytes
+    frame = b"\xff\xff\x80\x00" + b"\0" * 272
+    assert ZipManager._parse_mp3_frame_header(frame, 0)[:2] == (256000, 276)
+    
+    zip_path = os.path.join(temp_dir, "layer1.zip")
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zf:
+        zf.writestr("layer1.mp3", frame * 100)
+    zip_file = zip_manager._ensure_zip_open(zip_path)
+    monkeypatch.setattr(zip_file, "open", None)
+    
+    assert zip_manager.get_audio_duration(zip_path, "layer1.mp3") == int(8 * 27600 / 256000 * 1000)
+
+def test_vbr_mp3_duration_read_with_mutagen(zip_manager, temp_dir):
+    """Test MP3 files with a Xing header get their length from its frame count."""
+    import struct
+    frame = b"\xff\xfb\x90\x00" + b"\0" * 413
+    xing_frame = frame[:36] + b"Xing" + struct.pack('>II', 1, 1000) + frame[48:]
+    id3_tag = b"ID3\x03\x00\x00\x00\x00\x08\x00" + b"\0" * 1024
+    zip_path = os.path.join(temp_dir, "vbr.zip")
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("vbr.mp3", id3_tag + xing_frame + frame * 20)
+    
+    assert zip_manager.get_audio_duration(zip_path, "vbr.mp3") == int(1000 * 1152 / 44100 * 1000)